@@ -4,12 +4,33 @@ Run with: uv run python chat_demo.py
 
 This starts the web server on http://localhost:8080 where you can
 interact with Tata through a browser-based chat interface.
+
+Set TATA_PROD=1 to run under gunicorn with uvicorn workers instead
+(requires the "prod" extra).
 """
 
 import argparse
+import os
 import sys
+from pathlib import Path
+
+from src.tata.web.server import ChatServer, PortInUseError, check_port_available
 
-from src.tata.web.server import ChatServer, PortInUseError
+GUNICORN_CONF = Path(__file__).parent / "src" / "tata" / "web" / "gunicorn_conf.py"
+
+
+def run_production(port: int) -> None:
+    """Replace this process with gunicorn serving the chat app.
+    
+    The port is checked here, once, rather than in each worker.
+    """
+    check_port_available(port, host="0.0.0.0")
+    os.execvp("gunicorn", [
+        "gunicorn",
+        "-c", str(GUNICORN_CONF),
+        "--bind", f"0.0.0.0:{port}",
+        "src.tata.web.server:create_app()",
+    ])
 
 
 def main():
@@ -23,13 +44,21 @@ def main():
         default=8080,
         help="Port to run the server on (default: 8080)"
     )
+    parser.add_argument(
+        "--ephemeral-memory",
+        action="store_true",
+        help="Keep generated artifacts in memory only (lost on restart)"
+    )
     args = parser.parse_args()
     
     print("🚀 Starting Tata Web Chat Interface")
     print("=" * 50)
     
     try:
-        server = ChatServer(port=args.port)
+        if os.environ.get("TATA_PROD") == "1":
+            run_production(args.port)
+        
+        server = ChatServer(port=args.port, ephemeral_memory=args.ephemeral_memory)
         print(f"\n✅ Server starting on http://localhost:{args.port}")
         print("\nOpen your browser and navigate to the URL above.")
         print("Press Ctrl+C to stop the server.\n")
@@ -0,0 +1,63 @@
+"""Minify the chat interface assets with esbuild.
+
+Run with: uv run python scripts/build_frontend.py
+
+Writes app.min.js and styles.min.css next to their sources in
+src/tata/web/static. The server links the minified files whenever they
+exist, so run this before deploying and again after editing the sources.
+Requires Node.js; esbuild is fetched through npx if not installed.
+"""
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+
+STATIC_DIR = Path(__file__).resolve().parent.parent / "src" / "tata" / "web" / "static"
+ASSETS = {
+    "app.js": "app.min.js",
+    "styles.css": "styles.min.css",
+}
+
+
+def esbuild_command() -> list[str]:
+    """Return the command that runs esbuild."""
+    if shutil.which("esbuild"):
+        return ["esbuild"]
+    if shutil.which("npx"):
+        return ["npx", "--yes", "esbuild"]
+    raise RuntimeError("esbuild not found; install Node.js or esbuild first")
+
+
+def main() -> int:
+    """Minify each asset and report the size reduction."""
+    try:
+        command = esbuild_command()
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 1
+    
+    for source, target in ASSETS.items():
+        source_path = STATIC_DIR / source
+        target_path = STATIC_DIR / target
+        result = subprocess.run([
+            *command,
+            str(source_path),
+            "--minify",
+            "--target=es2018",
+            f"--outfile={target_path}",
+            "--log-level=warning",
+        ])
+        if result.returncode != 0:
+            print(f"❌ esbuild failed for {source}")
+            return result.returncode
+        before = source_path.stat().st_size
+        after = target_path.stat().st_size
+        print(f"✅ {source} -> {target}: {before:,} -> {after:,} bytes")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,11 +17,12 @@ Requirements covered:
 """
 
 import logging
-from typing import Optional
+from typing import Iterator, List, Optional
 
 from src.tata.agent.client import OpenAIClient, OpenAIAPIError
 from src.tata.agent.conversation import ConversationManager
 from src.tata.agent.executor import ToolExecutor
+from src.tata.agent.models import ChatCompletionResponse, ToolCall
 from src.tata.agent.registry import ToolRegistry
 
 
@@ -40,6 +41,8 @@ class TataAgent:
         _registry: Tool registry for available tools
         _executor: Tool executor for running Tata processors
         _conversation: Conversation manager for message history
+        _tools: Tools payload in OpenAI format, built once so every
+            request shares a byte-identical, cacheable prompt prefix
     """
     
     def __init__(
@@ -61,6 +64,7 @@ class TataAgent:
         self._registry = tool_registry
         self._executor = tool_executor
         self._conversation = conversation_manager
+        self._tools = self._registry.get_openai_tools()
     
     def chat(self, user_message: str) -> str:
         """Process a user message and return response.
@@ -80,8 +84,7 @@ class TataAgent:
         # Add user message to history (Requirement 4.6)
         self._conversation.add_user_message(user_message)
         
-        # Get available tools in OpenAI format
-        tools = self._registry.get_openai_tools()
+        tools = self._tools
         
         try:
             # Call OpenAI (Requirement 4.1)
@@ -100,29 +103,7 @@ class TataAgent:
         
         # Handle tool calls if any (Requirement 4.3, 4.5)
         while response.tool_calls:
-            # Store assistant's tool call message
-            self._conversation.add_assistant_tool_calls(response.tool_calls)
-            
-            # Execute each tool
-            for tool_call in response.tool_calls:
-                result = self._executor.execute(tool_call)
-                
-                # Format result content
-                if result.success:
-                    result_content = result.result or "{}"
-                else:
-                    # Format error message (Requirements 6.2, 6.3, 6.4)
-                    result_content = f"Error: {result.error}"
-                    logger.warning(
-                        f"Tool execution failed: {tool_call.name} - {result.error}"
-                    )
-                
-                # Add result to conversation (Requirement 4.4)
-                self._conversation.add_tool_result(
-                    tool_call_id=tool_call.id,
-                    name=tool_call.name,
-                    result=result_content,
-                )
+            self._run_tool_calls(response.tool_calls)
             
             # Get next response from OpenAI
             try:
@@ -149,6 +130,101 @@ class TataAgent:
         self._conversation.add_assistant_message(fallback_message)
         return fallback_message
     
+    def chat_stream(self, user_message: str) -> Iterator[str]:
+        """Process a user message and stream the response text.
+        
+        Runs the same conversation loop as chat(), but yields the final
+        response text in pieces as OpenAI produces it. Tool rounds are
+        executed between streamed calls and produce no output.
+        
+        If the generator is closed before the reply is finished, the text
+        streamed so far is recorded as the assistant's reply.
+        
+        Args:
+            user_message: The user's input message
+            
+        Yields:
+            Fragments of the natural language response
+        """
+        self._conversation.add_user_message(user_message)
+        tools = self._tools
+        
+        while True:
+            response: Optional[ChatCompletionResponse] = None
+            streamed: List[str] = []
+            stream = self._client.chat_completion_stream(
+                messages=self._conversation.get_messages(),
+                tools=tools,
+            )
+            try:
+                for item in stream:
+                    if isinstance(item, ChatCompletionResponse):
+                        response = item
+                    else:
+                        streamed.append(item)
+                        yield item
+            except GeneratorExit:
+                # The reader stopped mid-reply: end the request now and
+                # record what was sent, so the turn is not left half-written
+                close = getattr(stream, "close", None)
+                if close is not None:
+                    close()
+                if streamed:
+                    self._conversation.add_assistant_message("".join(streamed))
+                raise
+            except OpenAIAPIError as e:
+                logger.error(f"OpenAI API error while streaming: {e.message}", exc_info=True)
+                yield self._format_api_error()
+                return
+            except Exception as e:
+                logger.error(f"Unexpected error while streaming: {e}", exc_info=True)
+                yield self._format_api_error()
+                return
+            
+            if response is None or not response.tool_calls:
+                break
+            self._run_tool_calls(response.tool_calls)
+        
+        if response is not None and response.content:
+            self._conversation.add_assistant_message(response.content)
+            return
+        
+        fallback_message = (
+            "I apologize, but I couldn't generate a response. Please try again."
+        )
+        self._conversation.add_assistant_message(fallback_message)
+        yield fallback_message
+    
+    def _run_tool_calls(self, tool_calls: List[ToolCall]) -> None:
+        """Execute a round of tool calls and record the results.
+        
+        Args:
+            tool_calls: Tool calls requested by OpenAI
+        """
+        # Store assistant's tool call message
+        self._conversation.add_assistant_tool_calls(tool_calls)
+        
+        # Execute each tool
+        for tool_call in tool_calls:
+            result = self._executor.execute(tool_call)
+            
+            # Format result content
+            if result.success:
+                result_content = result.result or "{}"
+            else:
+                # Format error message (Requirements 6.2, 6.3, 6.4)
+                result_content = f"Error: {result.error}"
+                logger.warning(
+                    f"Tool execution failed: {tool_call.name} - {result.error}"
+                )
+            
+            # Add result to conversation (Requirement 4.4)
+            self._conversation.add_tool_result(
+                tool_call_id=tool_call.id,
+                name=tool_call.name,
+                result=result_content,
+            )
+    
     def clear_conversation(self) -> None:
         """Clear the conversation history.
         
@@ -14,7 +14,8 @@ Requirements covered:
 
 import os
 import threading
-from typing import Any, Dict, List, Optional, Protocol, Tuple
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, List, Optional, Protocol, Tuple, Union
 
 from openai import OpenAI
 
@@ -70,6 +71,26 @@ class OpenAIClient(Protocol):
             OpenAIAPIError: If API call fails
         """
         ...
+    
+    def chat_completion_stream(
+        self,
+        messages: List[Message],
+        tools: Optional[List[Dict[str, Any]]] = None,
+    ) -> Iterator[Union[str, ChatCompletionResponse]]:
+        """Send chat completion request and stream the reply.
+        
+        Args:
+            messages: Conversation history as Message objects
+            tools: Available tools in OpenAI format (optional)
+            
+        Yields:
+            Text deltas as they arrive, then one ChatCompletionResponse
+            with the full content or tool calls
+            
+        Raises:
+            OpenAIAPIError: If API call fails
+        """
+        ...
 
 
 class RealOpenAIClient:
@@ -86,7 +107,9 @@ class RealOpenAIClient:
         self,
         model: str = "gpt-4o",
         api_key: Optional[str] = None,
-        timeout: float = 30.0
+        timeout: float = 30.0,
+        max_retries: int = 5,
+        max_concurrent_requests: int = 16,
     ):
         """Initialize the OpenAI client.
         
@@ -94,6 +117,10 @@ class RealOpenAIClient:
             model: OpenAI model name (default: gpt-4o)
             api_key: OpenAI API key. If None, reads from OPENAI_API_KEY env var
             timeout: Request timeout in seconds (default: 30.0)
+            max_retries: Retries for rate-limited (429) and 5xx responses.
+                The SDK backs off exponentially and honours retry-after.
+            max_concurrent_requests: Requests allowed in flight at once
+                across all sessions sharing this client (default: 16)
             
         Raises:
             ValueError: If no API key is provided or found in environment
@@ -107,8 +134,14 @@ class RealOpenAIClient:
                 "OpenAI API key must be provided or set in OPENAI_API_KEY environment variable"
             )
         
-        self._client = OpenAI(api_key=self._api_key, timeout=timeout)
-        self._lock = threading.Lock()
+        # The SDK client is thread-safe and pools connections, so one
+        # instance can serve concurrent requests from many agents
+        self._client = OpenAI(
+            api_key=self._api_key, timeout=timeout, max_retries=max_retries
+        )
+        # Caps in-flight requests so a burst of sessions queues here
+        # instead of tripping the account's rate limit
+        self._request_slots = threading.BoundedSemaphore(max_concurrent_requests)
     
     def chat_completion(
         self,
@@ -128,7 +161,7 @@ class RealOpenAIClient:
             OpenAIAPIError: If API call fails
         """
         try:
-            with self._lock:
+            with self._request_slots:
                 response = self._client.chat.completions.create(
                     model=self._model,
                     messages=[m.to_openai_format() for m in messages],
@@ -163,6 +196,87 @@ class RealOpenAIClient:
             if hasattr(e, 'status_code'):
                 status_code = e.status_code
             raise OpenAIAPIError(f"OpenAI API call failed: {e}", status_code) from e
+    
+    def chat_completion_stream(
+        self,
+        messages: List[Message],
+        tools: Optional[List[Dict[str, Any]]] = None,
+    ) -> Iterator[Union[str, ChatCompletionResponse]]:
+        """Send chat completion request to OpenAI and stream the reply.
+        
+        Tool call fragments are accumulated by index and returned in the
+        final response rather than yielded.
+        
+        Args:
+            messages: Conversation history as Message objects
+            tools: Available tools in OpenAI format (optional)
+            
+        Yields:
+            Text deltas as they arrive, then one ChatCompletionResponse
+            with the full content or tool calls
+            
+        Raises:
+            OpenAIAPIError: If API call fails
+        """
+        content_parts: List[str] = []
+        calls: Dict[int, Dict[str, str]] = {}
+        finish_reason = "stop"
+        
+        try:
+            # Released in finally, so a reader that stops early and closes
+            # this generator frees the slot at once, not on garbage collection
+            self._request_slots.acquire()
+            try:
+                stream = self._client.chat.completions.create(
+                    model=self._model,
+                    messages=[m.to_openai_format() for m in messages],
+                    tools=tools if tools else None,
+                    tool_choice="auto" if tools else None,
+                    stream=True,
+                )
+                
+                # Closing the stream returns its HTTP connection to the pool
+                with stream:
+                    for chunk in stream:
+                        if not chunk.choices:
+                            continue
+                        choice = chunk.choices[0]
+                        delta = choice.delta
+                        
+                        if delta.content:
+                            content_parts.append(delta.content)
+                            yield delta.content
+                        
+                        for tc in delta.tool_calls or ():
+                            call = calls.setdefault(tc.index, {"id": "", "name": "", "arguments": ""})
+                            if tc.id:
+                                call["id"] = tc.id
+                            if tc.function is not None:
+                                if tc.function.name:
+                                    call["name"] = tc.function.name
+                                if tc.function.arguments:
+                                    call["arguments"] += tc.function.arguments
+                        
+                        if choice.finish_reason:
+                            finish_reason = choice.finish_reason
+            finally:
+                self._request_slots.release()
+                    
+        except Exception as e:
+            status_code = None
+            if hasattr(e, 'status_code'):
+                status_code = e.status_code
+            raise OpenAIAPIError(f"OpenAI API call failed: {e}", status_code) from e
+        
+        yield ChatCompletionResponse(
+            content="".join(content_parts) or None,
+            tool_calls=[ToolCall(**calls[i]) for i in sorted(calls)] or None,
+            finish_reason=finish_reason,
+        )
+    
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._client.close()
 
 
 class MockOpenAIClient:
@@ -176,7 +290,7 @@ class MockOpenAIClient:
     
     def __init__(self):
         """Initialize mock client with empty response queue."""
-        self._responses: List[ChatCompletionResponse] = []
+        self._responses: Deque[ChatCompletionResponse] = deque()
         self._call_history: List[Tuple[List[Message], Optional[List[Dict[str, Any]]]]] = []
         self._lock = threading.Lock()
     
@@ -188,7 +302,7 @@ class MockOpenAIClient:
                       Responses are consumed in order (FIFO).
         """
         with self._lock:
-            self._responses = list(responses)
+            self._responses = deque(responses)
     
     def add_response(self, response: ChatCompletionResponse) -> None:
         """Add a single response to the queue.
@@ -236,10 +350,31 @@ class MockOpenAIClient:
             
             # Return next response or default
             if self._responses:
-                return self._responses.pop(0)
+                return self._responses.popleft()
             
             return ChatCompletionResponse(
                 content="Mock response",
                 tool_calls=None,
                 finish_reason="stop"
             )
+    
+    def chat_completion_stream(
+        self,
+        messages: List[Message],
+        tools: Optional[List[Dict[str, Any]]] = None,
+    ) -> Iterator[Union[str, ChatCompletionResponse]]:
+        """Stream the next configured response.
+        
+        Yields the response content as a single delta, then the response.
+        
+        Args:
+            messages: Conversation history (recorded in history)
+            tools: Available tools (recorded in history)
+            
+        Yields:
+            The content text if any, then the ChatCompletionResponse
+        """
+        response = self.chat_completion(messages, tools)
+        if response.content:
+            yield response.content
+        yield response
@@ -132,12 +132,10 @@ Never invent requirements or qualifications not provided by the recruiter."""
         Args:
             content: The user's message text
         """
-        with self._lock:
-            self._messages.append(Message(
-                role=MessageRole.USER,
-                content=content
-            ))
-            self._truncate_if_needed()
+        self._append(Message(
+            role=MessageRole.USER,
+            content=content
+        ))
     
     def add_assistant_message(self, content: str) -> None:
         """Add an assistant text response.
@@ -145,12 +143,10 @@ Never invent requirements or qualifications not provided by the recruiter."""
         Args:
             content: The assistant's response text
         """
-        with self._lock:
-            self._messages.append(Message(
-                role=MessageRole.ASSISTANT,
-                content=content
-            ))
-            self._truncate_if_needed()
+        self._append(Message(
+            role=MessageRole.ASSISTANT,
+            content=content
+        ))
     
     def add_assistant_tool_calls(self, tool_calls: List[ToolCall]) -> None:
         """Add an assistant message with tool calls.
@@ -158,13 +154,11 @@ Never invent requirements or qualifications not provided by the recruiter."""
         Args:
             tool_calls: List of tool calls from OpenAI
         """
-        with self._lock:
-            self._messages.append(Message(
-                role=MessageRole.ASSISTANT,
-                content=None,
-                tool_calls=tool_calls
-            ))
-            self._truncate_if_needed()
+        self._append(Message(
+            role=MessageRole.ASSISTANT,
+            content=None,
+            tool_calls=tool_calls
+        ))
     
     def add_tool_result(self, tool_call_id: str, name: str, result: str) -> None:
         """Add a tool execution result.
@@ -174,14 +168,12 @@ Never invent requirements or qualifications not provided by the recruiter."""
             name: Name of the tool that was called
             result: JSON string result from tool execution
         """
-        with self._lock:
-            self._messages.append(Message(
-                role=MessageRole.TOOL,
-                content=result,
-                tool_call_id=tool_call_id,
-                name=name
-            ))
-            self._truncate_if_needed()
+        self._append(Message(
+            role=MessageRole.TOOL,
+            content=result,
+            tool_call_id=tool_call_id,
+            name=name
+        ))
     
     def clear(self) -> None:
         """Clear conversation history (keeps system prompt)."""
@@ -189,13 +181,28 @@ Never invent requirements or qualifications not provided by the recruiter."""
             self._messages = []
             self._init_system_prompt()
     
+    def _append(self, message: Message) -> None:
+        """Append a message and truncate the history if needed.
+        
+        Args:
+            message: The message to add
+        """
+        with self._lock:
+            self._messages.append(message)
+            self._truncate_if_needed()
+    
     def _truncate_if_needed(self) -> None:
         """Truncate older messages if limit exceeded.
         
         Preserves the system prompt (first message) and removes
-        oldest non-system messages until within limit.
+        oldest non-system messages until within limit. Tool results
+        left at the front of the window are removed as well, since
+        OpenAI rejects a tool message whose tool call was truncated.
         """
         # +1 accounts for the system prompt which doesn't count toward limit
-        while len(self._messages) > self._max_messages + 1:
-            # Remove the second message (first after system prompt)
-            del self._messages[1]
+        end = 1 + max(0, len(self._messages) - self._max_messages - 1)
+        if end == 1:
+            return
+        while end < len(self._messages) and self._messages[end].role == MessageRole.TOOL:
+            end += 1
+        del self._messages[1:end]
@@ -104,7 +104,7 @@ class ToolExecutor:
         
         # 3. Parse arguments (Requirement 3.1)
         try:
-            args = tool_call.parse_arguments()
+            args = tool_call.parsed_arguments
         except json.JSONDecodeError as e:
             return ToolExecutionResult(
                 success=False,
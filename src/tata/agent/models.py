@@ -29,12 +29,14 @@ class MessageRole(Enum):
     TOOL = "tool"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolCall:
     """A tool call from OpenAI.
     
     Represents a function call request from the OpenAI API,
     containing the function name and JSON-encoded arguments.
+    Instances are immutable so the OpenAI dict and the parsed
+    arguments can be built once and kept in private slots.
     
     Attributes:
         id: Unique identifier for this call
@@ -44,40 +46,64 @@ class ToolCall:
     id: str
     name: str
     arguments: str  # JSON string
+    _openai_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _parsed_arguments: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary format for OpenAI API.
         
         Returns:
-            Dictionary in OpenAI tool_calls format
+            Dictionary in OpenAI tool_calls format. The dictionary is
+            cached on the instance and must not be mutated.
         """
-        return {
-            "id": self.id,
-            "type": "function",
-            "function": {
-                "name": self.name,
-                "arguments": self.arguments
-            }
-        }
+        if self._openai_dict is None:
+            object.__setattr__(self, "_openai_dict", {
+                "id": self.id,
+                "type": "function",
+                "function": {
+                    "name": self.name,
+                    "arguments": self.arguments
+                }
+            })
+        return self._openai_dict
+    
+    @property
+    def parsed_arguments(self) -> Dict[str, Any]:
+        """Arguments JSON parsed to a dictionary, decoded once per call.
+        
+        The dictionary is cached on the instance and must not be mutated.
+        
+        Raises:
+            json.JSONDecodeError: If arguments is not valid JSON
+        """
+        if self._parsed_arguments is None:
+            object.__setattr__(self, "_parsed_arguments", json.loads(self.arguments))
+        return self._parsed_arguments
     
     def parse_arguments(self) -> Dict[str, Any]:
         """Parse arguments JSON to dictionary.
         
         Returns:
-            Dictionary of parsed arguments
+            Dictionary of parsed arguments (see parsed_arguments)
             
         Raises:
             json.JSONDecodeError: If arguments is not valid JSON
         """
-        return json.loads(self.arguments)
+        return self.parsed_arguments
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Message:
     """A conversation message.
     
     Represents a message in an OpenAI conversation, supporting all
     message types: system, user, assistant, and tool responses.
+    Messages are immutable once added to a conversation, so the OpenAI
+    dict is built once and reused for every request that replays them.
     
     Attributes:
         role: The message role (system, user, assistant, tool)
@@ -91,13 +117,23 @@ class Message:
     tool_calls: Optional[List[ToolCall]] = None
     tool_call_id: Optional[str] = None
     name: Optional[str] = None
+    _openai_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def to_openai_format(self) -> Dict[str, Any]:
         """Convert to OpenAI message format.
         
         Returns:
-            Dictionary in OpenAI messages array format
+            Dictionary in OpenAI messages array format. The dictionary is
+            cached on the instance and must not be mutated.
         """
+        if self._openai_dict is None:
+            object.__setattr__(self, "_openai_dict", self._build_openai_dict())
+        return self._openai_dict
+    
+    def _build_openai_dict(self) -> Dict[str, Any]:
+        """Build the OpenAI messages entry for this message."""
         msg: Dict[str, Any] = {"role": self.role.value}
         
         if self.content is not None:
@@ -151,12 +187,13 @@ class Message:
 
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolDefinition:
     """OpenAI function calling tool definition.
     
     Represents a tool that can be called by OpenAI, mapping to
-    a Tata module processor.
+    a Tata module processor. Instances are immutable so the OpenAI
+    dict can be built once.
     
     Attributes:
         name: Function name (snake_case, matches processor)
@@ -168,24 +205,30 @@ class ToolDefinition:
     description: str
     parameters: Dict[str, Any]  # JSON Schema
     module_type: ModuleType
+    _openai_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def to_openai_format(self) -> Dict[str, Any]:
         """Convert to OpenAI tools array format.
         
         Returns:
-            Dictionary in OpenAI function calling format
+            Dictionary in OpenAI function calling format. The dictionary
+            is cached on the instance and must not be mutated.
         """
-        return {
-            "type": "function",
-            "function": {
-                "name": self.name,
-                "description": self.description,
-                "parameters": self.parameters
-            }
-        }
+        if self._openai_dict is None:
+            object.__setattr__(self, "_openai_dict", {
+                "type": "function",
+                "function": {
+                    "name": self.name,
+                    "description": self.description,
+                    "parameters": self.parameters
+                }
+            })
+        return self._openai_dict
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ChatCompletionResponse:
     """Response from OpenAI chat completion.
     
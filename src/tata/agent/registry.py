@@ -386,11 +386,13 @@ class InMemoryToolRegistry:
     
     Attributes:
         _tools: Dictionary mapping tool names to ToolDefinition objects
+        _openai_tools: Tools in OpenAI format, rebuilt on registration
     """
     
     def __init__(self) -> None:
         """Initialize the registry with all Tata module tools."""
         self._tools: Dict[str, ToolDefinition] = {}
+        self._openai_tools: List[Dict[str, Any]] = []
         self._register_default_tools()
     
     def _register_default_tools(self) -> None:
@@ -544,6 +546,7 @@ class InMemoryToolRegistry:
             tool: The ToolDefinition to register
         """
         self._tools[tool.name] = tool
+        self._openai_tools = [t.to_openai_format() for t in self._tools.values()]
     
     def get_tool(self, name: str) -> Optional[ToolDefinition]:
         """Get a tool definition by name.
@@ -570,6 +573,7 @@ class InMemoryToolRegistry:
         Returns:
             List of tool definitions in OpenAI function calling format,
             each with type="function" and function object containing
-            name, description, and parameters.
+            name, description, and parameters. The same list is returned
+            on every call and must not be mutated.
         """
-        return [tool.to_openai_format() for tool in self._tools.values()]
+        return self._openai_tools
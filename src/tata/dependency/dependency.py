@@ -12,7 +12,7 @@ Requirements covered:
 """
 
 from dataclasses import dataclass, field
-from typing import List, Protocol, Dict, Optional
+from typing import Dict, Iterable, List, Optional, Protocol
 from abc import abstractmethod
 
 from src.tata.session.session import ModuleType
@@ -95,6 +95,24 @@ class DependencyManager(Protocol):
         """
         ...
     
+    @abstractmethod
+    def can_execute_batch(
+        self, session_id: str, modules: Iterable[ModuleType]
+    ) -> Dict[ModuleType, DependencyCheck]:
+        """Check several modules against one read of the session's artifacts.
+        
+        Args:
+            session_id: The session identifier
+            modules: The modules to check
+            
+        Returns:
+            Dictionary mapping each module to its DependencyCheck, in input order
+            
+        Raises:
+            EmptySessionIDError: If session_id is empty
+        """
+        ...
+    
     @abstractmethod
     def get_required_modules(self, module: ModuleType) -> List[ModuleType]:
         """Get required modules for a given module.
@@ -157,23 +175,68 @@ class InMemoryDependencyManager:
         if not session_id:
             raise EmptySessionIDError("Session ID cannot be empty")
         
-        required_modules = self.get_required_modules(module)
+        # Check which required modules have their artifacts in memory
+        missing: List[ModuleType] = []
+        for req_module in self.get_required_modules(module):
+            artifact_type = MODULE_TO_ARTIFACT.get(req_module)
+            if artifact_type and not self._memory_manager.has_artifact(session_id, artifact_type):
+                missing.append(req_module)
         
+        return self._build_check(module, missing)
+    
+    def can_execute_batch(
+        self, session_id: str, modules: Iterable[ModuleType]
+    ) -> Dict[ModuleType, DependencyCheck]:
+        """Check several modules against one read of the session's artifacts.
+        
+        Loads the session's artifacts once and checks every module's
+        prerequisites against that snapshot, instead of one memory lookup
+        per prerequisite as repeated can_execute calls would.
+        
+        Args:
+            session_id: The session identifier
+            modules: The modules to check
+            
+        Returns:
+            Dictionary mapping each module to its DependencyCheck, in input order
+            
+        Raises:
+            EmptySessionIDError: If session_id is empty
+        """
+        if not session_id:
+            raise EmptySessionIDError("Session ID cannot be empty")
+        
+        present = self._memory_manager.get_all_artifacts(session_id).keys()
+        checks: Dict[ModuleType, DependencyCheck] = {}
+        for module in modules:
+            missing: List[ModuleType] = []
+            for req_module in self.get_required_modules(module):
+                artifact_type = MODULE_TO_ARTIFACT.get(req_module)
+                if artifact_type and artifact_type not in present:
+                    missing.append(req_module)
+            checks[module] = self._build_check(module, missing)
+        return checks
+    
+    def _build_check(
+        self, module: ModuleType, missing: List[ModuleType]
+    ) -> DependencyCheck:
+        """Build the DependencyCheck for a module given its missing prerequisites.
+        
+        Args:
+            module: The module that was checked
+            missing: Required modules whose artifacts are not in memory
+            
+        Returns:
+            DependencyCheck describing the result
+        """
         # If no dependencies, can always proceed
-        if not required_modules:
+        if not self.get_required_modules(module):
             return DependencyCheck(
                 can_proceed=True,
                 missing_dependencies=[],
                 message=f"Module {module.name} has no dependencies and can proceed."
             )
         
-        # Check which required modules have their artifacts in memory
-        missing: List[ModuleType] = []
-        for req_module in required_modules:
-            artifact_type = MODULE_TO_ARTIFACT.get(req_module)
-            if artifact_type and not self._memory_manager.has_artifact(session_id, artifact_type):
-                missing.append(req_module)
-        
         if not missing:
             return DependencyCheck(
                 can_proceed=True,
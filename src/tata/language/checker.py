@@ -136,7 +136,9 @@ def has_emojis(text: str) -> bool:
     Returns:
         True if any emoji is found, False otherwise
     """
-    if not text:
+    # All emoji ranges lie outside ASCII, and isascii() is a single
+    # C-level pass, so ASCII-only text is rejected without a regex scan
+    if not text or text.isascii():
         return False
     
     return bool(EMOJI_PATTERN.search(text))
@@ -133,6 +133,24 @@ class MemoryManager(Protocol):
             EmptySessionIDError: If session_id is empty
         """
         ...
+    
+    @abstractmethod
+    def fingerprint(self, session_id: str) -> int:
+        """Get a cheap token that changes whenever a session's artifacts change.
+        
+        Callers can cache results derived from a session's artifacts and
+        reuse them for as long as the fingerprint is unchanged.
+        
+        Args:
+            session_id: The session identifier
+            
+        Returns:
+            Integer fingerprint of the session's current artifacts
+            
+        Raises:
+            EmptySessionIDError: If session_id is empty
+        """
+        ...
 
 
 class InMemoryMemoryManager:
@@ -147,6 +165,10 @@ class InMemoryMemoryManager:
     def __init__(self):
         """Initialize the memory manager."""
         self._storage: Dict[str, Dict[ArtifactType, Artifact]] = {}
+        # Per-session versions drawn from one counter, so a cleared and
+        # refilled session never repeats an earlier fingerprint
+        self._versions: Dict[str, int] = {}
+        self._version = 0
         self._lock = threading.Lock()
     
     def store(self, session_id: str, artifact: Artifact) -> None:
@@ -169,6 +191,7 @@ class InMemoryMemoryManager:
                 self._storage[session_id] = {}
             
             self._storage[session_id][artifact.artifact_type] = artifact
+            self._bump_version(session_id)
     
     def retrieve(self, session_id: str, artifact_type: ArtifactType) -> Optional[Artifact]:
         """Retrieve an artifact from a session.
@@ -245,3 +268,27 @@ class InMemoryMemoryManager:
         with self._lock:
             if session_id in self._storage:
                 del self._storage[session_id]
+            self._bump_version(session_id)
+    
+    def fingerprint(self, session_id: str) -> int:
+        """Get a cheap token that changes whenever a session's artifacts change.
+        
+        Args:
+            session_id: The session identifier
+            
+        Returns:
+            Version number of the session's artifacts (0 if never stored)
+            
+        Raises:
+            EmptySessionIDError: If session_id is empty
+        """
+        if not session_id:
+            raise EmptySessionIDError("Session ID cannot be empty")
+        
+        with self._lock:
+            return self._versions.get(session_id, 0)
+    
+    def _bump_version(self, session_id: str) -> None:
+        """Advance a session's artifact version. Caller must hold the lock."""
+        self._version += 1
+        self._versions[session_id] = self._version
@@ -1,15 +1,17 @@
 """Persistence layer for Tata.
 
-Provides SQLite-based implementations of SessionManager and MemoryManager
-for data persistence across application restarts.
+Provides SQLite-based implementations of SessionManager, MemoryManager and
+ConversationManager for data persistence across application restarts.
 """
 
 from src.tata.persistence.sqlite import (
     SQLiteSessionManager,
     SQLiteMemoryManager,
+    SQLiteConversationManager,
 )
 
 __all__ = [
     "SQLiteSessionManager",
     "SQLiteMemoryManager",
+    "SQLiteConversationManager",
 ]
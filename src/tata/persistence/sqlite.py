@@ -1,7 +1,8 @@
 """SQLite-based persistence for Tata.
 
-Provides persistent implementations of SessionManager and MemoryManager
-using SQLite for data storage across application restarts.
+Provides persistent implementations of SessionManager, MemoryManager and
+ConversationManager using SQLite for data storage across application
+restarts.
 """
 
 import json
@@ -24,10 +25,65 @@ from src.tata.memory.memory import (
     ArtifactType,
     EmptySessionIDError as MemoryEmptySessionIDError,
 )
+from src.tata.agent.conversation import InMemoryConversationManager
+from src.tata.agent.models import Message
 
 
 DEFAULT_DB_PATH = Path("tata.db")
 
+# Applied to every new connection. WAL lets session reads proceed while
+# the agent writes artifacts; NORMAL sync is durable in WAL mode except
+# for the last commits on power loss. Sizes are upper bounds, not
+# preallocations.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    """Open a tuned connection to the database.
+    
+    Args:
+        db_path: Path to SQLite database file
+        
+    Returns:
+        Connection with Row factory and CONNECTION_PRAGMAS applied
+    """
+    conn = sqlite3.connect(str(db_path), check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+# Per-thread connections shared by all conversation managers, keyed by path
+_conversation_connections = threading.local()
+
+
+def _shared_connection(db_path: Path) -> sqlite3.Connection:
+    """Return this thread's shared connection to the database.
+    
+    A server keeps one conversation manager per cached session, so sharing
+    connections per thread keeps the number open bounded by threads rather
+    than by sessions, with nothing to close when a session is dropped.
+    
+    Args:
+        db_path: Path to SQLite database file
+        
+    Returns:
+        Connection opened with _connect on this thread's first use
+    """
+    if not hasattr(_conversation_connections, "by_path"):
+        _conversation_connections.by_path = {}
+    connections = _conversation_connections.by_path
+    if db_path not in connections:
+        connections[db_path] = _connect(db_path)
+    return connections[db_path]
+
 
 class SQLiteSessionManager:
     """SQLite-based implementation of SessionManager.
@@ -53,11 +109,7 @@ class SQLiteSessionManager:
     def _get_connection(self) -> sqlite3.Connection:
         """Get thread-local database connection."""
         if not hasattr(self._local, "conn"):
-            self._local.conn = sqlite3.connect(
-                str(self._db_path),
-                check_same_thread=False,
-            )
-            self._local.conn.row_factory = sqlite3.Row
+            self._local.conn = _connect(self._db_path)
         return self._local.conn
     
     def _init_db(self) -> None:
@@ -176,13 +228,16 @@ class SQLiteSessionManager:
         row = cursor.fetchone()
         return self._row_to_session(row) if row else None
     
-    def set_position_name(self, session_id: str, position_name: str) -> None:
+    def set_position_name(self, session_id: str, position_name: str) -> Session:
         """Set the position name for a session.
         
         Args:
             session_id: The session identifier
             position_name: The job position name
             
+        Returns:
+            The updated Session
+            
         Raises:
             EmptySessionIDError: If session_id is empty
             SessionNotFoundError: If session doesn't exist
@@ -191,26 +246,32 @@ class SQLiteSessionManager:
             raise EmptySessionIDError("Session ID cannot be empty")
         
         conn = self._get_connection()
-        cursor = conn.execute(
+        row = conn.execute(
             """
             UPDATE sessions 
             SET position_name = ?, last_activity = ?
             WHERE id = ?
+            RETURNING *
             """,
             (position_name, datetime.now().isoformat(), session_id),
-        )
+        ).fetchone()
         conn.commit()
         
-        if cursor.rowcount == 0:
+        if row is None:
             raise SessionNotFoundError(f"Session not found: {session_id}")
+        
+        return self._row_to_session(row)
     
-    def set_language(self, session_id: str, language: SupportedLanguage) -> None:
+    def set_language(self, session_id: str, language: SupportedLanguage) -> Session:
         """Set the output language for a session.
         
         Args:
             session_id: The session identifier
             language: The target language
             
+        Returns:
+            The updated Session
+            
         Raises:
             EmptySessionIDError: If session_id is empty
             SessionNotFoundError: If session doesn't exist
@@ -219,18 +280,21 @@ class SQLiteSessionManager:
             raise EmptySessionIDError("Session ID cannot be empty")
         
         conn = self._get_connection()
-        cursor = conn.execute(
+        row = conn.execute(
             """
             UPDATE sessions 
             SET language = ?, last_activity = ?
             WHERE id = ?
+            RETURNING *
             """,
             (language.value, datetime.now().isoformat(), session_id),
-        )
+        ).fetchone()
         conn.commit()
         
-        if cursor.rowcount == 0:
+        if row is None:
             raise SessionNotFoundError(f"Session not found: {session_id}")
+        
+        return self._row_to_session(row)
     
     def get_active_module(self, session_id: str) -> Optional[ModuleType]:
         """Get the currently active module for a session.
@@ -254,13 +318,16 @@ class SQLiteSessionManager:
         
         return session.current_module
     
-    def set_active_module(self, session_id: str, module: ModuleType) -> None:
+    def set_active_module(self, session_id: str, module: ModuleType) -> Session:
         """Set the currently active module for a session.
         
         Args:
             session_id: The session identifier
             module: The module to set as active
             
+        Returns:
+            The updated Session
+            
         Raises:
             EmptySessionIDError: If session_id is empty
             SessionNotFoundError: If session doesn't exist
@@ -269,18 +336,21 @@ class SQLiteSessionManager:
             raise EmptySessionIDError("Session ID cannot be empty")
         
         conn = self._get_connection()
-        cursor = conn.execute(
+        row = conn.execute(
             """
             UPDATE sessions 
             SET current_module = ?, last_activity = ?
             WHERE id = ?
+            RETURNING *
             """,
             (module.value, datetime.now().isoformat(), session_id),
-        )
+        ).fetchone()
         conn.commit()
         
-        if cursor.rowcount == 0:
+        if row is None:
             raise SessionNotFoundError(f"Session not found: {session_id}")
+        
+        return self._row_to_session(row)
     
     def _row_to_session(self, row: sqlite3.Row) -> Session:
         """Convert database row to Session object."""
@@ -333,11 +403,7 @@ class SQLiteMemoryManager:
     def _get_connection(self) -> sqlite3.Connection:
         """Get thread-local database connection."""
         if not hasattr(self._local, "conn"):
-            self._local.conn = sqlite3.connect(
-                str(self._db_path),
-                check_same_thread=False,
-            )
-            self._local.conn.row_factory = sqlite3.Row
+            self._local.conn = _connect(self._db_path)
         return self._local.conn
     
     def _init_db(self) -> None:
@@ -486,6 +552,31 @@ class SQLiteMemoryManager:
         
         return result
     
+    def fingerprint(self, session_id: str) -> int:
+        """Get a cheap token that changes whenever a session's artifacts change.
+        
+        Derived from the artifact count and newest write time in one indexed
+        query, so it also reflects writes made by other processes.
+        
+        Args:
+            session_id: The session identifier
+            
+        Returns:
+            Integer fingerprint of the session's current artifacts
+            
+        Raises:
+            EmptySessionIDError: If session_id is empty
+        """
+        if not session_id:
+            raise MemoryEmptySessionIDError("Session ID cannot be empty")
+        
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT COUNT(*), MAX(created_at) FROM artifacts WHERE session_id = ?",
+            (session_id,),
+        ).fetchone()
+        return hash((row[0], row[1]))
+    
     def clear_session(self, session_id: str) -> None:
         """Clear all artifacts for a session.
         
@@ -506,6 +597,113 @@ class SQLiteMemoryManager:
         conn.commit()
 
 
+class SQLiteConversationManager(InMemoryConversationManager):
+    """SQLite-backed implementation of ConversationManager for one session.
+    
+    Keeps the same in-memory window as InMemoryConversationManager and
+    appends every message to an append-only log, so a session's history
+    survives restarts and agent eviction. Stored messages are never
+    rewritten, which keeps the replayed prefix stable for prompt caching.
+    
+    Attributes:
+        _session_id: Session whose conversation this manages
+        _db_path: Path to SQLite database file
+        _next_seq: Sequence number for the next stored message
+    """
+    
+    def __init__(
+        self,
+        session_id: str,
+        db_path: Path = DEFAULT_DB_PATH,
+        max_messages: int = 50,
+    ):
+        """Initialize the manager and load the session's recent history.
+        
+        Args:
+            session_id: The session identifier
+            db_path: Path to SQLite database file
+            max_messages: Maximum number of messages to keep (excluding
+                         system prompt), as for InMemoryConversationManager
+            
+        Raises:
+            EmptySessionIDError: If session_id is empty
+        """
+        if not session_id:
+            raise EmptySessionIDError("Session ID cannot be empty")
+        
+        super().__init__(max_messages=max_messages)
+        self._session_id = session_id
+        self._db_path = db_path
+        self._init_db()
+        self._load()
+    
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, shared with other sessions."""
+        return _shared_connection(self._db_path)
+    
+    def _init_db(self) -> None:
+        """Initialize database schema."""
+        conn = self._get_connection()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS conversation_messages (
+                session_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                message TEXT NOT NULL,
+                PRIMARY KEY (session_id, seq)
+            )
+        """)
+        conn.commit()
+    
+    def _load(self) -> None:
+        """Load the newest stored messages into the in-memory window."""
+        # One row past the window lets truncation drop any tool results
+        # whose tool call fell outside it
+        rows = self._get_connection().execute(
+            """
+            SELECT seq, message FROM conversation_messages
+            WHERE session_id = ? ORDER BY seq DESC LIMIT ?
+            """,
+            (self._session_id, self._max_messages + 1),
+        ).fetchall()
+        
+        self._next_seq = rows[0]["seq"] + 1 if rows else 0
+        with self._lock:
+            self._messages.extend(
+                Message.from_openai_format(json.loads(row["message"]))
+                for row in reversed(rows)
+            )
+            self._truncate_if_needed()
+    
+    def clear(self) -> None:
+        """Clear conversation history (keeps system prompt)."""
+        with self._lock:
+            conn = self._get_connection()
+            conn.execute(
+                "DELETE FROM conversation_messages WHERE session_id = ?",
+                (self._session_id,),
+            )
+            conn.commit()
+            self._messages = []
+            self._init_system_prompt()
+    
+    def _append(self, message: Message) -> None:
+        """Store a message, then append it to the in-memory window.
+        
+        Args:
+            message: The message to add
+        """
+        with self._lock:
+            conn = self._get_connection()
+            conn.execute(
+                "INSERT INTO conversation_messages (session_id, seq, message) VALUES (?, ?, ?)",
+                (self._session_id, self._next_seq, json.dumps(message.to_openai_format())),
+            )
+            conn.commit()
+            self._next_seq += 1
+            self._messages.append(message)
+            self._truncate_if_needed()
+
+
 class _StoredArtifact:
     """Generic wrapper for stored artifacts when no class is registered.
     
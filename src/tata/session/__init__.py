@@ -6,6 +6,7 @@ from .session import (
     ModuleType,
     SessionManager,
     InMemorySessionManager,
+    CachedSessionManager,
     SessionNotFoundError,
     EmptyRecruiterIDError,
     EmptySessionIDError,
@@ -17,6 +18,7 @@ __all__ = [
     "ModuleType",
     "SessionManager",
     "InMemorySessionManager",
+    "CachedSessionManager",
     "SessionNotFoundError",
     "EmptyRecruiterIDError",
     "EmptySessionIDError",
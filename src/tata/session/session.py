@@ -4,12 +4,14 @@ This module provides session lifecycle management for recruitment chat sessions.
 Each session represents one recruitment project with persistent memory.
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Protocol, Dict
+from typing import Callable, Optional, Protocol, Dict, Tuple
 from abc import abstractmethod
 import threading
+import time
 import uuid
 
 
@@ -129,7 +131,7 @@ class SessionManager(Protocol):
         ...
     
     @abstractmethod
-    def set_position_name(self, session_id: str, position_name: str) -> None:
+    def set_position_name(self, session_id: str, position_name: str) -> Session:
         """Set the position name for a session.
         
         The position name is used as the chat title per Requirement 12.2.
@@ -138,6 +140,9 @@ class SessionManager(Protocol):
             session_id: The session identifier
             position_name: The job position name
             
+        Returns:
+            The updated Session
+            
         Raises:
             EmptySessionIDError: If session_id is empty
             SessionNotFoundError: If session doesn't exist
@@ -145,13 +150,16 @@ class SessionManager(Protocol):
         ...
     
     @abstractmethod
-    def set_language(self, session_id: str, language: SupportedLanguage) -> None:
+    def set_language(self, session_id: str, language: SupportedLanguage) -> Session:
         """Set the output language for a session.
         
         Args:
             session_id: The session identifier
             language: The target language
             
+        Returns:
+            The updated Session
+            
         Raises:
             EmptySessionIDError: If session_id is empty
             SessionNotFoundError: If session doesn't exist
@@ -175,13 +183,16 @@ class SessionManager(Protocol):
         ...
     
     @abstractmethod
-    def set_active_module(self, session_id: str, module: ModuleType) -> None:
+    def set_active_module(self, session_id: str, module: ModuleType) -> Session:
         """Set the currently active module for a session.
         
         Args:
             session_id: The session identifier
             module: The module to set as active
             
+        Returns:
+            The updated Session
+            
         Raises:
             EmptySessionIDError: If session_id is empty
             SessionNotFoundError: If session doesn't exist
@@ -278,13 +289,16 @@ class InMemorySessionManager:
         with self._lock:
             return self._sessions.get(session_id)
     
-    def set_position_name(self, session_id: str, position_name: str) -> None:
+    def set_position_name(self, session_id: str, position_name: str) -> Session:
         """Set the position name for a session.
         
         Args:
             session_id: The session identifier
             position_name: The job position name
             
+        Returns:
+            The updated Session
+            
         Raises:
             EmptySessionIDError: If session_id is empty
             SessionNotFoundError: If session doesn't exist
@@ -299,14 +313,18 @@ class InMemorySessionManager:
             
             session.position_name = position_name
             session.last_activity = datetime.now()
+            return session
     
-    def set_language(self, session_id: str, language: SupportedLanguage) -> None:
+    def set_language(self, session_id: str, language: SupportedLanguage) -> Session:
         """Set the output language for a session.
         
         Args:
             session_id: The session identifier
             language: The target language
             
+        Returns:
+            The updated Session
+            
         Raises:
             EmptySessionIDError: If session_id is empty
             SessionNotFoundError: If session doesn't exist
@@ -321,6 +339,7 @@ class InMemorySessionManager:
             
             session.language = language
             session.last_activity = datetime.now()
+            return session
     
     def get_active_module(self, session_id: str) -> Optional[ModuleType]:
         """Get the currently active module for a session.
@@ -345,13 +364,16 @@ class InMemorySessionManager:
             
             return session.current_module
     
-    def set_active_module(self, session_id: str, module: ModuleType) -> None:
+    def set_active_module(self, session_id: str, module: ModuleType) -> Session:
         """Set the currently active module for a session.
         
         Args:
             session_id: The session identifier
             module: The module to set as active
             
+        Returns:
+            The updated Session
+            
         Raises:
             EmptySessionIDError: If session_id is empty
             SessionNotFoundError: If session doesn't exist
@@ -366,3 +388,149 @@ class InMemorySessionManager:
             
             session.current_module = module
             session.last_activity = datetime.now()
+            return session
+
+
+class CachedSessionManager:
+    """Read-through, write-through cache in front of another SessionManager.
+    
+    Keeps recently read sessions and per-recruiter session lists in
+    memory so repeated lookups skip the backing store. Entries expire
+    after ``ttl`` seconds and the least recently used are evicted beyond
+    ``maxsize``. Writes through this manager go to the backing store
+    first and then update the cached session and its recruiter's list
+    in place, so a panel reload right after creating or renaming a
+    session is still a cache hit. The short TTL bounds staleness from
+    writers that bypass the cache, such as another process sharing the
+    database.
+    """
+    
+    def __init__(
+        self,
+        inner: SessionManager,
+        maxsize: int = 1024,
+        ttl: float = 5.0,
+        clock: Optional[Callable[[], float]] = None,
+    ):
+        """Initialize the cache.
+        
+        Args:
+            inner: The SessionManager that owns the data
+            maxsize: Maximum number of cached sessions and of cached lists
+            ttl: Seconds an entry stays valid
+            clock: Optional monotonic time function. Defaults to time.monotonic.
+        """
+        self._inner = inner
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock or time.monotonic
+        self._sessions: OrderedDict[str, Tuple[float, Session]] = OrderedDict()
+        self._lists: OrderedDict[str, Tuple[float, list[Session]]] = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _get(self, cache: OrderedDict, key: str):
+        """Return a live cached value, or None on a miss."""
+        with self._lock:
+            entry = cache.get(key)
+            if entry is None:
+                return None
+            if self._clock() - entry[0] >= self._ttl:
+                del cache[key]
+                return None
+            cache.move_to_end(key)
+            return entry[1]
+    
+    def _put(self, cache: OrderedDict, key: str, value) -> None:
+        """Store a value, evicting the least recently used beyond maxsize."""
+        with self._lock:
+            cache[key] = (self._clock(), value)
+            cache.move_to_end(key)
+            while len(cache) > self._maxsize:
+                cache.popitem(last=False)
+    
+    def _write_through(self, session: Session) -> None:
+        """Store a session and update its recruiter's cached list, if any."""
+        self._put(self._sessions, session.id, session)
+        with self._lock:
+            entry = self._lists.get(session.recruiter_id)
+            if entry is None:
+                return
+            timestamp, sessions = entry
+            sessions = [s for s in sessions if s.id != session.id]
+            sessions.append(session)
+            sessions.sort(key=lambda s: s.last_activity, reverse=True)
+            # Keep the list's original timestamp so the TTL still bounds
+            # staleness from other writers
+            self._lists[session.recruiter_id] = (timestamp, sessions)
+    
+    def _invalidate(self, session_id: str) -> None:
+        """Drop a session and the list that contains it."""
+        with self._lock:
+            entry = self._sessions.pop(session_id, None)
+            if entry is None:
+                # Owner unknown, so any cached list may include the session
+                self._lists.clear()
+            else:
+                self._lists.pop(entry[1].recruiter_id, None)
+    
+    def create_session(self, recruiter_id: str) -> Session:
+        """Create a session and add it to the cache."""
+        session = self._inner.create_session(recruiter_id)
+        self._write_through(session)
+        return session
+    
+    def list_sessions(self, recruiter_id: str) -> list[Session]:
+        """List a recruiter's sessions, served from cache when fresh."""
+        cached = self._get(self._lists, recruiter_id)
+        if cached is not None:
+            return list(cached)
+        sessions = self._inner.list_sessions(recruiter_id)
+        self._put(self._lists, recruiter_id, list(sessions))
+        return sessions
+    
+    def get_session(self, session_id: str) -> Optional[Session]:
+        """Retrieve a session, served from cache when fresh.
+        
+        Missing sessions are not cached.
+        """
+        cached = self._get(self._sessions, session_id)
+        if cached is not None:
+            return cached
+        session = self._inner.get_session(session_id)
+        if session is not None:
+            self._put(self._sessions, session_id, session)
+        return session
+    
+    def set_position_name(self, session_id: str, position_name: str) -> Session:
+        """Set the position name and update the cached session."""
+        try:
+            session = self._inner.set_position_name(session_id, position_name)
+        except Exception:
+            self._invalidate(session_id)
+            raise
+        self._write_through(session)
+        return session
+    
+    def set_language(self, session_id: str, language: SupportedLanguage) -> Session:
+        """Set the output language and update the cached session."""
+        try:
+            session = self._inner.set_language(session_id, language)
+        except Exception:
+            self._invalidate(session_id)
+            raise
+        self._write_through(session)
+        return session
+    
+    def get_active_module(self, session_id: str) -> Optional[ModuleType]:
+        """Get the active module from the backing store."""
+        return self._inner.get_active_module(session_id)
+    
+    def set_active_module(self, session_id: str, module: ModuleType) -> Session:
+        """Set the active module and update the cached session."""
+        try:
+            session = self._inner.set_active_module(session_id, module)
+        except Exception:
+            self._invalidate(session_id)
+            raise
+        self._write_through(session)
+        return session
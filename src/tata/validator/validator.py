@@ -10,27 +10,41 @@ Requirements covered:
 - 13.5: Enforce banned words list in job ads and candidate-facing texts
 """
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from typing import List, Optional, Protocol, Tuple, Union
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Protocol, Sequence, Set, Tuple, Union
 from abc import abstractmethod
+import json
+import logging
 import re
+import threading
+
+try:
+    import re2
+except ImportError:  # pragma: no cover - optional dependency
+    re2 = None
 
 from src.tata.memory.memory import Artifact, ArtifactType
 from src.tata.modules.profile.profile import RequirementProfile
-from src.tata.modules.jobad.jobad import JobAd, contains_module_naming
+from src.tata.modules.jobad.jobad import JobAd, MODULE_NAMING_PATTERNS
 from src.tata.modules.screening.screening import ScreeningTemplate
 from src.tata.modules.headhunting.headhunting import HeadhuntingMessages
 from src.tata.modules.calendar.invite import CalendarInvite
 from src.tata.session.session import SupportedLanguage
-from src.tata.language.checker import (
-    check_banned_words,
-    has_emojis,
-    has_dash_bullets,
-    BannedWordCheck,
+from src.tata.language.checker import EMOJI_PATTERN, DASH_BULLET_PATTERN
+from src.tata.language.banned_words import (
+    get_banned_words_for_language,
+    get_suggestion_for_word,
 )
 
+# Configure module logger
+logger = logging.getLogger(__name__)
+
 
-@dataclass
+@dataclass(slots=True)
 class ValidationError:
     """A validation error.
     
@@ -44,7 +58,7 @@ class ValidationError:
     severity: str = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationWarning:
     """A validation warning.
     
@@ -56,7 +70,7 @@ class ValidationWarning:
     message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of validation.
     
@@ -83,6 +97,343 @@ class ValidationResult:
             errors=self.errors + other.errors,
             warnings=self.warnings + other.warnings,
         )
+    
+    def _extend(self, other: "ValidationResult") -> "ValidationResult":
+        """Merge another validation result into this one in place.
+        
+        Used when accumulating several sub-results, to avoid copying the
+        error and warning lists on every merge.
+        
+        Args:
+            other: Another validation result to merge
+            
+        Returns:
+            This ValidationResult, updated with the other's errors and warnings
+        """
+        self.is_valid = self.is_valid and other.is_valid
+        self.errors.extend(other.errors)
+        self.warnings.extend(other.warnings)
+        return self
+
+
+# Words of four or more characters, starting with a letter
+_WORD_PATTERN = re.compile(r"[^\W\d_][\w\-]{3,}")
+
+
+def _tokenize(text: str) -> FrozenSet[str]:
+    """Split text into a set of lowercased words of four or more characters.
+    
+    Args:
+        text: The text to tokenize
+        
+    Returns:
+        Frozen set of distinct lowercased words
+    """
+    return frozenset(_WORD_PATTERN.findall(text.lower()))
+
+
+class _WordScanner:
+    """Find which of a set of words occur as substrings of a text in one pass.
+    
+    All words are compiled into a single lookahead alternation, longest
+    first, so every text position is tried once. Any word that is a prefix
+    of the longest word matching at a position also occurs there, so those
+    are resolved from a precomputed prefix table instead of being rescanned.
+    """
+    
+    def __init__(self, words: Iterable[str]):
+        unique = sorted(set(words), key=len, reverse=True)
+        self._prefixes: Dict[str, Tuple[str, ...]] = {
+            word: tuple(other for other in unique if word.startswith(other))
+            for word in unique
+        }
+        self._pattern: Optional[re.Pattern] = None
+        if unique:
+            self._pattern = re.compile(
+                "(?=(" + "|".join(re.escape(word) for word in unique) + "))"
+            )
+    
+    def find(self, text: str) -> Set[str]:
+        """Return the subset of words that occur in the text."""
+        found: Set[str] = set()
+        if self._pattern is None:
+            return found
+        for match in self._pattern.finditer(text):
+            found.update(self._prefixes[match.group(1)])
+        return found
+
+
+@dataclass(slots=True)
+class _ArtifactView:
+    """Serialized forms of an artifact, each computed at most once.
+    
+    Lets comprehensive validation serialize and lowercase an artifact
+    once and share the result between the individual checks.
+    
+    Attributes:
+        artifact: The artifact being validated
+    """
+    artifact: Artifact
+    _json_text: Optional[str] = None
+    _text: Optional[str] = None
+    _text_lower: Optional[str] = None
+    
+    @property
+    def json_text(self) -> str:
+        """The artifact's JSON representation."""
+        if self._json_text is None:
+            self._json_text = self.artifact.to_json()
+        return self._json_text
+    
+    @property
+    def text(self) -> str:
+        """The artifact's text: plain text for job ads, JSON otherwise."""
+        if self._text is None:
+            if self.artifact.artifact_type == ArtifactType.JOB_AD:
+                job_ad: JobAd = self.artifact  # type: ignore
+                self._text = job_ad.to_text()
+            else:
+                self._text = self.json_text
+        return self._text
+    
+    @property
+    def text_lower(self) -> str:
+        """The artifact's text, lowercased."""
+        if self._text_lower is None:
+            self._text_lower = self.text.lower()
+        return self._text_lower
+
+
+@lru_cache(maxsize=64)
+def _must_have_words(
+    must_haves: Tuple[str, ...]
+) -> Tuple[Tuple[Tuple[str, ...], ...], _WordScanner]:
+    """Split must-haves into significant words and build their scanner.
+    
+    Args:
+        must_haves: The must-have skills
+        
+    Returns:
+        Tuple of (lowercased words longer than three characters per
+        must-have, scanner over all of those words)
+    """
+    buckets = tuple(
+        tuple(word.lower() for word in must_have.split() if len(word) > 3)
+        for must_have in must_haves
+    )
+    scanner = _WordScanner(word for bucket in buckets for word in bucket)
+    return buckets, scanner
+
+
+@dataclass(frozen=True)
+class _ProfileIndex:
+    """Token sets derived from a requirement profile, built once per profile.
+    
+    Attributes:
+        resp_words: Words longer than four characters in the responsibilities
+        position_words: Words of four or more characters in the position title
+        must_have_words: Significant words of each must-have skill
+        must_have_scanner: Scanner over all must-have words
+        must_have_phrase_scanner: Scanner over the lowercased must-have skills
+    """
+    resp_words: FrozenSet[str]
+    position_words: FrozenSet[str]
+    must_have_words: Tuple[Tuple[str, ...], ...]
+    must_have_scanner: _WordScanner
+    must_have_phrase_scanner: _WordScanner
+
+
+def _profile_index(profile: RequirementProfile) -> _ProfileIndex:
+    """Get the token index for a profile.
+    
+    The index is cached on the profile fields it is derived from, so a
+    locked profile (Requirement 13.1) is tokenized once no matter how
+    often artifacts are validated against it.
+    
+    Args:
+        profile: The requirement profile
+        
+    Returns:
+        _ProfileIndex for the profile
+    """
+    return _build_profile_index(*_profile_key(profile))
+
+
+def _profile_key(profile: RequirementProfile) -> Tuple[str, Tuple[str, ...], Tuple[str, ...]]:
+    """Get the profile fields that profile-dependent validation reads.
+    
+    Args:
+        profile: The requirement profile
+        
+    Returns:
+        Tuple of (position title, responsibilities, must-have skills)
+    """
+    return (
+        profile.position_title,
+        tuple(profile.primary_responsibilities),
+        tuple(profile.must_have_skills),
+    )
+
+
+@lru_cache(maxsize=64)
+def _build_profile_index(
+    position_title: str,
+    responsibilities: Tuple[str, ...],
+    must_haves: Tuple[str, ...],
+) -> _ProfileIndex:
+    """Build a _ProfileIndex from the relevant profile fields."""
+    must_have_words, must_have_scanner = _must_have_words(must_haves)
+    return _ProfileIndex(
+        resp_words=frozenset(
+            word
+            for resp in responsibilities
+            for word in _tokenize(resp)
+            if len(word) > 4
+        ),
+        position_words=_tokenize(position_title),
+        must_have_words=must_have_words,
+        must_have_scanner=must_have_scanner,
+        must_have_phrase_scanner=_WordScanner(
+            must_have.lower() for must_have in must_haves
+        ),
+    )
+
+
+@dataclass(frozen=True)
+class _TextScan:
+    """Findings from a single fused scan over a text.
+    
+    Attributes:
+        has_emojis: True if any emoji was found
+        has_dash_bullets: True if any dash-style bullet was found
+        has_module_naming: True if module naming (Module A, B, etc.) was found
+        banned_hits: (banned word, position) pairs in order of position
+    """
+    has_emojis: bool
+    has_dash_bullets: bool
+    has_module_naming: bool
+    banned_hits: Tuple[Tuple[str, int], ...]
+
+
+@lru_cache(maxsize=None)
+def _fused_pattern(
+    language: SupportedLanguage
+) -> Tuple["re.Pattern[str]", Dict[str, Tuple[str, ...]]]:
+    """Build the fused validation pattern for a language.
+    
+    Emojis, dash bullets, module naming and every banned word for the
+    language are combined into one alternation with a named group each.
+    Banned words sit in a zero-width lookahead, longest first, so every
+    start position is tried like the substring search in
+    check_banned_words; shorter banned words that are a prefix of the
+    matched one are recovered from the returned prefix table.
+    
+    Args:
+        language: The language whose banned words are included
+        
+    Returns:
+        Tuple of (compiled pattern, prefix table keyed by lowercased word)
+    """
+    banned_words = list(dict.fromkeys(get_banned_words_for_language(language)))
+    alternatives = sorted({word.lower() for word in banned_words}, key=len, reverse=True)
+    prefixes = {
+        lower: tuple(word for word in banned_words if lower.startswith(word.lower()))
+        for lower in alternatives
+    }
+    
+    parts = []
+    if alternatives:
+        banned = "|".join(re.escape(word) for word in alternatives)
+        parts.append(f"(?=(?P<banned>(?i:{banned})))")
+    parts.extend([
+        f"(?P<emoji>{EMOJI_PATTERN.pattern})",
+        f"(?P<dash_bullet>{DASH_BULLET_PATTERN.pattern})",
+        f"(?P<module_name>(?i:{'|'.join(MODULE_NAMING_PATTERNS)}))",
+    ])
+    return re.compile("|".join(parts), flags=re.MULTILINE), prefixes
+
+
+# Any of these characters, as Python's \s understands it, may precede a
+# dash bullet; RE2's \s is ASCII-only so the class is spelled out
+_RE2_WHITESPACE = r"[\t-\r\x{1c}-\x{1f}\x{85}\p{Z}]"
+
+
+@lru_cache(maxsize=None)
+def _clean_text_prefilter(language: SupportedLanguage):
+    """Build an RE2 pattern that matches whenever the fused pattern could.
+    
+    RE2 has no lookahead, so it cannot produce the exact findings of
+    _fused_pattern. It runs in linear time without backtracking though,
+    which makes it a cheap way to confirm that a text is clean and skip
+    the exact scan altogether. Each part is a superset of its exact
+    counterpart: module naming is reduced to the word "module".
+    
+    Args:
+        language: The language whose banned words are included
+        
+    Returns:
+        Compiled RE2 pattern, or None when google-re2 is not installed
+    """
+    if re2 is None:
+        return None
+    
+    parts = [
+        f"(?i:{re.escape(word.lower())})"
+        for word in get_banned_words_for_language(language)
+    ]
+    parts.extend([
+        EMOJI_PATTERN.pattern,
+        f"(?m:^{_RE2_WHITESPACE}*[-–—]{_RE2_WHITESPACE})",
+        "(?i:module)",
+    ])
+    return re2.compile("|".join(parts))
+
+
+_CLEAN_SCAN = _TextScan(
+    has_emojis=False,
+    has_dash_bullets=False,
+    has_module_naming=False,
+    banned_hits=(),
+)
+
+
+@lru_cache(maxsize=64)
+def _scan_text(text: str, language: SupportedLanguage) -> _TextScan:
+    """Scan text once for every emoji, dash bullet, module name and banned word.
+    
+    Shared by the language compliance and banned word checks so that
+    comprehensive validation only walks the artifact text once.
+    
+    Args:
+        text: The text to scan
+        language: The language for banned word checking
+        
+    Returns:
+        _TextScan with the findings
+    """
+    prefilter = _clean_text_prefilter(language)
+    if prefilter is not None and not prefilter.search(text):
+        return _CLEAN_SCAN
+    
+    pattern, prefixes = _fused_pattern(language)
+    found: Set[str] = set()
+    banned_hits: List[Tuple[str, int]] = []
+    
+    for match in pattern.finditer(text):
+        kind = match.lastgroup
+        if kind == "banned":
+            position = match.start()
+            for word in prefixes[match.group("banned").lower()]:
+                banned_hits.append((word, position))
+        else:
+            found.add(kind)
+    
+    return _TextScan(
+        has_emojis="emoji" in found,
+        has_dash_bullets="dash_bullet" in found,
+        has_module_naming="module_name" in found,
+        banned_hits=tuple(banned_hits),
+    )
 
 
 class Validator(Protocol):
@@ -202,14 +553,10 @@ def validate_against_profile(
         
         # Check responsibilities are derived from profile
         if profile.primary_responsibilities:
-            profile_resp_words = set()
-            for resp in profile.primary_responsibilities:
-                profile_resp_words.update(
-                    word.lower() for word in resp.split() if len(word) > 4
-                )
+            profile_resp_words = _profile_index(profile).resp_words
             
-            job_ad_resp_text = " ".join(job_ad.responsibilities).lower()
-            matches = sum(1 for word in profile_resp_words if word in job_ad_resp_text)
+            job_ad_resp_words = _tokenize(" ".join(job_ad.responsibilities))
+            matches = len(profile_resp_words & job_ad_resp_words)
             
             if matches < len(profile_resp_words) * 0.3:
                 warnings.append(ValidationWarning(
@@ -222,13 +569,21 @@ def validate_against_profile(
         
         # Check that skill questions cover must-haves
         template_skills = {sq.skill_name.lower() for sq in template.skill_questions}
+        skill_scanner = _WordScanner(template_skills)
+        
+        # Must-haves contained in some skill, found in one pass over all skills
+        in_skills: Set[str] = set()
+        if template_skills:
+            in_skills = _profile_index(profile).must_have_phrase_scanner.find(
+                "\0".join(template_skills)
+            )
         
         for must_have in profile.must_have_skills:
             must_have_lower = must_have.lower()
             # Check if any template skill matches
-            found = any(
-                must_have_lower in skill or skill in must_have_lower
-                for skill in template_skills
+            found = (
+                must_have_lower in in_skills
+                or bool(skill_scanner.find(must_have_lower))
             )
             if not found:
                 warnings.append(ValidationWarning(
@@ -240,13 +595,11 @@ def validate_against_profile(
         messages: HeadhuntingMessages = artifact  # type: ignore
         
         # Check that messages reference the role
-        position_words = set(
-            word.lower() for word in profile.position_title.split() if len(word) > 3
-        )
+        position_words = _profile_index(profile).position_words
         
         # Check English message as representative
-        en_text = messages.short_direct.en.lower()
-        matches = sum(1 for word in position_words if word in en_text)
+        en_words = _tokenize(messages.short_direct.en)
+        matches = len(position_words & en_words)
         
         if matches < len(position_words) * 0.5:
             warnings.append(ValidationWarning(
@@ -280,55 +633,72 @@ def validate_language_compliance(
     Returns:
         ValidationResult with any errors or warnings
     """
-    errors: List[ValidationError] = []
-    warnings: List[ValidationWarning] = []
-    
     if not text:
         return ValidationResult(is_valid=True, errors=[], warnings=[])
     
+    errors, warnings = _language_compliance_findings(text, language)
+    return ValidationResult(
+        is_valid=len(errors) == 0,
+        errors=list(errors),
+        warnings=list(warnings),
+    )
+
+
+@lru_cache(maxsize=512)
+def _language_compliance_findings(
+    text: str,
+    language: SupportedLanguage
+) -> Tuple[Tuple[ValidationError, ...], Tuple[ValidationWarning, ...]]:
+    """Run the language compliance checks on non-empty text.
+    
+    Results are pure functions of the text and language, so they are
+    memoized; the same artifact is often revalidated during a session.
+    
+    Args:
+        text: The text to validate
+        language: The expected language
+        
+    Returns:
+        Tuple of (errors, warnings)
+    """
+    errors: List[ValidationError] = []
+    warnings: List[ValidationWarning] = []
+    scan = _scan_text(text, language)
+    
     # Check for emojis (Requirement 2.5)
-    if has_emojis(text):
+    if scan.has_emojis:
         errors.append(ValidationError(
             field="text",
             message="Text contains emojis which are not allowed"
         ))
     
     # Check for dash bullets (Requirement 2.6)
-    if has_dash_bullets(text):
+    if scan.has_dash_bullets:
         warnings.append(ValidationWarning(
             field="text",
             message="Text contains dash-style bullets which should be avoided"
         ))
     
     # Check for module naming exposure (Requirement 3.5)
-    if contains_module_naming(text):
+    if scan.has_module_naming:
         errors.append(ValidationError(
             field="text",
             message="Text contains module naming (Module A, B, etc.) which should not be exposed"
         ))
     
-    # Check for GlobalConnect terminology
-    gc_terms = {
-        "globalconnect": ["GlobalConnect", "Global Connect"],
-        "gc": ["GC"],
-    }
-    
-    text_lower = text.lower()
-    for term, correct_forms in gc_terms.items():
-        if term in text_lower:
-            # Check if it's in correct form
-            found_correct = any(form in text for form in correct_forms)
-            if not found_correct and term == "globalconnect":
-                warnings.append(ValidationWarning(
-                    field="text",
-                    message="GlobalConnect should be written as one word with capital G and C"
-                ))
+    # Check for GlobalConnect terminology. A correct form anywhere in the
+    # text passes, so only texts without one need a case-insensitive search
+    if (
+        "GlobalConnect" not in text
+        and "Global Connect" not in text
+        and "globalconnect" in text.lower()
+    ):
+        warnings.append(ValidationWarning(
+            field="text",
+            message="GlobalConnect should be written as one word with capital G and C"
+        ))
     
-    return ValidationResult(
-        is_valid=len(errors) == 0,
-        errors=errors,
-        warnings=warnings,
-    )
+    return tuple(errors), tuple(warnings)
 
 
 def validate_must_have_visibility(
@@ -344,6 +714,24 @@ def validate_must_have_visibility(
         artifact: The artifact to validate
         must_haves: The four must-have skills
         
+    Returns:
+        ValidationResult with any errors or warnings
+    """
+    return _validate_must_have_visibility(artifact, must_haves, _ArtifactView(artifact))
+
+
+def _validate_must_have_visibility(
+    artifact: Artifact,
+    must_haves: Tuple[str, str, str, str],
+    view: _ArtifactView,
+) -> ValidationResult:
+    """Validate must-have visibility, reusing an existing artifact view.
+    
+    Args:
+        artifact: The artifact to validate
+        must_haves: The four must-have skills
+        view: Serialized forms of the artifact
+        
     Returns:
         ValidationResult with any errors or warnings
     """
@@ -352,12 +740,12 @@ def validate_must_have_visibility(
     
     artifact_type = artifact.artifact_type
     
-    # Get text representation of artifact
-    artifact_text = ""
+    # Get lowercased text representation of artifact
+    artifact_text_lower = ""
     
     if artifact_type == ArtifactType.JOB_AD:
         job_ad: JobAd = artifact  # type: ignore
-        artifact_text = job_ad.to_text()
+        artifact_text_lower = view.text_lower
         
         # Also check that must-haves are in the requirements section specifically
         for i, must_have in enumerate(must_haves):
@@ -369,35 +757,32 @@ def validate_must_have_visibility(
     
     elif artifact_type in (ArtifactType.TA_SCREENING_TEMPLATE, ArtifactType.HM_SCREENING_TEMPLATE):
         template: ScreeningTemplate = artifact  # type: ignore
-        artifact_text = " ".join(
-            sq.skill_name + " " + sq.main_question
+        artifact_text_lower = " ".join(
+            part
             for sq in template.skill_questions
-        )
+            for part in (sq.skill_name, sq.main_question)
+        ).lower()
     
     elif artifact_type == ArtifactType.HEADHUNTING_MESSAGES:
         messages: HeadhuntingMessages = artifact  # type: ignore
-        artifact_text = (
-            messages.short_direct.en + " " +
-            messages.value_proposition.en + " " +
-            messages.call_to_action.en
-        )
+        artifact_text_lower = " ".join((
+            messages.short_direct.en,
+            messages.value_proposition.en,
+            messages.call_to_action.en,
+        )).lower()
     
     else:
         # For other artifact types, use JSON representation
-        artifact_text = artifact.to_json()
+        artifact_text_lower = view.text_lower
     
-    # Check visibility of each must-have
-    artifact_text_lower = artifact_text.lower()
+    # Check visibility of each must-have with a single scan over the text
+    buckets, scanner = _must_have_words(tuple(must_haves))
+    found_words = scanner.find(artifact_text_lower)
     visible_count = 0
     
-    for must_have in must_haves:
-        # Check if key words from must-have appear in artifact
-        must_have_words = [
-            word.lower() for word in must_have.split() if len(word) > 3
-        ]
-        
+    for must_have, must_have_words in zip(must_haves, buckets):
         if must_have_words:
-            matches = sum(1 for word in must_have_words if word in artifact_text_lower)
+            matches = sum(1 for word in must_have_words if word in found_words)
             if matches >= len(must_have_words) * 0.5:
                 visible_count += 1
             else:
@@ -435,27 +820,54 @@ def validate_no_banned_words(
     Returns:
         ValidationResult with any errors or warnings
     """
-    errors: List[ValidationError] = []
-    warnings: List[ValidationWarning] = []
-    
     if not text:
         return ValidationResult(is_valid=True, errors=[], warnings=[])
     
-    # Check for banned words
-    banned_check: BannedWordCheck = check_banned_words(text, language)
-    
-    if banned_check.has_banned_words:
-        for violation in banned_check.violations:
-            errors.append(ValidationError(
-                field="text",
-                message=f"Banned word '{violation.word}' found at position {violation.position}. "
-                        f"Suggestion: {violation.suggestion}"
-            ))
-    
+    errors = _banned_word_findings(text, language)
     return ValidationResult(
         is_valid=len(errors) == 0,
-        errors=errors,
-        warnings=warnings,
+        errors=list(errors),
+        warnings=[],
+    )
+
+
+@lru_cache(maxsize=512)
+def _banned_word_findings(
+    text: str,
+    language: SupportedLanguage
+) -> Tuple[ValidationError, ...]:
+    """Collect banned word errors for non-empty text, memoized per language.
+    
+    Args:
+        text: The text to check
+        language: The language for banned word checking
+        
+    Returns:
+        Tuple of errors, one per banned word occurrence
+    """
+    return tuple(
+        ValidationError(
+            field="text",
+            message=f"Banned word '{word}' found at position {position}. "
+                    f"Suggestion: {get_suggestion_for_word(word, language)}"
+        )
+        for word, position in _scan_text(text, language).banned_hits
+    )
+
+
+# Least recently used results of validate_artifact_comprehensive, keyed
+# by artifact type, artifact JSON, profile fields and language
+_COMPREHENSIVE_CACHE_SIZE = 256
+_comprehensive_cache: "OrderedDict[tuple, ValidationResult]" = OrderedDict()
+_comprehensive_cache_lock = threading.Lock()
+
+
+def _copy_result(result: ValidationResult) -> ValidationResult:
+    """Copy a result so callers cannot modify a cached one's lists."""
+    return ValidationResult(
+        is_valid=result.is_valid,
+        errors=list(result.errors),
+        warnings=list(result.warnings),
     )
 
 
@@ -480,34 +892,166 @@ def validate_artifact_comprehensive(
     Returns:
         Combined ValidationResult
     """
-    result = ValidationResult(is_valid=True, errors=[], warnings=[])
+    # Serialize once; the view is shared by all checks below
+    view = _ArtifactView(artifact)
     
-    # Get text representation for language checks
-    artifact_text = artifact.to_json()
+    # Results are pure, so an unchanged artifact validated against the
+    # same profile returns the previous result
+    cache_key = (
+        artifact.artifact_type,
+        view.json_text,
+        _profile_key(profile) if profile else None,
+        language,
+    )
+    with _comprehensive_cache_lock:
+        cached = _comprehensive_cache.get(cache_key)
+        if cached is not None:
+            _comprehensive_cache.move_to_end(cache_key)
+    if cached is not None:
+        return _copy_result(cached)
     
-    # For specific artifact types, get better text representation
-    if artifact.artifact_type == ArtifactType.JOB_AD:
-        job_ad: JobAd = artifact  # type: ignore
-        artifact_text = job_ad.to_text()
+    result = ValidationResult(is_valid=True, errors=[], warnings=[])
+    artifact_text = view.text
     
     # Language compliance check
     lang_result = validate_language_compliance(artifact_text, language)
-    result = result.merge(lang_result)
+    result._extend(lang_result)
     
     # Banned words check
     banned_result = validate_no_banned_words(artifact_text, language)
-    result = result.merge(banned_result)
+    result._extend(banned_result)
     
     # Profile-dependent checks
     if profile:
         # Profile alignment
         profile_result = validate_against_profile(artifact, profile)
-        result = result.merge(profile_result)
+        result._extend(profile_result)
         
         # Must-have visibility
-        must_have_result = validate_must_have_visibility(
-            artifact, profile.must_have_skills
+        must_have_result = _validate_must_have_visibility(
+            artifact, profile.must_have_skills, view
         )
-        result = result.merge(must_have_result)
+        result._extend(must_have_result)
+    
+    with _comprehensive_cache_lock:
+        _comprehensive_cache[cache_key] = _copy_result(result)
+        if len(_comprehensive_cache) > _COMPREHENSIVE_CACHE_SIZE:
+            _comprehensive_cache.popitem(last=False)
     
     return result
+
+
+def _validate_with_retry(
+    artifact: Artifact,
+    profile: Optional[RequirementProfile],
+    language: SupportedLanguage,
+    max_attempts: int,
+) -> Tuple[Optional[ValidationResult], int]:
+    """Validate one artifact, retrying on unexpected exceptions.
+    
+    Args:
+        artifact: The artifact to validate
+        profile: Optional requirement profile for alignment checks
+        language: The language for validation
+        max_attempts: Maximum number of attempts
+        
+    Returns:
+        Tuple of (result, or None if every attempt failed; number of retries)
+    """
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return validate_artifact_comprehensive(artifact, profile, language), attempt - 1
+        except Exception as e:
+            logger.warning(
+                f"Validation attempt {attempt}/{max_attempts} failed for "
+                f"{artifact.artifact_type.value}: {e}"
+            )
+    return None, max_attempts - 1
+
+
+def _result_to_record(index: int, artifact: Artifact, result: ValidationResult) -> str:
+    """Serialize a batch validation result as one JSON line."""
+    return json.dumps({
+        "index": index,
+        "artifact_type": artifact.artifact_type.value,
+        "is_valid": result.is_valid,
+        "errors": [
+            {"field": e.field, "message": e.message, "severity": e.severity}
+            for e in result.errors
+        ],
+        "warnings": [
+            {"field": w.field, "message": w.message}
+            for w in result.warnings
+        ],
+    })
+
+
+def validate_artifacts_batched(
+    artifacts: Sequence[Artifact],
+    profile: Optional[RequirementProfile] = None,
+    language: SupportedLanguage = SupportedLanguage.ENGLISH,
+    batch_size: int = 30,
+    workers: int = 5,
+    max_attempts: int = 3,
+    results_path: Optional[Union[str, Path]] = None,
+) -> List[Optional[ValidationResult]]:
+    """Validate many artifacts in parallel batches.
+    
+    Artifacts are validated with validate_artifact_comprehensive on a
+    thread pool, one batch at a time. When results_path is given, each
+    result is appended to that JSONL file as soon as it completes, so a
+    crash part way through keeps everything validated so far.
+    
+    Args:
+        artifacts: The artifacts to validate
+        profile: Optional requirement profile for alignment checks
+        language: The language for validation
+        batch_size: Number of artifacts submitted per batch
+        workers: Number of worker threads
+        max_attempts: Attempts per artifact before it is counted as failed
+        results_path: Optional JSONL file to append results to
+        
+    Returns:
+        Results in the same order as artifacts; None where validation failed
+    """
+    results: List[Optional[ValidationResult]] = [None] * len(artifacts)
+    stream = open(results_path, "a", encoding="utf-8") if results_path else None
+    
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for batch_start in range(0, len(artifacts), batch_size):
+                batch_end = min(batch_start + batch_size, len(artifacts))
+                failed = retried = succeeded = 0
+                
+                futures = {
+                    pool.submit(
+                        _validate_with_retry,
+                        artifacts[index], profile, language, max_attempts,
+                    ): index
+                    for index in range(batch_start, batch_end)
+                }
+                
+                for future in as_completed(futures):
+                    index = futures[future]
+                    result, retries = future.result()
+                    retried += retries
+                    
+                    if result is None:
+                        failed += 1
+                        continue
+                    
+                    succeeded += 1
+                    results[index] = result
+                    if stream:
+                        stream.write(_result_to_record(index, artifacts[index], result) + "\n")
+                        stream.flush()
+                
+                logger.info(
+                    f"Validated artifacts {batch_start}-{batch_end - 1}: "
+                    f"{succeeded} succeeded, {failed} failed, {retried} retried"
+                )
+    finally:
+        if stream:
+            stream.close()
+    
+    return results
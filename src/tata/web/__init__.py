@@ -4,7 +4,12 @@ This module provides a FastAPI-based web server for the chat interface,
 replacing the terminal-based interaction with a browser-based UI.
 """
 
-from src.tata.web.server import ChatServer, PortInUseError
+from src.tata.web.server import (
+    ChatServer,
+    PortInUseError,
+    bind_server_socket,
+    check_port_available,
+)
 from src.tata.web.models import (
     ChatRequestModel,
     ChatResponseModel,
@@ -16,6 +21,8 @@ from src.tata.web.models import (
 __all__ = [
     "ChatServer",
     "PortInUseError",
+    "bind_server_socket",
+    "check_port_available",
     "ChatRequestModel",
     "ChatResponseModel",
     "SessionInfoModel",
@@ -0,0 +1,29 @@
+"""Gunicorn configuration for running the Tata chat server in production.
+
+Run with:
+    gunicorn -c src/tata/web/gunicorn_conf.py "src.tata.web.server:create_app()"
+
+Each worker is a separate process with its own event loop, so the server
+can use more than one CPU core.
+"""
+
+import os
+
+
+# Worker processes. Agents cache their conversation history in each
+# worker's memory, so a session must keep hitting the same worker; raise
+# this (2 * cores + 1 is the usual rule) only behind sticky routing.
+workers = int(os.environ.get("TATA_WEB_WORKERS", "1"))
+# UvicornWorker uses loop="auto" and http="auto", which pick uvloop and
+# the C httptools parser when installed (the "prod" extra installs both)
+worker_class = "uvicorn.workers.UvicornWorker"
+bind = os.environ.get("TATA_WEB_BIND", "0.0.0.0:8080")
+
+# Each worker builds its own app. The SQLite managers open a connection
+# at start-up, and connections must not be shared across a fork.
+preload_app = False
+
+# Chat turns wait on the OpenAI API, so allow slow requests
+timeout = 120
+graceful_timeout = 30
+keepalive = 5
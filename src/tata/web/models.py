@@ -7,11 +7,26 @@ Requirements covered:
 - 5.1: Send message to Tata_Backend via HTTP POST
 """
 
+from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class ChatRequestModel(BaseModel):
+class ApiModel(BaseModel):
+    """Base class for web API models.
+    
+    Pins the configuration the endpoints rely on: unknown fields are
+    ignored rather than rejected, strings are passed through unchanged,
+    and attribute assignment is not revalidated.
+    """
+    model_config = ConfigDict(
+        extra="ignore",
+        str_strip_whitespace=False,
+        validate_assignment=False,
+    )
+
+
+class ChatRequestModel(ApiModel):
     """Request body for chat endpoint.
     
     Attributes:
@@ -22,7 +37,7 @@ class ChatRequestModel(BaseModel):
     message: str = Field(..., description="User's message text")
 
 
-class ChatResponseModel(BaseModel):
+class ChatResponseModel(ApiModel):
     """Response body from chat endpoint.
     
     Attributes:
@@ -38,22 +53,22 @@ class ChatResponseModel(BaseModel):
     )
 
 
-class SessionInfoModel(BaseModel):
+class SessionInfoModel(ApiModel):
     """Session information for API responses.
     
     Attributes:
         id: Session identifier
         position_name: Job position name (may be empty)
         language: Output language code
-        last_activity: ISO timestamp of last activity
+        last_activity: Time of last activity, sent as an ISO timestamp
     """
     id: str = Field(..., description="Session identifier")
     position_name: Optional[str] = Field(None, description="Job position name")
     language: str = Field(..., description="Output language code")
-    last_activity: str = Field(..., description="ISO timestamp of last activity")
+    last_activity: datetime = Field(..., description="ISO timestamp of last activity")
 
 
-class CreateSessionModel(BaseModel):
+class CreateSessionModel(ApiModel):
     """Request body for creating a session.
     
     Attributes:
@@ -66,7 +81,7 @@ class CreateSessionModel(BaseModel):
     language: str = Field(default="en", description="Language code (en, sv, da, no, de)")
 
 
-class SuggestionsResponseModel(BaseModel):
+class SuggestionsResponseModel(ApiModel):
     """Response body for suggestions endpoint.
     
     Attributes:
@@ -12,28 +12,49 @@ Requirements covered:
 - 5.1, 5.2, 5.3, 5.4: Chat API communication
 """
 
+import errno
+import gzip
+import hashlib
+import json
 import logging
+import os
 import socket
-from typing import Dict, List, Optional
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager, closing
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AsyncIterator, Generator, Iterator, List, Optional, Sequence
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.concurrency import iterate_in_threadpool, run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
+from fastapi.staticfiles import StaticFiles
+from pydantic import TypeAdapter
 
 from src.tata.agent.agent import TataAgent
-from src.tata.agent.client import RealOpenAIClient
+from src.tata.agent.client import OpenAIClient, RealOpenAIClient
 from src.tata.agent.registry import InMemoryToolRegistry
 from src.tata.agent.executor import ToolExecutor
 from src.tata.agent.conversation import InMemoryConversationManager
-from src.tata.persistence.sqlite import SQLiteSessionManager, SQLiteMemoryManager
+from src.tata.persistence.sqlite import (
+    DEFAULT_DB_PATH,
+    SQLiteConversationManager,
+    SQLiteMemoryManager,
+    SQLiteSessionManager,
+)
 from src.tata.session.session import (
+    CachedSessionManager,
+    Session,
     SessionManager,
     SupportedLanguage,
     SessionNotFoundError,
     EmptyRecruiterIDError,
     EmptySessionIDError,
 )
-from src.tata.memory.memory import MemoryManager
+from src.tata.memory.memory import InMemoryMemoryManager, MemoryManager
 from src.tata.web.models import (
     ChatRequestModel,
     ChatResponseModel,
@@ -48,1108 +69,163 @@ from src.tata.dependency.dependency import InMemoryDependencyManager
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Agents cached per session before the least recently used is dropped
+DEFAULT_MAX_AGENTS = 128
 
-# HTML template for the chat interface (Requirement 1.2)
-HTML_TEMPLATE = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Tata - Recruitment Assistant</title>
-    <style>
-        /* Base styles (Requirement 6.1: single-page layout, no external CSS) */
-        * {
-            box-sizing: border-box;
-            margin: 0;
-            padding: 0;
-        }
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background-color: #f5f5f5;
-            min-width: 800px; /* Requirement 6.2: responsive, 800px+ */
-            height: 100vh;
-            display: flex;
-            flex-direction: column;
-        }
-        
-        /* Header with session name (Requirement 6.4) */
-        header {
-            background-color: #2c3e50;
-            color: white;
-            padding: 1rem;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        header h1 {
-            font-size: 1.5rem;
-        }
-        #session-name {
-            color: #bdc3c7;
-        }
-        
-        /* Main chat container (Requirement 6.3: neutral color scheme) */
-        main {
-            flex: 1;
-            display: flex;
-            flex-direction: column;
-            max-width: 900px;
-            margin: 0 auto;
-            width: 100%;
-            padding: 1rem;
-            overflow: hidden;
-        }
-        
-        /* Message container (Requirement 3.2: chronological order) */
-        #messages {
-            flex: 1;
-            overflow-y: auto;
-            padding: 1rem;
-            background: white;
-            border-radius: 8px;
-            margin-bottom: 1rem;
-            display: flex;
-            flex-direction: column;
-        }
-        
-        /* Message styling (Requirement 3.1: distinct user vs Tata) */
-        .message {
-            margin-bottom: 1rem;
-            padding: 0.75rem 1rem;
-            border-radius: 8px;
-            max-width: 80%;
-            white-space: pre-wrap; /* Requirement 3.4: preserve whitespace */
-            word-wrap: break-word;
-        }
-        .message.user {
-            background-color: #3498db;
-            color: white;
-            margin-left: auto;
-        }
-        .message.assistant {
-            background-color: #ecf0f1;
-            color: #2c3e50;
-        }
-        .message.error {
-            background-color: #e74c3c;
-            color: white;
-        }
-        
-        /* Suggestion chips container (Requirement 7.1: below messages) */
-        #suggestions {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 0.5rem;
-            margin-bottom: 1rem;
-            min-height: 2.5rem;
-        }
-        
-        /* Suggestion chip styling (Requirement 7.1, 7.3) */
-        .suggestion-chip {
-            background-color: #3498db;
-            color: white;
-            border: none;
-            padding: 0.5rem 1rem;
-            border-radius: 20px;
-            cursor: pointer;
-            font-size: 0.875rem;
-            transition: background-color 0.2s;
-        }
-        .suggestion-chip:hover {
-            background-color: #2980b9;
-        }
-        
-        /* Input area (Requirement 2.1: textarea element) */
-        #input-area {
-            display: flex;
-            gap: 0.5rem;
-        }
-        #message-input {
-            flex: 1;
-            padding: 0.75rem;
-            border: 1px solid #bdc3c7;
-            border-radius: 8px;
-            resize: none;
-            font-family: inherit;
-            font-size: 1rem;
-        }
-        #message-input:focus {
-            outline: none;
-            border-color: #3498db;
-        }
-        #message-input:disabled {
-            background-color: #ecf0f1;
-            cursor: not-allowed;
-        }
-        #send-btn {
-            background-color: #3498db;
-            color: white;
-            border: none;
-            padding: 0.75rem 1.5rem;
-            border-radius: 8px;
-            cursor: pointer;
-            font-size: 1rem;
-        }
-        #send-btn:hover {
-            background-color: #2980b9;
-        }
-        #send-btn:disabled {
-            background-color: #bdc3c7;
-            cursor: not-allowed;
-        }
-        
-        /* Loading indicator (Requirement 3.5) */
-        .loading {
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-            color: #7f8c8d;
-            padding: 0.75rem;
-        }
-        .loading-dots {
-            display: flex;
-            gap: 0.25rem;
-        }
-        .loading-dots span {
-            width: 8px;
-            height: 8px;
-            background-color: #7f8c8d;
-            border-radius: 50%;
-            animation: blink 1.4s infinite both;
-        }
-        .loading-dots span:nth-child(2) { animation-delay: 0.2s; }
-        .loading-dots span:nth-child(3) { animation-delay: 0.4s; }
-        @keyframes blink {
-            0%, 80%, 100% { opacity: 0.3; }
-            40% { opacity: 1; }
-        }
-        
-        /* Session panel (Requirement 4.1, 4.2, 4.3, 4.4) */
-        aside {
-            position: fixed;
-            right: 0;
-            top: 0;
-            width: 320px;
-            height: 100vh;
-            background: white;
-            border-left: 1px solid #bdc3c7;
-            padding: 1rem;
-            transform: translateX(100%);
-            transition: transform 0.3s;
-            overflow-y: auto;
-            z-index: 100;
-        }
-        aside.open {
-            transform: translateX(0);
-        }
-        
-        /* Session panel toggle button */
-        #session-toggle {
-            background-color: #3498db;
-            color: white;
-            border: none;
-            padding: 0.5rem 1rem;
-            border-radius: 4px;
-            cursor: pointer;
-            font-size: 0.875rem;
-        }
-        #session-toggle:hover {
-            background-color: #2980b9;
-        }
-        
-        /* Session panel header */
-        .panel-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 1rem;
-            padding-bottom: 0.5rem;
-            border-bottom: 1px solid #ecf0f1;
-        }
-        .panel-header h2 {
-            font-size: 1.25rem;
-            color: #2c3e50;
-        }
-        #close-panel {
-            background: none;
-            border: none;
-            font-size: 1.5rem;
-            cursor: pointer;
-            color: #7f8c8d;
-        }
-        #close-panel:hover {
-            color: #2c3e50;
-        }
-        
-        /* New session form (Requirement 4.2) */
-        .new-session-form {
-            background-color: #f8f9fa;
-            padding: 1rem;
-            border-radius: 8px;
-            margin-bottom: 1rem;
-        }
-        .new-session-form h3 {
-            font-size: 1rem;
-            color: #2c3e50;
-            margin-bottom: 0.75rem;
-        }
-        .form-group {
-            margin-bottom: 0.75rem;
-        }
-        .form-group label {
-            display: block;
-            font-size: 0.875rem;
-            color: #7f8c8d;
-            margin-bottom: 0.25rem;
-        }
-        .form-group input,
-        .form-group select {
-            width: 100%;
-            padding: 0.5rem;
-            border: 1px solid #bdc3c7;
-            border-radius: 4px;
-            font-size: 0.875rem;
-        }
-        .form-group input:focus,
-        .form-group select:focus {
-            outline: none;
-            border-color: #3498db;
-        }
-        #create-session-btn {
-            width: 100%;
-            background-color: #27ae60;
-            color: white;
-            border: none;
-            padding: 0.5rem 1rem;
-            border-radius: 4px;
-            cursor: pointer;
-            font-size: 0.875rem;
-        }
-        #create-session-btn:hover {
-            background-color: #219a52;
-        }
-        #create-session-btn:disabled {
-            background-color: #bdc3c7;
-            cursor: not-allowed;
-        }
-        
-        /* Sessions list (Requirement 4.1, 4.4) */
-        .sessions-list h3 {
-            font-size: 1rem;
-            color: #2c3e50;
-            margin-bottom: 0.75rem;
-        }
-        .session-item {
-            background-color: #f8f9fa;
-            padding: 0.75rem;
-            border-radius: 8px;
-            margin-bottom: 0.5rem;
-            cursor: pointer;
-            border: 2px solid transparent;
-            transition: border-color 0.2s, background-color 0.2s;
-        }
-        .session-item:hover {
-            background-color: #ecf0f1;
-        }
-        .session-item.selected {
-            border-color: #3498db;
-            background-color: #ebf5fb;
-        }
-        .session-item .position-name {
-            font-weight: 500;
-            color: #2c3e50;
-            margin-bottom: 0.25rem;
-        }
-        .session-item .session-meta {
-            font-size: 0.75rem;
-            color: #7f8c8d;
-        }
-        .session-item .session-meta span {
-            margin-right: 0.5rem;
-        }
-        .no-sessions {
-            color: #7f8c8d;
-            font-size: 0.875rem;
-            text-align: center;
-            padding: 1rem;
-        }
-        
-        /* Loading state for sessions */
-        .sessions-loading {
-            text-align: center;
-            padding: 1rem;
-            color: #7f8c8d;
-        }
-    </style>
-</head>
-<body>
-    <!-- Header with session name (Requirement 6.4) -->
-    <header>
-        <h1>Tata</h1>
-        <div style="display: flex; align-items: center; gap: 1rem;">
-            <span id="session-name">No session selected</span>
-            <button id="session-toggle">Sessions</button>
-        </div>
-    </header>
+# Serializes GET /api/sessions bodies directly, so the ETag can be taken
+# from the exact bytes sent
+_SESSION_LIST_ADAPTER = TypeAdapter(List[SessionInfoModel])
+
+# Language codes accepted when creating a session
+_LANG_CODE_TO_ENUM = {language.value: language for language in SupportedLanguage}
+
+
+# Static assets for the chat interface (Requirement 1.2)
+STATIC_DIR = Path(__file__).parent / "static"
+INDEX_HTML_PATH = STATIC_DIR / "index.html"
+
+# Assets linked from the page, versioned by content hash so browsers can
+# cache them indefinitely
+ASSET_NAMES = ("styles.css", "app.js")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _built_asset(static_dir: Path, name: str) -> str:
+    """Pick the file to serve for an asset.
     
-    <!-- Main chat container (Requirement 6.1) -->
-    <main id="chat-container">
-        <!-- Message container (Requirement 3.2) -->
-        <div id="messages"></div>
-        
-        <!-- Suggestion chips container (Requirement 7.1) -->
-        <div id="suggestions"></div>
-        
-        <!-- Input area with textarea and send button (Requirement 2.1) -->
-        <div id="input-area">
-            <textarea id="message-input" placeholder="Type a message..." rows="2"></textarea>
-            <button id="send-btn">Send</button>
-        </div>
-    </main>
+    Prefers the minified build output (e.g. app.min.js written by
+    scripts/build_frontend.py) and falls back to the source file.
     
-    <!-- Session panel (Requirement 4.1, 4.2, 4.3, 4.4) -->
-    <aside id="session-panel">
-        <div class="panel-header">
-            <h2>Sessions</h2>
-            <button id="close-panel">&times;</button>
-        </div>
+    Args:
+        static_dir: Directory holding the assets
+        name: Source file name of the asset
         
-        <!-- New session form (Requirement 4.2) -->
-        <div class="new-session-form">
-            <h3>Create New Session</h3>
-            <div class="form-group">
-                <label for="position-name">Position Name</label>
-                <input type="text" id="position-name" placeholder="e.g., Senior Developer">
-            </div>
-            <div class="form-group">
-                <label for="language-select">Language</label>
-                <select id="language-select">
-                    <option value="en">English</option>
-                    <option value="sv">Swedish</option>
-                    <option value="da">Danish</option>
-                    <option value="no">Norwegian</option>
-                    <option value="de">German</option>
-                </select>
-            </div>
-            <button id="create-session-btn">Create Session</button>
-        </div>
-        
-        <!-- Sessions list (Requirement 4.1, 4.4) -->
-        <div class="sessions-list">
-            <h3>Your Sessions</h3>
-            <div id="sessions-container">
-                <div class="sessions-loading">Loading sessions...</div>
-            </div>
-        </div>
-    </aside>
+    Returns:
+        File name to serve, relative to static_dir
+    """
+    path = Path(name)
+    minified = f"{path.stem}.min{path.suffix}"
+    return minified if (static_dir / minified).exists() else name
+
+
+_ASSET_FILES = {name: _built_asset(STATIC_DIR, name) for name in ASSET_NAMES}
+_ASSET_VERSIONS = {
+    served: hashlib.md5((STATIC_DIR / served).read_bytes()).hexdigest()[:12]
+    for served in _ASSET_FILES.values()
+}
+
+
+def _versioned_html(html: str) -> str:
+    """Point the page's asset links at their built, content-hashed URLs.
     
-    <script>
-        /**
-         * InputHandler Module (Requirement 2.1, 2.3, 2.4, 2.5, 2.6)
-         * 
-         * Manages textarea input, keyboard events, and message submission.
-         * - Enter without Shift = submit (Requirement 2.3)
-         * - Shift+Enter = newline (Requirement 2.4)
-         * - Empty/whitespace validation (Requirement 2.5)
-         * - Clear after submission (Requirement 2.6)
-         */
-        const InputHandler = {
-            textarea: null,
-            sendButton: null,
-            onSubmit: null,
-            
-            /**
-             * Initialize the input handler.
-             * @param {string} textareaId - ID of the textarea element
-             * @param {string} buttonId - ID of the send button element
-             * @param {Function} submitCallback - Callback when message is submitted
-             */
-            init(textareaId, buttonId, submitCallback) {
-                this.textarea = document.getElementById(textareaId);
-                this.sendButton = document.getElementById(buttonId);
-                this.onSubmit = submitCallback;
-                
-                // Keyboard event handling (Requirement 2.3, 2.4)
-                this.textarea.addEventListener('keydown', (e) => this.handleKeyDown(e));
-                
-                // Button click handling
-                this.sendButton.addEventListener('click', () => this.submit());
-            },
-            
-            /**
-             * Handle keyboard events.
-             * Enter without Shift = submit (Requirement 2.3)
-             * Shift+Enter = newline (Requirement 2.4)
-             * @param {KeyboardEvent} event
-             */
-            handleKeyDown(event) {
-                if (event.key === 'Enter' && !event.shiftKey) {
-                    event.preventDefault();
-                    this.submit();
-                }
-                // Shift+Enter allows default behavior (newline)
-            },
-            
-            /**
-             * Submit the message.
-             * Validates non-empty content (Requirement 2.5)
-             * Clears input after submission (Requirement 2.6)
-             */
-            submit() {
-                const message = this.textarea.value;
-                
-                // Validate non-empty/non-whitespace (Requirement 2.5)
-                if (!message || message.trim() === '') {
-                    // Prevent submission, maintain focus
-                    this.textarea.focus();
-                    return;
-                }
-                
-                // Call submit callback
-                if (this.onSubmit) {
-                    this.onSubmit(message);
-                }
-                
-                // Clear input after submission (Requirement 2.6)
-                this.textarea.value = '';
-                this.textarea.focus();
-            },
-            
-            /**
-             * Populate the input field with text.
-             * Used by suggestion chips (Requirement 7.3, 7.4)
-             * @param {string} text - Text to populate
-             */
-            populate(text) {
-                this.textarea.value = text;
-                this.textarea.focus();
-                // Move cursor to end
-                this.textarea.selectionStart = this.textarea.selectionEnd = text.length;
-            },
-            
-            /**
-             * Enable or disable input.
-             * Used during processing (Requirement 5.5)
-             * @param {boolean} enabled
-             */
-            setEnabled(enabled) {
-                this.textarea.disabled = !enabled;
-                this.sendButton.disabled = !enabled;
-            },
-            
-            /**
-             * Get the current input value.
-             * @returns {string}
-             */
-            getValue() {
-                return this.textarea.value;
-            },
-            
-            /**
-             * Clear the input field.
-             */
-            clear() {
-                this.textarea.value = '';
-            }
-        };
-        
-        /**
-         * MessageDisplay Module (Requirement 3.1, 3.2, 3.3, 3.4, 3.5)
-         * 
-         * Renders messages and manages auto-scroll.
-         * - Distinct styling for user vs assistant (Requirement 3.1)
-         * - Chronological order (Requirement 3.2)
-         * - Auto-scroll to latest (Requirement 3.3)
-         * - Preserve whitespace (Requirement 3.4)
-         * - Loading indicator (Requirement 3.5)
-         */
-        const MessageDisplay = {
-            container: null,
-            loadingElement: null,
-            
-            /**
-             * Initialize the message display.
-             * @param {string} containerId - ID of the messages container
-             */
-            init(containerId) {
-                this.container = document.getElementById(containerId);
-            },
-            
-            /**
-             * Add a message to the display.
-             * Messages are added in chronological order (Requirement 3.2)
-             * Whitespace is preserved via CSS (Requirement 3.4)
-             * @param {string} content - Message content
-             * @param {boolean} isUser - True for user messages, false for assistant
-             */
-            addMessage(content, isUser) {
-                // Remove loading indicator if present
-                this.hideLoading();
-                
-                // Create message element (Requirement 3.1: distinct styling)
-                const messageEl = document.createElement('div');
-                messageEl.className = `message ${isUser ? 'user' : 'assistant'}`;
-                
-                // Set text content (preserves special characters)
-                // CSS white-space: pre-wrap handles whitespace (Requirement 3.4)
-                messageEl.textContent = content;
-                
-                // Add to container (chronological order - Requirement 3.2)
-                this.container.appendChild(messageEl);
-                
-                // Auto-scroll to latest message (Requirement 3.3)
-                this.scrollToBottom();
-            },
-            
-            /**
-             * Add an error message to the display.
-             * @param {string} content - Error message content
-             */
-            addError(content) {
-                this.hideLoading();
-                
-                const messageEl = document.createElement('div');
-                messageEl.className = 'message error';
-                messageEl.textContent = content;
-                
-                this.container.appendChild(messageEl);
-                this.scrollToBottom();
-            },
-            
-            /**
-             * Show loading indicator (Requirement 3.5)
-             */
-            showLoading() {
-                if (this.loadingElement) return;
-                
-                this.loadingElement = document.createElement('div');
-                this.loadingElement.className = 'loading';
-                this.loadingElement.innerHTML = `
-                    <span>Tata is thinking</span>
-                    <div class="loading-dots">
-                        <span></span>
-                        <span></span>
-                        <span></span>
-                    </div>
-                `;
-                
-                this.container.appendChild(this.loadingElement);
-                this.scrollToBottom();
-            },
-            
-            /**
-             * Hide loading indicator.
-             */
-            hideLoading() {
-                if (this.loadingElement) {
-                    this.loadingElement.remove();
-                    this.loadingElement = null;
-                }
-            },
-            
-            /**
-             * Scroll to the bottom of the message container.
-             */
-            scrollToBottom() {
-                this.container.scrollTop = this.container.scrollHeight;
-            },
-            
-            /**
-             * Clear all messages.
-             */
-            clear() {
-                this.container.innerHTML = '';
-                this.loadingElement = null;
-            }
-        };
-        
-        /**
-         * SuggestionChips Module (Requirement 7.1, 7.3, 7.4, 7.6)
-         * 
-         * Displays context-aware suggestions based on session state.
-         * - Render chips from backend response (Requirement 7.1)
-         * - Populate input on click (Requirement 7.3)
-         * - Allow editing before submit (Requirement 7.4)
-         * - Update after each response (Requirement 7.6)
-         */
-        const SuggestionChips = {
-            container: null,
-            inputHandler: null,
-            
-            /**
-             * Initialize the suggestion chips module.
-             * @param {string} containerId - ID of the suggestions container
-             * @param {Object} inputHandler - Reference to InputHandler module
-             */
-            init(containerId, inputHandler) {
-                this.container = document.getElementById(containerId);
-                this.inputHandler = inputHandler;
-            },
-            
-            /**
-             * Update suggestion chips from backend response.
-             * Called after each Tata response (Requirement 7.6)
-             * @param {string[]} suggestions - Array of suggestion strings
-             */
-            update(suggestions) {
-                this.render(suggestions);
-            },
-            
-            /**
-             * Render suggestion chips.
-             * @param {string[]} suggestions - Array of suggestion strings
-             */
-            render(suggestions) {
-                // Clear existing chips
-                this.container.innerHTML = '';
-                
-                if (!suggestions || suggestions.length === 0) {
-                    return;
-                }
-                
-                // Create chip for each suggestion
-                suggestions.forEach(suggestion => {
-                    const chip = document.createElement('button');
-                    chip.className = 'suggestion-chip';
-                    chip.textContent = suggestion;
-                    chip.addEventListener('click', () => this.handleClick(suggestion));
-                    this.container.appendChild(chip);
-                });
-            },
-            
-            /**
-             * Handle chip click.
-             * Populates input with suggestion text (Requirement 7.3)
-             * User can edit before submitting (Requirement 7.4)
-             * @param {string} suggestion - The suggestion text
-             */
-            handleClick(suggestion) {
-                if (this.inputHandler) {
-                    this.inputHandler.populate(suggestion);
-                }
-            },
-            
-            /**
-             * Clear all suggestion chips.
-             */
-            clear() {
-                this.container.innerHTML = '';
-            }
-        };
+    Args:
+        html: Page markup linking to /static/<name>
         
-        /**
-         * ApiClient Module
-         * 
-         * Handles HTTP communication with backend.
-         * To be fully implemented in task 6.3
-         */
-        const ApiClient = {
-            baseUrl: '',
-            
-            /**
-             * Send a chat message to the backend.
-             * @param {string} sessionId - Session identifier
-             * @param {string} message - User message
-             * @returns {Promise<Object>} Response with response/error and suggestions
-             */
-            async sendMessage(sessionId, message) {
-                const response = await fetch(`${this.baseUrl}/api/chat`, {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                    },
-                    body: JSON.stringify({
-                        session_id: sessionId,
-                        message: message,
-                    }),
-                });
-                
-                if (!response.ok) {
-                    const error = await response.json();
-                    throw new Error(error.detail || 'Request failed');
-                }
-                
-                return response.json();
-            },
-            
-            /**
-             * Get sessions for a recruiter.
-             * @param {string} recruiterId - Recruiter identifier
-             * @returns {Promise<Object[]>} Array of session objects
-             */
-            async getSessions(recruiterId) {
-                const response = await fetch(
-                    `${this.baseUrl}/api/sessions?recruiter_id=${encodeURIComponent(recruiterId)}`
-                );
-                
-                if (!response.ok) {
-                    throw new Error('Failed to fetch sessions');
-                }
-                
-                return response.json();
-            },
-            
-            /**
-             * Create a new session.
-             * @param {string} recruiterId - Recruiter identifier
-             * @param {string} positionName - Position name
-             * @param {string} language - Language code
-             * @returns {Promise<Object>} Created session object
-             */
-            async createSession(recruiterId, positionName, language = 'en') {
-                const response = await fetch(`${this.baseUrl}/api/sessions`, {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                    },
-                    body: JSON.stringify({
-                        recruiter_id: recruiterId,
-                        position_name: positionName,
-                        language: language,
-                    }),
-                });
-                
-                if (!response.ok) {
-                    throw new Error('Failed to create session');
-                }
-                
-                return response.json();
-            }
-        };
+    Returns:
+        Markup linking to /static/<served name>?v=<hash>
+    """
+    for name, served in _ASSET_FILES.items():
+        version = _ASSET_VERSIONS[served]
+        html = html.replace(f'"/static/{name}"', f'"/static/{served}?v={version}"')
+    return html
+
+
+def _is_current_asset_url(path: str, version: Optional[str]) -> bool:
+    """Check whether a static URL carries the current hash of its asset.
+    
+    Args:
+        path: Request path
+        version: Value of the ``v`` query parameter, if any
         
-        /**
-         * SessionSelector Module (Requirement 4.1, 4.2, 4.3, 4.4)
-         * 
-         * Manages session list and creation.
-         * - Load and display sessions list (Requirement 4.1)
-         * - Create new session form (Requirement 4.2)
-         * - Session selection handling (Requirement 4.3)
-         * - Display session metadata (Requirement 4.4)
-         */
-        const SessionSelector = {
-            panel: null,
-            container: null,
-            currentSession: null,
-            onSessionSelect: null,
-            
-            /**
-             * Initialize the session selector.
-             * @param {string} panelId - ID of the session panel element
-             * @param {string} containerId - ID of the sessions container element
-             * @param {Function} selectCallback - Callback when session is selected
-             */
-            init(panelId, containerId, selectCallback) {
-                this.panel = document.getElementById(panelId);
-                this.container = document.getElementById(containerId);
-                this.onSessionSelect = selectCallback;
-                
-                // Set up panel toggle
-                const toggleBtn = document.getElementById('session-toggle');
-                const closeBtn = document.getElementById('close-panel');
-                
-                toggleBtn.addEventListener('click', () => this.openPanel());
-                closeBtn.addEventListener('click', () => this.closePanel());
-                
-                // Set up create session form
-                const createBtn = document.getElementById('create-session-btn');
-                const positionInput = document.getElementById('position-name');
-                
-                createBtn.addEventListener('click', () => this.handleCreateSession());
-                
-                // Allow Enter key to submit form
-                positionInput.addEventListener('keydown', (e) => {
-                    if (e.key === 'Enter') {
-                        e.preventDefault();
-                        this.handleCreateSession();
-                    }
-                });
-            },
-            
-            /**
-             * Open the session panel.
-             */
-            openPanel() {
-                this.panel.classList.add('open');
-            },
-            
-            /**
-             * Close the session panel.
-             */
-            closePanel() {
-                this.panel.classList.remove('open');
-            },
-            
-            /**
-             * Load and display sessions for a recruiter.
-             * Requirement 4.1: Display existing sessions when interface loads.
-             * @param {string} recruiterId - Recruiter identifier
-             */
-            async loadSessions(recruiterId) {
-                this.container.innerHTML = '<div class="sessions-loading">Loading sessions...</div>';
-                
-                try {
-                    const sessions = await ApiClient.getSessions(recruiterId);
-                    this.renderSessions(sessions);
-                } catch (error) {
-                    console.error('Failed to load sessions:', error);
-                    this.container.innerHTML = '<div class="no-sessions">Failed to load sessions. Please try again.</div>';
-                }
-            },
-            
-            /**
-             * Render the sessions list.
-             * Requirement 4.4: Display session metadata (position name, language, last activity).
-             * @param {Object[]} sessions - Array of session objects
-             */
-            renderSessions(sessions) {
-                if (!sessions || sessions.length === 0) {
-                    this.container.innerHTML = '<div class="no-sessions">No sessions yet. Create one above!</div>';
-                    return;
-                }
-                
-                this.container.innerHTML = '';
-                
-                // Sort sessions by last activity (most recent first)
-                const sortedSessions = [...sessions].sort((a, b) => 
-                    new Date(b.last_activity) - new Date(a.last_activity)
-                );
-                
-                sortedSessions.forEach(session => {
-                    const item = document.createElement('div');
-                    item.className = 'session-item';
-                    if (this.currentSession && this.currentSession.id === session.id) {
-                        item.classList.add('selected');
-                    }
-                    
-                    // Format last activity date
-                    const lastActivity = new Date(session.last_activity);
-                    const formattedDate = this.formatDate(lastActivity);
-                    
-                    // Get language display name
-                    const languageNames = {
-                        'en': 'English',
-                        'sv': 'Swedish',
-                        'da': 'Danish',
-                        'no': 'Norwegian',
-                        'de': 'German'
-                    };
-                    const languageDisplay = languageNames[session.language] || session.language;
-                    
-                    // Requirement 4.4: Display position name, language, last activity
-                    item.innerHTML = `
-                        <div class="position-name">${session.position_name || 'Untitled Position'}</div>
-                        <div class="session-meta">
-                            <span>${languageDisplay}</span>
-                            <span>•</span>
-                            <span>${formattedDate}</span>
-                        </div>
-                    `;
-                    
-                    item.addEventListener('click', () => this.selectSession(session));
-                    this.container.appendChild(item);
-                });
-            },
-            
-            /**
-             * Format a date for display.
-             * @param {Date} date - Date to format
-             * @returns {string} Formatted date string
-             */
-            formatDate(date) {
-                const now = new Date();
-                const diffMs = now - date;
-                const diffMins = Math.floor(diffMs / 60000);
-                const diffHours = Math.floor(diffMs / 3600000);
-                const diffDays = Math.floor(diffMs / 86400000);
-                
-                if (diffMins < 1) return 'Just now';
-                if (diffMins < 60) return `${diffMins}m ago`;
-                if (diffHours < 24) return `${diffHours}h ago`;
-                if (diffDays < 7) return `${diffDays}d ago`;
-                
-                return date.toLocaleDateString();
-            },
-            
-            /**
-             * Handle create session button click.
-             * Requirement 4.2: Create new session with position name and language.
-             */
-            async handleCreateSession() {
-                const positionInput = document.getElementById('position-name');
-                const languageSelect = document.getElementById('language-select');
-                const createBtn = document.getElementById('create-session-btn');
-                
-                const positionName = positionInput.value.trim();
-                const language = languageSelect.value;
-                
-                if (!positionName) {
-                    positionInput.focus();
-                    return;
-                }
-                
-                // Disable button during creation
-                createBtn.disabled = true;
-                createBtn.textContent = 'Creating...';
-                
-                try {
-                    const session = await ApiClient.createSession(
-                        AppState.recruiterId,
-                        positionName,
-                        language
-                    );
-                    
-                    // Clear form
-                    positionInput.value = '';
-                    languageSelect.value = 'en';
-                    
-                    // Reload sessions list
-                    await this.loadSessions(AppState.recruiterId);
-                    
-                    // Select the new session
-                    this.selectSession(session);
-                    
-                } catch (error) {
-                    console.error('Failed to create session:', error);
-                    alert('Failed to create session. Please try again.');
-                } finally {
-                    createBtn.disabled = false;
-                    createBtn.textContent = 'Create Session';
-                }
-            },
-            
-            /**
-             * Select a session.
-             * Requirement 4.3: Load session context when selected.
-             * @param {Object} session - Session object to select
-             */
-            selectSession(session) {
-                this.currentSession = session;
-                
-                // Update UI to show selected session
-                const items = this.container.querySelectorAll('.session-item');
-                items.forEach(item => item.classList.remove('selected'));
-                
-                // Find and highlight the selected item
-                const selectedItem = Array.from(items).find(item => {
-                    const positionName = item.querySelector('.position-name').textContent;
-                    return positionName === (session.position_name || 'Untitled Position');
-                });
-                if (selectedItem) {
-                    selectedItem.classList.add('selected');
-                }
-                
-                // Update header with session name (Requirement 6.4)
-                const sessionNameEl = document.getElementById('session-name');
-                sessionNameEl.textContent = session.position_name || 'Untitled Position';
-                
-                // Close panel after selection
-                this.closePanel();
-                
-                // Call the selection callback
-                if (this.onSessionSelect) {
-                    this.onSessionSelect(session);
-                }
-            },
-            
-            /**
-             * Get the currently selected session.
-             * @returns {Object|null} Current session or null
-             */
-            getCurrentSession() {
-                return this.currentSession;
-            }
-        };
+    Returns:
+        True if the URL names an asset at its current version
+    """
+    name = path.removeprefix("/static/")
+    return version is not None and _ASSET_VERSIONS.get(name) == version
+
+
+# The page never changes at runtime, so it is rendered and compressed once
+# at import rather than on every page load
+_HTML = _versioned_html(INDEX_HTML_PATH.read_text(encoding="utf-8"))
+_HTML_BYTES = _HTML.encode("utf-8")
+_HTML_GZIP = gzip.compress(_HTML_BYTES, compresslevel=9, mtime=0)
+_HTML_ETAG = f'"{hashlib.md5(_HTML_BYTES).hexdigest()}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether a request's If-None-Match already names an ETag.
+    
+    Uses the weak comparison If-None-Match calls for, so ``W/`` prefixes
+    on either side are ignored.
+    
+    Args:
+        request: The incoming request
+        etag: The current ETag of the resource
         
-        /**
-         * Application State
-         */
-        const AppState = {
-            currentSession: null,
-            recruiterId: 'default',
-            isProcessing: false
-        };
+    Returns:
+        True if the client's copy is current and a 304 can be sent
+    """
+    if_none_match = request.headers.get("if-none-match", "")
+    if if_none_match == "*":
+        return True
+    current = etag.removeprefix("W/")
+    return current in (
+        tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+    )
+
+
+def _html_page_response(request: Request) -> Response:
+    """Build the response for the chat page.
+    
+    Returns 304 when the client already has the current page, and the
+    pre-compressed page when the client accepts gzip.
+    
+    Args:
+        request: The incoming request
         
-        /**
-         * Main application initialization
-         */
-        async function initApp() {
-            // Initialize modules
-            MessageDisplay.init('messages');
-            
-            InputHandler.init('message-input', 'send-btn', async (message) => {
-                if (AppState.isProcessing) return;
-                
-                // Check if session is selected
-                if (!AppState.currentSession) {
-                    MessageDisplay.addError('Please select or create a session first.');
-                    return;
-                }
-                
-                // Display user message
-                MessageDisplay.addMessage(message, true);
-                
-                // Disable input during processing
-                AppState.isProcessing = true;
-                InputHandler.setEnabled(false);
-                MessageDisplay.showLoading();
-                
-                try {
-                    // Send message to backend
-                    const result = await ApiClient.sendMessage(
-                        AppState.currentSession.id,
-                        message
-                    );
-                    
-                    if (result.error) {
-                        MessageDisplay.addError(result.error);
-                    } else {
-                        MessageDisplay.addMessage(result.response, false);
-                    }
-                    
-                    // Update suggestion chips (Requirement 7.6)
-                    SuggestionChips.update(result.suggestions || []);
-                    
-                } catch (error) {
-                    MessageDisplay.addError(
-                        'Unable to connect to Tata. Please check your connection.'
-                    );
-                } finally {
-                    AppState.isProcessing = false;
-                    InputHandler.setEnabled(true);
-                    MessageDisplay.hideLoading();
-                }
-            });
-            
-            SuggestionChips.init('suggestions', InputHandler);
-            
-            // Initialize SessionSelector (Requirement 4.1, 4.2, 4.3, 4.4)
-            SessionSelector.init('session-panel', 'sessions-container', (session) => {
-                // Update AppState when session is selected (Requirement 4.3)
-                AppState.currentSession = session;
-                
-                // Clear messages when switching sessions
-                MessageDisplay.clear();
-                SuggestionChips.clear();
-                
-                // Show welcome message for the session
-                MessageDisplay.addMessage(
-                    `Session loaded: ${session.position_name || 'Untitled Position'}. How can I help you today?`,
-                    false
-                );
-            });
-            
-            // Load existing sessions (Requirement 4.1)
-            await SessionSelector.loadSessions(AppState.recruiterId);
-            
-            console.log('Tata chat interface initialized');
-        }
+    Returns:
+        Response for the chat page
+    """
+    headers = {
+        "ETag": _HTML_ETAG,
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+    }
+    
+    if _etag_matches(request, _HTML_ETAG):
+        return Response(status_code=304, headers=headers)
+    
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=_HTML_GZIP, media_type="text/html", headers=headers)
+    
+    return Response(content=_HTML_BYTES, media_type="text/html", headers=headers)
+
+
+@dataclass(frozen=True)
+class _AgentEntry:
+    """A cached agent and the lock that serializes its chat turns.
+    
+    Attributes:
+        agent: TataAgent for one session
+        turn_lock: Held for a whole chat turn, so concurrent requests for
+                   the session cannot interleave their messages
+    """
+    
+    agent: TataAgent
+    turn_lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def _sse_event(data: dict) -> str:
+    """Format a payload as a Server-Sent Events message.
+    
+    Args:
+        data: JSON-serializable payload
         
-        // Initialize when DOM is ready
-        document.addEventListener('DOMContentLoaded', initApp);
-    </script>
-</body>
-</html>
-"""
+    Returns:
+        A single ``data:`` event terminated by a blank line
+    """
+    return f"data: {json.dumps(data)}\n\n"
 
 
 class PortInUseError(Exception):
@@ -1157,6 +233,83 @@ class PortInUseError(Exception):
     pass
 
 
+async def _close_when_done(events: Generator[str, None, None]) -> AsyncIterator[str]:
+    """Iterate a sync event generator in the threadpool, then close it.
+    
+    StreamingResponse stops reading when the client disconnects but never
+    closes a sync iterator, so its cleanup would wait for garbage
+    collection. Closing here ends the turn as soon as the response does.
+    
+    Args:
+        events: Generator producing SSE-formatted events
+        
+    Yields:
+        The generator's events
+    """
+    try:
+        async for event in iterate_in_threadpool(events):
+            yield event
+    finally:
+        events.close()
+
+
+def bind_server_socket(
+    port: int, host: str = "127.0.0.1", backlog: int = 128
+) -> socket.socket:
+    """Bind and listen on the socket the server will accept connections on.
+    
+    Serving from this socket, rather than checking the port and letting
+    the server bind it again, leaves no window for another process to
+    take the port in between.
+    
+    Args:
+        port: Port to bind
+        host: Interface to bind on
+        backlog: Listen queue length
+        
+    Returns:
+        A bound, listening socket owned by the caller
+        
+    Raises:
+        PortInUseError: If the port is already in use
+        OSError: If binding fails for any other reason
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    # Lets a restart bind over connections still in TIME_WAIT. On Windows
+    # the option would allow binding over a live listener, so skip it there.
+    if os.name != "nt":
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    try:
+        sock.bind((host, port))
+        sock.listen(backlog)
+    except OSError as e:
+        sock.close()
+        if e.errno != errno.EADDRINUSE:
+            raise
+        raise PortInUseError(
+            f"Error: Port {port} is already in use. "
+            f"Please choose a different port or stop the process using port {port}."
+        ) from e
+    return sock
+
+
+def check_port_available(port: int, host: str = "127.0.0.1") -> None:
+    """Check that a port can be bound, once, before the server starts.
+    
+    For launchers that hand the port to another process, such as
+    gunicorn; ChatServer.run binds its own socket instead. Workers
+    started by a process manager must not repeat the check.
+    
+    Args:
+        port: Port to test
+        host: Interface to test on
+        
+    Raises:
+        PortInUseError: If the port is already in use
+    """
+    bind_server_socket(port, host).close()
+
+
 class ChatServer:
     """FastAPI-based web server for Tata chat interface.
     
@@ -1167,7 +320,9 @@ class ChatServer:
         app: FastAPI application instance
         session_manager: SessionManager for persistence
         memory_manager: MemoryManager for artifacts
-        agents: Dict mapping session_id to TataAgent instances
+        agents: LRU map of session_id to its agent entry, at most
+                max_agents long
+        tool_registry: ToolRegistry shared by all agents
         port: Server port (default 8080)
     """
     
@@ -1176,6 +331,11 @@ class ChatServer:
         port: int = 8080,
         session_manager: Optional[SessionManager] = None,
         memory_manager: Optional[MemoryManager] = None,
+        openai_client: Optional[OpenAIClient] = None,
+        ephemeral_memory: bool = False,
+        cors_origins: Optional[Sequence[str]] = None,
+        max_agents: int = DEFAULT_MAX_AGENTS,
+        db_path: Path = DEFAULT_DB_PATH,
     ) -> None:
         """Initialize the chat server.
         
@@ -1185,11 +345,46 @@ class ChatServer:
                            Defaults to SQLiteSessionManager.
             memory_manager: Optional MemoryManager instance.
                           Defaults to SQLiteMemoryManager.
+            openai_client: Optional OpenAIClient shared by all agents.
+                         Defaults to a RealOpenAIClient created on first use.
+            ephemeral_memory: Keep artifacts in process memory instead of
+                            SQLite when no memory_manager is given. Artifacts
+                            are then lost on restart. Conversations are
+                            stored in SQLite only alongside SQLite artifacts.
+            cors_origins: Origins allowed to call the API cross-origin.
+                        Defaults to none; the bundled page is same-origin.
+            max_agents: Most agents kept in memory. The least recently used
+                      agent is dropped beyond this; its conversation history
+                      is lost unless conversations are stored (default 128).
+            db_path: SQLite database for the default session, artifact and
+                   conversation stores (default tata.db)
         """
         self.port = port
-        self.session_manager = session_manager or SQLiteSessionManager()
-        self.memory_manager = memory_manager or SQLiteMemoryManager()
-        self.agents: Dict[str, TataAgent] = {}
+        # Panels and chat turns re-read the same sessions, so cache reads
+        self.session_manager = CachedSessionManager(
+            session_manager or SQLiteSessionManager(db_path)
+        )
+        # Conversations persist only when artifacts default to SQLite, so a
+        # restored history never refers to artifacts that were lost
+        self._persist_conversations = memory_manager is None and not ephemeral_memory
+        self._db_path = db_path
+        if memory_manager is None:
+            memory_manager = (
+                InMemoryMemoryManager() if ephemeral_memory else SQLiteMemoryManager(db_path)
+            )
+        self.memory_manager = memory_manager
+        # Each agent holds a full conversation, so keep only recent sessions
+        self.agents: OrderedDict[str, _AgentEntry] = OrderedDict()
+        self._max_agents = max_agents
+        self._agents_lock = threading.Lock()
+        
+        # One OpenAI client for all agents, so chat turns reuse pooled
+        # connections instead of opening a new pool per session
+        self._openai_client = openai_client
+        self._openai_client_lock = threading.Lock()
+        
+        # Tool definitions are fixed, so one registry serves every agent
+        self.tool_registry = InMemoryToolRegistry()
         
         # Initialize dependency manager and suggestion service
         self.dependency_manager = InMemoryDependencyManager(self.memory_manager)
@@ -1203,27 +398,65 @@ class ChatServer:
             title="Tata - Recruitment Assistant",
             description="Web-based chat interface for Tata",
             version="0.1.0",
+            lifespan=self._lifespan,
         )
         
-        # Configure CORS for local development
-        self.app.add_middleware(
-            CORSMiddleware,
-            allow_origins=["*"],  # Allow all origins for local dev
-            allow_credentials=True,
-            allow_methods=["*"],
-            allow_headers=["*"],
-        )
+        # The page is served from this app, so same-origin requests need no
+        # CORS handling; only add it when other origins must call the API
+        if cors_origins:
+            self.app.add_middleware(
+                CORSMiddleware,
+                allow_origins=list(cors_origins),
+                allow_methods=["*"],
+                allow_headers=["*"],
+            )
+        
+        # Compress scripts, styles and API payloads for clients that accept it
+        self.app.add_middleware(GZipMiddleware, minimum_size=1024)
+        
+        # Cache hashed static assets for a year; their URL changes with content
+        @self.app.middleware("http")
+        async def cache_static_assets(request: Request, call_next):
+            response = await call_next(request)
+            if response.status_code == 200 and _is_current_asset_url(
+                request.url.path, request.query_params.get("v")
+            ):
+                response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+            return response
         
         # Register routes
         self._register_routes()
+        self.app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
+    
+    @asynccontextmanager
+    async def _lifespan(self, app: FastAPI) -> AsyncIterator[None]:
+        """Release the shared OpenAI client when the app shuts down."""
+        yield
+        close = getattr(self._openai_client, "close", None)
+        if close is not None:
+            close()
+    
+    def _get_openai_client(self) -> OpenAIClient:
+        """Return the shared OpenAI client, creating it on first use.
+        
+        Returns:
+            OpenAIClient used by every agent
+            
+        Raises:
+            ValueError: If no OpenAI API key is configured
+        """
+        with self._openai_client_lock:
+            if self._openai_client is None:
+                self._openai_client = RealOpenAIClient(model="gpt-4o")
+            return self._openai_client
     
     def _register_routes(self) -> None:
         """Register API routes on the FastAPI app."""
         
         @self.app.get("/", response_class=HTMLResponse)
-        async def serve_chat_page() -> str:
+        async def serve_chat_page(request: Request) -> Response:
             """Serve the chat HTML page (Requirement 1.2)."""
-            return HTML_TEMPLATE
+            return _html_page_response(request)
         
         @self.app.post("/api/chat", response_model=ChatResponseModel)
         async def chat(request: ChatRequestModel) -> ChatResponseModel:
@@ -1246,7 +479,9 @@ class ChatServer:
                 ChatResponseModel with response or error and suggestions
             """
             # Validate session exists
-            session = self.session_manager.get_session(request.session_id)
+            session = await run_in_threadpool(
+                self.session_manager.get_session, request.session_id
+            )
             if session is None:
                 raise HTTPException(
                     status_code=404,
@@ -1254,23 +489,34 @@ class ChatServer:
                 )
             
             # Get suggestions for the session (Requirement 7.1, 7.6)
-            suggestions = self.suggestion_service.get_suggestions(request.session_id)
+            suggestions = await run_in_threadpool(
+                self.suggestion_service.get_suggestions, request.session_id
+            )
             
             # Get or create agent for session
-            agent = self.get_or_create_agent(request.session_id)
-            if agent is None:
+            entry = await run_in_threadpool(self._get_or_create_entry, request.session_id)
+            if entry is None:
                 # This shouldn't happen since we validated session exists above
                 return ChatResponseModel(
                     error="Failed to initialize agent for session.",
                     suggestions=suggestions
                 )
             
+            def run_turn() -> str:
+                # One turn per session at a time, so a second request for
+                # the session waits instead of interleaving its messages
+                with entry.turn_lock:
+                    return entry.agent.chat(request.message)
+            
             try:
-                # Process message through agent (Requirement 5.2)
-                response = agent.chat(request.message)
+                # Process message through agent (Requirement 5.2); the
+                # OpenAI call blocks, so keep it off the event loop
+                response = await run_in_threadpool(run_turn)
                 
                 # Get updated suggestions after processing (Requirement 7.6)
-                suggestions = self.suggestion_service.get_suggestions(request.session_id)
+                suggestions = await run_in_threadpool(
+                    self.suggestion_service.get_suggestions, request.session_id
+                )
                 
                 # Return successful response (Requirement 5.3)
                 return ChatResponseModel(
@@ -1285,34 +531,108 @@ class ChatServer:
                     suggestions=suggestions
                 )
         
+        @self.app.post("/api/chat/stream")
+        async def chat_stream(request: ChatRequestModel) -> StreamingResponse:
+            """Process a chat message and stream the response as SSE.
+            
+            Sends ``{"delta": ...}`` events as response text arrives,
+            followed by one ``{"done": true, "suggestions": [...]}`` event.
+            Failures are reported as an ``{"error": ...}`` event before
+            the final one.
+            
+            Args:
+                request: ChatRequestModel with session_id and message
+                
+            Returns:
+                StreamingResponse with text/event-stream content
+            """
+            session = await run_in_threadpool(
+                self.session_manager.get_session, request.session_id
+            )
+            if session is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail="Session not found"
+                )
+            
+            entry = await run_in_threadpool(self._get_or_create_entry, request.session_id)
+            
+            # Sync generator, iterated in the threadpool by _close_when_done
+            def events() -> Iterator[str]:
+                if entry is None:
+                    yield _sse_event({"error": "Failed to initialize agent for session."})
+                else:
+                    # Held until the stream ends or is closed, so turns for
+                    # the session do not interleave; threading.Lock may be
+                    # released from whichever threadpool thread gets there
+                    with entry.turn_lock, closing(
+                        entry.agent.chat_stream(request.message)
+                    ) as deltas:
+                        try:
+                            for delta in deltas:
+                                yield _sse_event({"delta": delta})
+                        except Exception as e:
+                            logger.error(
+                                f"Chat stream error for session {request.session_id}: {e}",
+                                exc_info=True,
+                            )
+                            yield _sse_event({
+                                "error": "An error occurred while processing your message. Please try again."
+                            })
+                
+                suggestions = self.suggestion_service.get_suggestions(request.session_id)
+                yield _sse_event({"done": True, "suggestions": suggestions})
+            
+            return StreamingResponse(
+                _close_when_done(events()),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache"},
+            )
+        
         @self.app.get("/api/sessions", response_model=List[SessionInfoModel])
-        async def list_sessions(recruiter_id: str = Query(..., description="Recruiter identifier")) -> List[SessionInfoModel]:
+        async def list_sessions(
+            request: Request,
+            recruiter_id: str = Query(..., description="Recruiter identifier"),
+        ) -> Response:
             """List all sessions for a recruiter.
             
             Requirement 4.1: Display existing sessions for the current recruiter.
             
+            The list carries an ETag, so reopening the session panel with an
+            unchanged list costs a 304 instead of resending every session.
+            
             Args:
+                request: The incoming request
                 recruiter_id: The recruiter's identifier
                 
             Returns:
-                List of SessionInfoModel objects
+                JSON list of SessionInfoModel objects, or 304 if unchanged
             """
             try:
-                sessions = self.session_manager.list_sessions(recruiter_id)
-                return [
-                    SessionInfoModel(
-                        id=s.id,
-                        position_name=s.position_name if s.position_name else None,
-                        language=s.language.value,
-                        last_activity=s.last_activity.isoformat()
-                    )
-                    for s in sessions
-                ]
+                sessions = await run_in_threadpool(
+                    self.session_manager.list_sessions, recruiter_id
+                )
             except EmptyRecruiterIDError:
                 raise HTTPException(
                     status_code=400,
                     detail="Recruiter ID is required"
                 )
+            
+            body = _SESSION_LIST_ADAPTER.dump_json([
+                SessionInfoModel(
+                    id=s.id,
+                    position_name=s.position_name if s.position_name else None,
+                    language=s.language.value,
+                    last_activity=s.last_activity
+                )
+                for s in sessions
+            ])
+            # Weak, since GZipMiddleware may re-encode the body
+            etag = f'W/"{hashlib.md5(body).hexdigest()}"'
+            headers = {"ETag": etag, "Cache-Control": "no-cache"}
+            if _etag_matches(request, etag):
+                return Response(status_code=304, headers=headers)
+            return Response(content=body, media_type="application/json", headers=headers)
         
         @self.app.post("/api/sessions", response_model=SessionInfoModel, status_code=201)
         async def create_session(request: CreateSessionModel) -> SessionInfoModel:
@@ -1326,33 +646,33 @@ class ChatServer:
             Returns:
                 SessionInfoModel for the created session
             """
-            try:
-                # Create the session
+            def create() -> Session:
+                # Create the session; each setter returns the updated row,
+                # so no final fetch is needed
                 session = self.session_manager.create_session(request.recruiter_id)
                 
                 # Set position name if provided
                 if request.position_name:
-                    self.session_manager.set_position_name(session.id, request.position_name)
+                    session = self.session_manager.set_position_name(
+                        session.id, request.position_name
+                    )
                 
-                # Set language if not default
-                if request.language != "en":
-                    language_map = {
-                        "sv": SupportedLanguage.SWEDISH,
-                        "da": SupportedLanguage.DANISH,
-                        "no": SupportedLanguage.NORWEGIAN,
-                        "de": SupportedLanguage.GERMAN,
-                    }
-                    if request.language in language_map:
-                        self.session_manager.set_language(session.id, language_map[request.language])
+                # Set language if not default; unknown codes keep English
+                language = _LANG_CODE_TO_ENUM.get(request.language)
+                if language is not None and language is not SupportedLanguage.ENGLISH:
+                    session = self.session_manager.set_language(session.id, language)
                 
-                # Fetch updated session
-                updated_session = self.session_manager.get_session(session.id)
+                return session
+            
+            try:
+                # Session writes hit the database, so run them off the event loop
+                updated_session = await run_in_threadpool(create)
                 
                 return SessionInfoModel(
                     id=updated_session.id,
                     position_name=updated_session.position_name if updated_session.position_name else None,
                     language=updated_session.language.value,
-                    last_activity=updated_session.last_activity.isoformat()
+                    last_activity=updated_session.last_activity
                 )
             except EmptyRecruiterIDError:
                 raise HTTPException(
@@ -1373,7 +693,9 @@ class ChatServer:
                 SessionInfoModel for the session
             """
             try:
-                session = self.session_manager.get_session(session_id)
+                session = await run_in_threadpool(
+                    self.session_manager.get_session, session_id
+                )
                 if session is None:
                     raise HTTPException(
                         status_code=404,
@@ -1384,7 +706,7 @@ class ChatServer:
                     id=session.id,
                     position_name=session.position_name if session.position_name else None,
                     language=session.language.value,
-                    last_activity=session.last_activity.isoformat()
+                    last_activity=session.last_activity
                 )
             except EmptySessionIDError:
                 raise HTTPException(
@@ -1405,14 +727,18 @@ class ChatServer:
                 SuggestionsResponseModel with available suggestions
             """
             # Validate session exists
-            session = self.session_manager.get_session(session_id)
+            session = await run_in_threadpool(
+                self.session_manager.get_session, session_id
+            )
             if session is None:
                 raise HTTPException(
                     status_code=404,
                     detail="Session not found"
                 )
             
-            suggestions = self.suggestion_service.get_suggestions(session_id)
+            suggestions = await run_in_threadpool(
+                self.suggestion_service.get_suggestions, session_id
+            )
             return SuggestionsResponseModel(suggestions=suggestions)
     
     def get_or_create_agent(self, session_id: str) -> Optional[TataAgent]:
@@ -1426,9 +752,24 @@ class ChatServer:
         Returns:
             TataAgent instance for the session, or None if session not found
         """
+        entry = self._get_or_create_entry(session_id)
+        return entry.agent if entry is not None else None
+    
+    def _get_or_create_entry(self, session_id: str) -> Optional[_AgentEntry]:
+        """Get the cached agent entry for a session, creating it if needed.
+        
+        Args:
+            session_id: The session identifier
+            
+        Returns:
+            _AgentEntry for the session, or None if session not found
+        """
         # Return cached agent if exists
-        if session_id in self.agents:
-            return self.agents[session_id]
+        with self._agents_lock:
+            entry = self.agents.get(session_id)
+            if entry is not None:
+                self.agents.move_to_end(session_id)
+                return entry
         
         # Verify session exists
         session = self.session_manager.get_session(session_id)
@@ -1437,13 +778,17 @@ class ChatServer:
         
         # Initialize agent components for this session
         # OpenAI client (shared across agents)
-        openai_client = RealOpenAIClient(model="gpt-4o")
+        openai_client = self._get_openai_client()
         
         # Tool registry (shared across agents)
-        tool_registry = InMemoryToolRegistry()
+        tool_registry = self.tool_registry
         
         # Conversation manager (per session)
-        conversation_manager = InMemoryConversationManager()
+        conversation_manager = (
+            SQLiteConversationManager(session_id, self._db_path)
+            if self._persist_conversations
+            else InMemoryConversationManager()
+        )
         
         # Tool executor (per session, uses shared memory and dependency managers)
         tool_executor = ToolExecutor(
@@ -1461,27 +806,16 @@ class ChatServer:
             conversation_manager=conversation_manager,
         )
         
-        # Cache the agent for reuse
-        self.agents[session_id] = agent
+        # Cache the agent for reuse; a concurrent request may have won the race.
+        # Evicted agents share the OpenAI client and the per-thread conversation
+        # connections, so there is nothing to close.
+        with self._agents_lock:
+            entry = self.agents.setdefault(session_id, _AgentEntry(agent))
+            self.agents.move_to_end(session_id)
+            while len(self.agents) > self._max_agents:
+                self.agents.popitem(last=False)
         
-        return agent
-    
-    def _check_port_available(self) -> None:
-        """Check if the configured port is available.
-        
-        Raises:
-            PortInUseError: If the port is already in use
-        """
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        try:
-            sock.bind(("127.0.0.1", self.port))
-        except socket.error:
-            raise PortInUseError(
-                f"Error: Port {self.port} is already in use. "
-                f"Please choose a different port or stop the process using port {self.port}."
-            )
-        finally:
-            sock.close()
+        return entry
     
     def run(self) -> None:
         """Start the server.
@@ -1491,15 +825,36 @@ class ChatServer:
         """
         import uvicorn
         
-        # Check port availability before starting (Requirement 1.4)
-        self._check_port_available()
+        # Bind up front so a busy port is reported before start-up
+        # (Requirement 1.4), then serve from that same socket
+        sock = bind_server_socket(self.port)
         
         logger.info(f"Starting Tata chat server on port {self.port}")
         print(f"Tata chat interface available at http://localhost:{self.port}")
         
-        uvicorn.run(
+        # "auto" picks uvloop and httptools when installed, else the
+        # pure-Python asyncio loop and h11 parser
+        config = uvicorn.Config(
             self.app,
-            host="127.0.0.1",
-            port=self.port,
             log_level="info",
+            loop="auto",
+            http="auto",
         )
+        try:
+            uvicorn.Server(config).run(sockets=[sock])
+        finally:
+            sock.close()
+
+
+def create_app() -> FastAPI:
+    """Build the chat app with default persistence.
+    
+    Entry point for ASGI servers that run their own workers, such as
+    gunicorn with uvicorn workers (see gunicorn_conf.py). Set
+    TATA_EPHEMERAL_MEMORY=1 to keep artifacts in memory only.
+    
+    Returns:
+        FastAPI application for a new ChatServer
+    """
+    ephemeral_memory = os.environ.get("TATA_EPHEMERAL_MEMORY") == "1"
+    return ChatServer(ephemeral_memory=ephemeral_memory).app
@@ -0,0 +1,988 @@
+/**
+ * InputHandler Module (Requirement 2.1, 2.3, 2.4, 2.5, 2.6)
+ * 
+ * Manages textarea input, keyboard events, and message submission.
+ * - Enter without Shift = submit (Requirement 2.3)
+ * - Shift+Enter = newline (Requirement 2.4)
+ * - Empty/whitespace validation (Requirement 2.5)
+ * - Clear after submission (Requirement 2.6)
+ */
+const InputHandler = {
+    textarea: null,
+    sendButton: null,
+    onSubmit: null,
+
+    /**
+     * Initialize the input handler.
+     * @param {string} textareaId - ID of the textarea element
+     * @param {string} buttonId - ID of the send button element
+     * @param {Function} submitCallback - Callback when message is submitted
+     */
+    init(textareaId, buttonId, submitCallback) {
+        this.textarea = document.getElementById(textareaId);
+        this.sendButton = document.getElementById(buttonId);
+        this.onSubmit = submitCallback;
+
+        // Keyboard event handling (Requirement 2.3, 2.4)
+        this.textarea.addEventListener('keydown', (e) => this.handleKeyDown(e));
+
+        // Button click handling
+        this.sendButton.addEventListener('click', () => this.submit());
+    },
+
+    /**
+     * Handle keyboard events.
+     * Enter without Shift = submit (Requirement 2.3)
+     * Shift+Enter = newline (Requirement 2.4)
+     * @param {KeyboardEvent} event
+     */
+    handleKeyDown(event) {
+        if (event.key === 'Enter' && !event.shiftKey) {
+            event.preventDefault();
+            this.submit();
+        }
+        // Shift+Enter allows default behavior (newline)
+    },
+
+    /**
+     * Submit the message.
+     * Validates non-empty content (Requirement 2.5)
+     * Clears input after submission (Requirement 2.6)
+     */
+    submit() {
+        const message = this.textarea.value;
+
+        // Validate non-empty/non-whitespace (Requirement 2.5)
+        if (!message || message.trim() === '') {
+            // Prevent submission, maintain focus
+            this.textarea.focus();
+            return;
+        }
+
+        // Call submit callback
+        if (this.onSubmit) {
+            this.onSubmit(message);
+        }
+
+        // Clear input after submission (Requirement 2.6)
+        this.textarea.value = '';
+        this.textarea.focus();
+    },
+
+    /**
+     * Populate the input field with text.
+     * Used by suggestion chips (Requirement 7.3, 7.4)
+     * @param {string} text - Text to populate
+     */
+    populate(text) {
+        this.textarea.value = text;
+        this.textarea.focus();
+        // Move cursor to end
+        this.textarea.selectionStart = this.textarea.selectionEnd = text.length;
+    },
+
+    /**
+     * Enable or disable input.
+     * Used during processing (Requirement 5.5)
+     * @param {boolean} enabled
+     */
+    setEnabled(enabled) {
+        this.textarea.disabled = !enabled;
+        this.sendButton.disabled = !enabled;
+    },
+
+    /**
+     * Get the current input value.
+     * @returns {string}
+     */
+    getValue() {
+        return this.textarea.value;
+    },
+
+    /**
+     * Clear the input field.
+     */
+    clear() {
+        this.textarea.value = '';
+    }
+};
+
+/**
+ * MessageDisplay Module (Requirement 3.1, 3.2, 3.3, 3.4, 3.5)
+ * 
+ * Renders messages and manages auto-scroll.
+ * - Distinct styling for user vs assistant (Requirement 3.1)
+ * - Chronological order (Requirement 3.2)
+ * - Auto-scroll to latest (Requirement 3.3)
+ * - Preserve whitespace (Requirement 3.4)
+ * - Loading indicator (Requirement 3.5)
+ */
+const MessageDisplay = {
+    container: null,
+    loadingElement: null,
+
+    /**
+     * Initialize the message display.
+     * @param {string} containerId - ID of the messages container
+     */
+    init(containerId) {
+        this.container = document.getElementById(containerId);
+    },
+
+    /**
+     * Build a message element.
+     * @param {string} content - Message content
+     * @param {string} kind - 'user', 'assistant' or 'error'
+     * @returns {HTMLDivElement}
+     */
+    buildMessageEl(content, kind) {
+        // Distinct styling per sender (Requirement 3.1)
+        const messageEl = document.createElement('div');
+        messageEl.className = `message ${kind}`;
+
+        // Set text content (preserves special characters)
+        // CSS white-space: pre-wrap handles whitespace (Requirement 3.4)
+        messageEl.textContent = content;
+        return messageEl;
+    },
+
+    /**
+     * Add a message to the display.
+     * Messages are added in chronological order (Requirement 3.2)
+     * Whitespace is preserved via CSS (Requirement 3.4)
+     * @param {string} content - Message content
+     * @param {boolean} isUser - True for user messages, false for assistant
+     */
+    addMessage(content, isUser) {
+        // Remove loading indicator if present
+        this.hideLoading();
+
+        // Add to container (chronological order - Requirement 3.2)
+        this.container.appendChild(
+            this.buildMessageEl(content, isUser ? 'user' : 'assistant')
+        );
+
+        // Auto-scroll to latest message (Requirement 3.3)
+        this.scrollToBottom();
+    },
+
+    /**
+     * Add several messages at once, e.g. a session's history.
+     * Builds them in a fragment so the container reflows once.
+     * @param {{content: string, isUser: boolean}[]} messages - Messages in order
+     */
+    addMessages(messages) {
+        this.hideLoading();
+
+        const fragment = document.createDocumentFragment();
+        messages.forEach(({ content, isUser }) => {
+            fragment.appendChild(
+                this.buildMessageEl(content, isUser ? 'user' : 'assistant')
+            );
+        });
+
+        this.container.appendChild(fragment);
+        this.scrollToBottom();
+    },
+
+    /**
+     * Start an empty assistant message to be filled by appendDelta.
+     * @returns {HTMLDivElement} The new message element
+     */
+    startAssistantMessage() {
+        this.hideLoading();
+
+        const messageEl = this.buildMessageEl('', 'assistant');
+        this.container.appendChild(messageEl);
+        return messageEl;
+    },
+
+    /**
+     * Append streamed text to a message.
+     * @param {HTMLDivElement} messageEl - Element from startAssistantMessage
+     * @param {string} delta - Text to append
+     */
+    appendDelta(messageEl, delta) {
+        messageEl.textContent += delta;
+        this.scrollToBottom();
+    },
+
+    /**
+     * Add an error message to the display.
+     * @param {string} content - Error message content
+     */
+    addError(content) {
+        this.hideLoading();
+
+        this.container.appendChild(this.buildMessageEl(content, 'error'));
+        this.scrollToBottom();
+    },
+
+    /**
+     * Show loading indicator (Requirement 3.5)
+     */
+    showLoading() {
+        if (this.loadingElement) return;
+
+        this.loadingElement = document.createElement('div');
+        this.loadingElement.className = 'loading';
+        this.loadingElement.innerHTML = `
+            <span>Tata is thinking</span>
+            <div class="loading-dots">
+                <span></span>
+                <span></span>
+                <span></span>
+            </div>
+        `;
+
+        this.container.appendChild(this.loadingElement);
+        this.scrollToBottom();
+    },
+
+    /**
+     * Hide loading indicator.
+     */
+    hideLoading() {
+        if (this.loadingElement) {
+            this.loadingElement.remove();
+            this.loadingElement = null;
+        }
+    },
+
+    /**
+     * Scroll the latest element into view.
+     * Uses scrollIntoView rather than reading scrollHeight, which would
+     * force a synchronous layout right after each append.
+     */
+    scrollToBottom() {
+        const last = this.container.lastElementChild;
+        if (last) {
+            last.scrollIntoView({ block: 'end' });
+        }
+    },
+
+    /**
+     * Clear all messages.
+     */
+    clear() {
+        this.container.innerHTML = '';
+        this.loadingElement = null;
+    }
+};
+
+/**
+ * SuggestionChips Module (Requirement 7.1, 7.3, 7.4, 7.6)
+ * 
+ * Displays context-aware suggestions based on session state.
+ * - Render chips from backend response (Requirement 7.1)
+ * - Populate input on click (Requirement 7.3)
+ * - Allow editing before submit (Requirement 7.4)
+ * - Update after each response (Requirement 7.6)
+ */
+const SuggestionChips = {
+    container: null,
+    inputHandler: null,
+
+    /**
+     * Initialize the suggestion chips module.
+     * @param {string} containerId - ID of the suggestions container
+     * @param {Object} inputHandler - Reference to InputHandler module
+     */
+    init(containerId, inputHandler) {
+        this.container = document.getElementById(containerId);
+        this.inputHandler = inputHandler;
+    },
+
+    /**
+     * Update suggestion chips from backend response.
+     * Called after each Tata response (Requirement 7.6)
+     * @param {string[]} suggestions - Array of suggestion strings
+     */
+    update(suggestions) {
+        this.render(suggestions);
+    },
+
+    /**
+     * Render suggestion chips.
+     * @param {string[]} suggestions - Array of suggestion strings
+     */
+    render(suggestions) {
+        // Clear existing chips
+        this.container.innerHTML = '';
+
+        if (!suggestions || suggestions.length === 0) {
+            return;
+        }
+
+        // Create chip for each suggestion, inserted in one batch
+        const fragment = document.createDocumentFragment();
+        suggestions.forEach(suggestion => {
+            const chip = document.createElement('button');
+            chip.className = 'suggestion-chip';
+            chip.textContent = suggestion;
+            chip.addEventListener('click', () => this.handleClick(suggestion));
+            fragment.appendChild(chip);
+        });
+        this.container.appendChild(fragment);
+    },
+
+    /**
+     * Handle chip click.
+     * Populates input with suggestion text (Requirement 7.3)
+     * User can edit before submitting (Requirement 7.4)
+     * @param {string} suggestion - The suggestion text
+     */
+    handleClick(suggestion) {
+        if (this.inputHandler) {
+            this.inputHandler.populate(suggestion);
+        }
+    },
+
+    /**
+     * Clear all suggestion chips.
+     */
+    clear() {
+        this.container.innerHTML = '';
+    }
+};
+
+/**
+ * ApiClient Module
+ * 
+ * Handles HTTP communication with backend.
+ * To be fully implemented in task 6.3
+ */
+const ApiClient = {
+    baseUrl: '',
+
+    /**
+     * Send a chat message to the backend.
+     * @param {string} sessionId - Session identifier
+     * @param {string} message - User message
+     * @returns {Promise<Object>} Response with response/error and suggestions
+     */
+    async sendMessage(sessionId, message) {
+        const response = await fetch(`${this.baseUrl}/api/chat`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({
+                session_id: sessionId,
+                message: message,
+            }),
+        });
+
+        if (!response.ok) {
+            const error = await response.json();
+            throw new Error(error.detail || 'Request failed');
+        }
+
+        return response.json();
+    },
+
+    /**
+     * Send a chat message and stream the response.
+     * Reads Server-Sent Events from /api/chat/stream and reports each
+     * text delta as it arrives.
+     * @param {string} sessionId - Session identifier
+     * @param {string} message - User message
+     * @param {Function} onDelta - Called with each piece of response text
+     * @returns {Promise<Object>} Final event with suggestions, and error if any
+     */
+    async streamMessage(sessionId, message, onDelta) {
+        const response = await fetch(`${this.baseUrl}/api/chat/stream`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({
+                session_id: sessionId,
+                message: message,
+            }),
+        });
+
+        if (!response.ok) {
+            const error = await response.json();
+            throw new Error(error.detail || 'Request failed');
+        }
+
+        const reader = response.body
+            .pipeThrough(new TextDecoderStream())
+            .getReader();
+        const result = { suggestions: [], error: null };
+        let buffer = '';
+
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            buffer += value;
+
+            // Events are separated by a blank line; keep any partial tail
+            const events = buffer.split('\n\n');
+            buffer = events.pop();
+
+            for (const event of events) {
+                if (!event.startsWith('data: ')) continue;
+                const data = JSON.parse(event.slice(6));
+                if (data.delta) onDelta(data.delta);
+                if (data.error) result.error = data.error;
+                if (data.done) result.suggestions = data.suggestions || [];
+            }
+        }
+
+        return result;
+    },
+
+    /**
+     * Get sessions for a recruiter.
+     * @param {string} recruiterId - Recruiter identifier
+     * @returns {Promise<Object[]>} Array of session objects
+     */
+    async getSessions(recruiterId) {
+        const response = await fetch(
+            `${this.baseUrl}/api/sessions?recruiter_id=${encodeURIComponent(recruiterId)}`
+        );
+
+        if (!response.ok) {
+            throw new Error('Failed to fetch sessions');
+        }
+
+        return response.json();
+    },
+
+    /**
+     * Create a new session.
+     * @param {string} recruiterId - Recruiter identifier
+     * @param {string} positionName - Position name
+     * @param {string} language - Language code
+     * @returns {Promise<Object>} Created session object
+     */
+    async createSession(recruiterId, positionName, language = 'en') {
+        const response = await fetch(`${this.baseUrl}/api/sessions`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({
+                recruiter_id: recruiterId,
+                position_name: positionName,
+                language: language,
+            }),
+        });
+
+        if (!response.ok) {
+            throw new Error('Failed to create session');
+        }
+
+        return response.json();
+    }
+};
+
+/** Rows rendered above and beyond the visible part of the session list. */
+const WINDOW_ROWS_BEFORE = 5;
+const WINDOW_ROWS_AFTER = 10;
+
+/** Display names for session language codes. */
+const LANGUAGE_NAMES = Object.freeze({
+    en: 'English',
+    sv: 'Swedish',
+    da: 'Danish',
+    no: 'Norwegian',
+    de: 'German'
+});
+
+/** Shared formatters for session activity dates; building these is the costly part. */
+const DATE_FORMAT = new Intl.DateTimeFormat(undefined);
+const RELATIVE_TIME_FORMAT = new Intl.RelativeTimeFormat(undefined, { numeric: 'auto', style: 'narrow' });
+
+/** How long a formatted activity label is reused before it is recomputed. */
+const DATE_LABEL_TTL_MS = 30000;
+
+/** Markup for a session row, parsed once and cloned per row. */
+const SESSION_ROW_TEMPLATE = document.createElement('template');
+SESSION_ROW_TEMPLATE.innerHTML =
+    '<div class="position-name"></div>' +
+    '<div class="session-meta"><span class="lang"></span><span>•</span><span class="date"></span></div>';
+
+/**
+ * SessionSelector Module (Requirement 4.1, 4.2, 4.3, 4.4)
+ * 
+ * Manages session list and creation.
+ * - Load and display sessions list (Requirement 4.1)
+ * - Create new session form (Requirement 4.2)
+ * - Session selection handling (Requirement 4.3)
+ * - Display session metadata (Requirement 4.4)
+ */
+const SessionSelector = {
+    panel: null,
+    container: null,
+    toggleBtn: null,
+    closeBtn: null,
+    createBtn: null,
+    positionInput: null,
+    languageSelect: null,
+    sessionNameEl: null,
+    currentSession: null,
+    onSessionSelect: null,
+    sessions: [],
+    sessionById: new Map(),
+    renderedRows: new Map(),
+    dateLabels: new Map(),
+    topSpacer: null,
+    bottomSpacer: null,
+    rowHeight: 0,
+    windowStart: 0,
+    windowEnd: 0,
+    windowFrame: 0,
+
+    /**
+     * Initialize the session selector.
+     * @param {string} panelId - ID of the session panel element
+     * @param {string} containerId - ID of the sessions container element
+     * @param {Function} selectCallback - Callback when session is selected
+     */
+    init(panelId, containerId, selectCallback) {
+        this.panel = document.getElementById(panelId);
+        this.container = document.getElementById(containerId);
+        this.onSessionSelect = selectCallback;
+
+        // Look up elements once; handlers reuse these references
+        this.toggleBtn = document.getElementById('session-toggle');
+        this.closeBtn = document.getElementById('close-panel');
+        this.createBtn = document.getElementById('create-session-btn');
+        this.positionInput = document.getElementById('position-name');
+        this.languageSelect = document.getElementById('language-select');
+        this.sessionNameEl = document.getElementById('session-name');
+
+        // Set up panel toggle
+        this.toggleBtn.addEventListener('click', () => this.openPanel());
+        this.closeBtn.addEventListener('click', () => this.closePanel());
+
+        // Set up create session form
+        this.createBtn.addEventListener('click', () => this.handleCreateSession());
+
+        // Allow Enter key to submit form
+        this.positionInput.addEventListener('keydown', (e) => {
+            if (e.key === 'Enter') {
+                e.preventDefault();
+                this.handleCreateSession();
+            }
+        });
+
+        // One delegated listener handles clicks on every session row
+        this.container.addEventListener('click', (e) => {
+            const row = e.target.closest('.session-item');
+            if (!row) return;
+            const session = this.sessionById.get(row.dataset.sessionId);
+            if (session) this.selectSession(session);
+        });
+
+        // Keep the virtualized session window in step with the viewport
+        this.panel.addEventListener('scroll', () => this.scheduleRenderWindow(), { passive: true });
+        window.addEventListener('resize', () => this.scheduleRenderWindow());
+    },
+
+    /**
+     * Open the session panel.
+     */
+    openPanel() {
+        this.panel.classList.add('open');
+    },
+
+    /**
+     * Close the session panel.
+     */
+    closePanel() {
+        this.panel.classList.remove('open');
+    },
+
+    /**
+     * Load and display sessions for a recruiter.
+     * Requirement 4.1: Display existing sessions when interface loads.
+     * @param {string} recruiterId - Recruiter identifier
+     */
+    async loadSessions(recruiterId) {
+        this.container.innerHTML = '<div class="sessions-loading">Loading sessions...</div>';
+
+        try {
+            const sessions = await ApiClient.getSessions(recruiterId);
+            this.renderSessions(sessions);
+        } catch (error) {
+            console.error('Failed to load sessions:', error);
+            this.container.innerHTML = '<div class="no-sessions">Failed to load sessions. Please try again.</div>';
+        }
+    },
+
+    /**
+     * Render the sessions list.
+     * Requirement 4.4: Display session metadata (position name, language, last activity).
+     *
+     * Only the rows inside the panel's scroll viewport (plus a small buffer)
+     * are kept in the DOM; spacer elements stand in for the rest so the
+     * scrollbar still reflects the full list.
+     * @param {Object[]} sessions - Array of session objects
+     */
+    renderSessions(sessions) {
+        this.sessions = [];
+        this.sessionById.clear();
+        this.renderedRows.clear();
+        this.dateLabels.clear();
+        this.windowStart = 0;
+        this.windowEnd = 0;
+
+        if (!sessions || sessions.length === 0) {
+            this.container.innerHTML = '<div class="no-sessions">No sessions yet. Create one above!</div>';
+            return;
+        }
+
+        // Sort sessions by last activity (most recent first)
+        this.sessions = [...sessions].sort((a, b) => 
+            new Date(b.last_activity) - new Date(a.last_activity)
+        );
+        this.sessionById = new Map(this.sessions.map(session => [session.id, session]));
+
+        this.topSpacer = document.createElement('div');
+        this.bottomSpacer = document.createElement('div');
+        this.container.innerHTML = '';
+        this.container.appendChild(this.topSpacer);
+        this.container.appendChild(this.bottomSpacer);
+
+        // Measure the row pitch once from a sample row
+        if (!this.rowHeight) {
+            const sample = this.buildSessionRow(this.sessions[0]);
+            this.container.insertBefore(sample, this.bottomSpacer);
+            const marginBottom = parseFloat(getComputedStyle(sample).marginBottom) || 0;
+            this.rowHeight = sample.offsetHeight + marginBottom;
+            sample.remove();
+        }
+
+        this.renderWindow();
+    },
+
+    /**
+     * Bring the rendered rows in line with the current scroll position.
+     *
+     * Rows that left the window are removed and rows that entered it are
+     * created; rows that stay visible are left untouched.
+     */
+    renderWindow() {
+        const total = this.sessions.length;
+        if (total === 0) return;
+
+        // Fall back to rendering everything if the panel has no layout yet
+        const rowHeight = this.rowHeight || 1;
+        const offset = Math.max(0, this.panel.scrollTop - this.container.offsetTop);
+        const visibleRows = this.rowHeight
+            ? Math.ceil(this.panel.clientHeight / rowHeight)
+            : total;
+
+        const windowSize = visibleRows + WINDOW_ROWS_AFTER;
+        const firstVisible = Math.floor(offset / rowHeight);
+        const start = Math.max(0, Math.min(firstVisible - WINDOW_ROWS_BEFORE, total - windowSize));
+        const end = Math.min(total, start + windowSize);
+        if (start === this.windowStart && end === this.windowEnd) return;
+
+        for (const [index, row] of this.renderedRows) {
+            if (index < start || index >= end) {
+                row.remove();
+                this.renderedRows.delete(index);
+            }
+        }
+
+        // Build new rows off-DOM: rows above the old window go before the
+        // surviving rows, the rest after them, one insertion per side
+        const firstSurvivor = this.renderedRows.size > 0
+            ? this.topSpacer.nextSibling
+            : this.bottomSpacer;
+        const above = document.createDocumentFragment();
+        const below = document.createDocumentFragment();
+        for (let index = start; index < end; index++) {
+            if (this.renderedRows.has(index)) continue;
+            const row = this.buildSessionRow(this.sessions[index]);
+            (index < this.windowStart ? above : below).appendChild(row);
+            this.renderedRows.set(index, row);
+        }
+        this.container.insertBefore(above, firstSurvivor);
+        this.container.insertBefore(below, this.bottomSpacer);
+
+        this.windowStart = start;
+        this.windowEnd = end;
+        this.sizeSpacers();
+    },
+
+    /**
+     * Size the spacers to stand in for the rows outside the window.
+     */
+    sizeSpacers() {
+        const hiddenBelow = this.sessions.length - this.windowEnd;
+        this.topSpacer.style.height = `${this.windowStart * this.rowHeight}px`;
+        this.bottomSpacer.style.height = `${hiddenBelow * this.rowHeight}px`;
+    },
+
+    /**
+     * Add a newly created session to the top of the list without reloading it.
+     * @param {Object} session - Session object returned by the API
+     */
+    insertSession(session) {
+        if (this.sessions.length === 0) {
+            this.renderSessions([session]);
+            return;
+        }
+
+        // The new session is the most recent, so every rendered row moves down one place
+        this.sessions.unshift(session);
+        this.sessionById.set(session.id, session);
+        this.renderedRows = new Map(
+            Array.from(this.renderedRows, ([index, row]) => [index + 1, row])
+        );
+        this.windowStart += 1;
+        this.windowEnd += 1;
+
+        this.renderWindow();
+        this.sizeSpacers();
+    },
+
+    /**
+     * Re-render the window at most once per animation frame.
+     */
+    scheduleRenderWindow() {
+        if (this.windowFrame) return;
+        this.windowFrame = requestAnimationFrame(() => {
+            this.windowFrame = 0;
+            this.renderWindow();
+        });
+    },
+
+    /**
+     * Build the DOM node for a single session row.
+     * @param {Object} session - Session object
+     * @returns {HTMLElement} Session row element
+     */
+    buildSessionRow(session) {
+        const item = document.createElement('div');
+        item.className = 'session-item';
+        item.dataset.sessionId = session.id;
+        if (this.currentSession && this.currentSession.id === session.id) {
+            item.classList.add('selected');
+        }
+
+        // Requirement 4.4: Display position name, language, last activity
+        item.appendChild(SESSION_ROW_TEMPLATE.content.cloneNode(true));
+        item.querySelector('.position-name').textContent = session.position_name || 'Untitled Position';
+        item.querySelector('.lang').textContent = LANGUAGE_NAMES[session.language] || session.language;
+        item.querySelector('.date').textContent = this.formatLastActivity(session.last_activity);
+
+        return item;
+    },
+
+    /**
+     * Format a session's last activity timestamp, reusing recent results.
+     *
+     * Labels are cached by timestamp and recomputed once they are older than
+     * DATE_LABEL_TTL_MS so relative labels such as "5m ago" stay current.
+     * @param {string} lastActivity - ISO timestamp from the API
+     * @returns {string} Formatted date string
+     */
+    formatLastActivity(lastActivity) {
+        const now = Date.now();
+        const cached = this.dateLabels.get(lastActivity);
+        if (cached && now - cached.computedAt <= DATE_LABEL_TTL_MS) {
+            return cached.value;
+        }
+
+        const value = this.formatDate(new Date(lastActivity));
+        this.dateLabels.set(lastActivity, { value, computedAt: now });
+        return value;
+    },
+
+    /**
+     * Format a date for display.
+     * @param {Date} date - Date to format
+     * @returns {string} Formatted date string
+     */
+    formatDate(date) {
+        const now = new Date();
+        const diffMs = now - date;
+        const diffMins = Math.floor(diffMs / 60000);
+        const diffHours = Math.floor(diffMs / 3600000);
+        const diffDays = Math.floor(diffMs / 86400000);
+
+        if (diffMins < 1) return 'Just now';
+        if (diffMins < 60) return RELATIVE_TIME_FORMAT.format(-diffMins, 'minute');
+        if (diffHours < 24) return RELATIVE_TIME_FORMAT.format(-diffHours, 'hour');
+        if (diffDays < 7) return RELATIVE_TIME_FORMAT.format(-diffDays, 'day');
+
+        return DATE_FORMAT.format(date);
+    },
+
+    /**
+     * Handle create session button click.
+     * Requirement 4.2: Create new session with position name and language.
+     */
+    async handleCreateSession() {
+        const { positionInput, languageSelect, createBtn } = this;
+
+        const positionName = positionInput.value.trim();
+        const language = languageSelect.value;
+
+        if (!positionName) {
+            positionInput.focus();
+            return;
+        }
+
+        // Disable button during creation
+        createBtn.disabled = true;
+        createBtn.textContent = 'Creating...';
+
+        try {
+            const session = await ApiClient.createSession(
+                AppState.recruiterId,
+                positionName,
+                language
+            );
+
+            // Clear form
+            positionInput.value = '';
+            languageSelect.value = 'en';
+
+            // Add it to the list in place of re-fetching every session
+            this.insertSession(session);
+
+            // Select the new session
+            this.selectSession(session);
+
+        } catch (error) {
+            console.error('Failed to create session:', error);
+            alert('Failed to create session. Please try again.');
+        } finally {
+            createBtn.disabled = false;
+            createBtn.textContent = 'Create Session';
+        }
+    },
+
+    /**
+     * Select a session.
+     * Requirement 4.3: Load session context when selected.
+     * @param {Object} session - Session object to select
+     */
+    selectSession(session) {
+        this.currentSession = session;
+
+        // Update UI to show selected session; off-window rows pick it up when rendered
+        for (const item of this.renderedRows.values()) {
+            item.classList.toggle('selected', item.dataset.sessionId === session.id);
+        }
+
+        // Update header with session name (Requirement 6.4)
+        this.sessionNameEl.textContent = session.position_name || 'Untitled Position';
+
+        // Close panel after selection
+        this.closePanel();
+
+        // Call the selection callback
+        if (this.onSessionSelect) {
+            this.onSessionSelect(session);
+        }
+    },
+
+    /**
+     * Get the currently selected session.
+     * @returns {Object|null} Current session or null
+     */
+    getCurrentSession() {
+        return this.currentSession;
+    }
+};
+
+/**
+ * Application State
+ */
+const AppState = {
+    currentSession: null,
+    recruiterId: 'default',
+    isProcessing: false
+};
+
+/**
+ * Main application initialization
+ */
+async function initApp() {
+    // Initialize modules
+    MessageDisplay.init('messages');
+
+    InputHandler.init('message-input', 'send-btn', async (message) => {
+        if (AppState.isProcessing) return;
+
+        // Check if session is selected
+        if (!AppState.currentSession) {
+            MessageDisplay.addError('Please select or create a session first.');
+            return;
+        }
+
+        // Display user message
+        MessageDisplay.addMessage(message, true);
+
+        // Disable input during processing
+        AppState.isProcessing = true;
+        InputHandler.setEnabled(false);
+        MessageDisplay.showLoading();
+
+        try {
+            // Stream the reply into a message as it arrives
+            let messageEl = null;
+            const result = await ApiClient.streamMessage(
+                AppState.currentSession.id,
+                message,
+                (delta) => {
+                    if (!messageEl) {
+                        messageEl = MessageDisplay.startAssistantMessage();
+                    }
+                    MessageDisplay.appendDelta(messageEl, delta);
+                }
+            );
+
+            if (result.error) {
+                MessageDisplay.addError(result.error);
+            }
+
+            // Update suggestion chips (Requirement 7.6)
+            SuggestionChips.update(result.suggestions || []);
+
+        } catch (error) {
+            MessageDisplay.addError(
+                'Unable to connect to Tata. Please check your connection.'
+            );
+        } finally {
+            AppState.isProcessing = false;
+            InputHandler.setEnabled(true);
+            MessageDisplay.hideLoading();
+        }
+    });
+
+    SuggestionChips.init('suggestions', InputHandler);
+
+    // Initialize SessionSelector (Requirement 4.1, 4.2, 4.3, 4.4)
+    SessionSelector.init('session-panel', 'sessions-container', (session) => {
+        // Update AppState when session is selected (Requirement 4.3)
+        AppState.currentSession = session;
+
+        // Clear messages when switching sessions
+        MessageDisplay.clear();
+        SuggestionChips.clear();
+
+        // Show welcome message for the session
+        MessageDisplay.addMessage(
+            `Session loaded: ${session.position_name || 'Untitled Position'}. How can I help you today?`,
+            false
+        );
+    });
+
+    // Load existing sessions (Requirement 4.1)
+    await SessionSelector.loadSessions(AppState.recruiterId);
+
+    console.log('Tata chat interface initialized');
+}
+
+// Initialize when DOM is ready
+document.addEventListener('DOMContentLoaded', initApp);
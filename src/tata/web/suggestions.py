@@ -9,7 +9,9 @@ Requirements covered:
 - 7.5: Query backend for available next actions based on session state
 """
 
-from typing import Dict, List
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Tuple
 
 from src.tata.dependency.dependency import DependencyManager
 from src.tata.memory.memory import MemoryManager
@@ -33,32 +35,45 @@ MODULE_SUGGESTION_TEXT: Dict[ModuleType, str] = {
     ModuleType.CANDIDATE_REPORT: "Generate candidate report",
 }
 
+# Modules that have suggestion text, in ModuleType order; the others are
+# never suggested, so their dependencies need no checking
+_SUGGESTED_MODULES = tuple(
+    module for module in ModuleType if module in MODULE_SUGGESTION_TEXT
+)
+
 
 class SuggestionService:
     """Determines available next actions based on session state.
     
     Uses DependencyManager to check which modules can be executed
-    based on existing artifacts in the session.
+    based on existing artifacts in the session. Results are cached per
+    session and reused until the session's artifact fingerprint changes;
+    the least recently used sessions are evicted beyond ``maxsize``.
     
     Attributes:
         _deps: DependencyManager for checking module prerequisites
-        _memory: MemoryManager for artifact storage (unused directly but
-                 passed to DependencyManager)
+        _memory: MemoryManager providing artifact fingerprints
+        _cache: LRU map of session ID to (fingerprint, suggestions)
     """
     
     def __init__(
         self,
         dependency_manager: DependencyManager,
         memory_manager: MemoryManager,
+        maxsize: int = 1024,
     ) -> None:
         """Initialize the suggestion service.
         
         Args:
             dependency_manager: DependencyManager for checking prerequisites
             memory_manager: MemoryManager for artifact storage
+            maxsize: Maximum number of sessions with cached suggestions
         """
         self._deps = dependency_manager
         self._memory = memory_manager
+        self._maxsize = maxsize
+        self._cache: OrderedDict[str, Tuple[int, List[str]]] = OrderedDict()
+        self._lock = threading.Lock()
     
     def get_suggestions(self, session_id: str) -> List[str]:
         """Get available next action suggestions for a session.
@@ -76,24 +91,25 @@ class SuggestionService:
         if not session_id:
             return []
         
-        suggestions: List[str] = []
-        
-        for module in ModuleType:
-            check = self._deps.can_execute(session_id, module)
-            if check.can_proceed:
-                suggestion_text = self._get_suggestion_for_module(module)
-                if suggestion_text:
-                    suggestions.append(suggestion_text)
+        fingerprint = self._memory.fingerprint(session_id)
+        with self._lock:
+            cached = self._cache.get(session_id)
+            if cached is not None and cached[0] == fingerprint:
+                self._cache.move_to_end(session_id)
+                return list(cached[1])
         
-        return suggestions
-    
-    def _get_suggestion_for_module(self, module: ModuleType) -> str:
-        """Map module type to user-friendly suggestion text.
+        # One artifact read covers every module's dependency check
+        checks = self._deps.can_execute_batch(session_id, _SUGGESTED_MODULES)
+        suggestions = [
+            MODULE_SUGGESTION_TEXT[module]
+            for module, check in checks.items()
+            if check.can_proceed
+        ]
         
-        Args:
-            module: The module type to get suggestion for
-            
-        Returns:
-            User-friendly suggestion text for the module
-        """
-        return MODULE_SUGGESTION_TEXT.get(module, "")
+        # One entry per session; a newer fingerprint replaces the old one
+        with self._lock:
+            self._cache[session_id] = (fingerprint, suggestions)
+            self._cache.move_to_end(session_id)
+            while len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+        return list(suggestions)
@@ -45,9 +45,9 @@ def dependency_manager(memory_manager):
     return InMemoryDependencyManager(memory_manager)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tool_registry():
-    """Create a tool registry."""
+    """Create a tool registry shared by all tests (it is read-only)."""
     return InMemoryToolRegistry()
 
 
@@ -63,7 +63,7 @@ def mock_client():
     return MockOpenAIClient()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def session_id():
     """Create a test session ID."""
     return "test-session-123"
@@ -446,6 +446,22 @@ class TestConversationManagement:
         assert "create_job_ad" in tool_names
         assert "create_funnel_report" in tool_names
 
+    def test_prompt_prefix_identical_across_requests(self, agent, mock_client):
+        """System prompt and tools should be identical on every request."""
+        mock_client.set_responses([
+            ChatCompletionResponse(content="First", tool_calls=None, finish_reason="stop"),
+            ChatCompletionResponse(content="Second", tool_calls=None, finish_reason="stop"),
+        ])
+        
+        agent.chat("Hello")
+        agent.chat("Again")
+        
+        (first_messages, first_tools), (second_messages, second_tools) = (
+            mock_client.get_call_history()
+        )
+        assert first_messages[0] is second_messages[0]
+        assert first_tools is second_tools
+
 
 class TestOpenAIClientIntegration:
     """Tests for OpenAI client integration."""
@@ -471,3 +487,96 @@ class TestOpenAIClientIntegration:
         roles = [m.role for m in messages]
         assert MessageRole.SYSTEM in roles
         assert MessageRole.USER in roles
+
+
+class TestChatStream:
+    """Tests for streaming chat responses."""
+    
+    def test_stream_yields_response_text(self, agent, mock_client, conversation_manager):
+        """Streamed text should match the reply and be stored once."""
+        mock_client.set_responses([
+            ChatCompletionResponse(
+                content="Hello there!",
+                tool_calls=None,
+                finish_reason="stop",
+            )
+        ])
+        
+        chunks = list(agent.chat_stream("Hi"))
+        
+        assert "".join(chunks) == "Hello there!"
+        messages = conversation_manager.get_messages()
+        assert messages[-1].role == MessageRole.ASSISTANT
+        assert messages[-1].content == "Hello there!"
+    
+    def test_stream_closed_early_records_sent_text(self, agent, mock_client, conversation_manager):
+        """Closing the stream mid-reply should store the text sent so far."""
+        mock_client.set_responses([
+            ChatCompletionResponse(
+                content="Hello there!",
+                tool_calls=None,
+                finish_reason="stop",
+            )
+        ])
+        
+        stream = agent.chat_stream("Hi")
+        assert next(stream) == "Hello there!"
+        stream.close()
+        
+        messages = conversation_manager.get_messages()
+        assert [m.role for m in messages[-2:]] == [MessageRole.USER, MessageRole.ASSISTANT]
+        assert messages[-1].content == "Hello there!"
+    
+    def test_stream_runs_tool_calls(self, agent, mock_client, memory_manager, session_id):
+        """Tool rounds should run before the final text is streamed."""
+        mock_client.set_responses([
+            ChatCompletionResponse(
+                content=None,
+                tool_calls=[
+                    ToolCall(
+                        id="call-1",
+                        name="create_funnel_report",
+                        arguments=json.dumps({
+                            "job_title": "Software Engineer",
+                            "number_of_positions": 1,
+                            "hiring_manager_name": "John Smith",
+                            "job_ad_views": 100,
+                            "applications_received": 50,
+                        }),
+                    )
+                ],
+                finish_reason="tool_calls",
+            ),
+            ChatCompletionResponse(
+                content="Report created.",
+                tool_calls=None,
+                finish_reason="stop",
+            ),
+        ])
+        
+        assert "".join(agent.chat_stream("Create a funnel report")) == "Report created."
+        assert memory_manager.has_artifact(session_id, ArtifactType.FUNNEL_REPORT)
+    
+    def test_stream_api_error_yields_friendly_message(self, agent):
+        """API errors while streaming should yield the user-friendly message."""
+        class FailingClient:
+            def chat_completion_stream(self, messages, tools=None):
+                raise OpenAIAPIError("Connection failed", status_code=500)
+                yield  # pragma: no cover
+        
+        agent._client = FailingClient()
+        
+        response = "".join(agent.chat_stream("Hello"))
+        
+        assert "Connection failed" not in response
+        assert "try again" in response.lower()
+    
+    def test_stream_fallback_when_no_content(self, agent, mock_client):
+        """Fallback text should be streamed when OpenAI returns no content."""
+        mock_client.set_responses([
+            ChatCompletionResponse(content=None, tool_calls=None, finish_reason="stop")
+        ])
+        
+        response = "".join(agent.chat_stream("Hello"))
+        
+        assert "apologize" in response.lower()
@@ -1,5 +1,6 @@
 """Unit tests for OpenAI integration data models."""
 
+import dataclasses
 import pytest
 import json
 
@@ -46,6 +47,12 @@ class TestToolCall:
             }
         }
 
+    def test_to_dict_is_built_once(self):
+        """Repeated to_dict calls should reuse the same dict."""
+        tool_call = ToolCall(id="call_123", name="some_tool", arguments="{}")
+        
+        assert tool_call.to_dict() is tool_call.to_dict()
+
     def test_parse_arguments_valid_json(self):
         """parse_arguments should parse valid JSON arguments."""
         tool_call = ToolCall(
@@ -81,6 +88,17 @@ class TestToolCall:
         with pytest.raises(json.JSONDecodeError):
             tool_call.parse_arguments()
 
+    def test_parsed_arguments_decoded_once(self):
+        """parsed_arguments should decode the JSON once and reuse it."""
+        tool_call = ToolCall(
+            id="call_123",
+            name="create_job_ad",
+            arguments='{"tone": "formal"}'
+        )
+        
+        assert tool_call.parsed_arguments == {"tone": "formal"}
+        assert tool_call.parsed_arguments is tool_call.parse_arguments()
+
 
 class TestMessage:
     """Tests for Message dataclass."""
@@ -165,6 +183,25 @@ class TestMessage:
             "name": "create_profile"
         }
 
+    def test_to_openai_format_is_built_once(self):
+        """Repeated to_openai_format calls should reuse the same dict."""
+        msg = Message(role=MessageRole.USER, content="Hello")
+        
+        assert msg.to_openai_format() is msg.to_openai_format()
+
+    def test_message_is_immutable(self):
+        """Message fields should not be reassignable after construction."""
+        msg = Message(role=MessageRole.USER, content="Hello")
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            msg.content = "Changed"
+
+    def test_message_uses_slots(self):
+        """Messages should not carry a per-instance __dict__."""
+        msg = Message(role=MessageRole.USER, content="Hello")
+        
+        assert not hasattr(msg, "__dict__")
+
     def test_from_openai_format_user_message(self):
         """from_openai_format should parse user message."""
         data = {
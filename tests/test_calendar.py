@@ -10,6 +10,7 @@ Tests cover:
 """
 
 import pytest
+from dataclasses import replace
 from datetime import datetime
 
 from src.tata.modules.calendar.invite import (
@@ -35,31 +36,57 @@ from src.tata.modules.calendar.invite import (
 from src.tata.memory.memory import ArtifactType
 
 
+pytestmark = pytest.mark.calendar
+
+# Expected fragments of each office's address (Requirement 11.2)
+_OFFICES = (
+    (City.STOCKHOLM, ("Solnavägen 3H", "113 63 Stockholm")),
+    (City.COPENHAGEN, ("Havneholmen 6", "København")),
+    (City.OSLO, ("Snarøyveien 36", "Fornebu")),
+)
+_STOCKHOLM_OFFICE = OFFICE_LOCATIONS[City.STOCKHOLM]
+
+
+def _make_input(**overrides):
+    """Build a valid Teams/Jobylon input, with any fields overridden."""
+    fields = dict(
+        position_name="Engineer",
+        hiring_manager=PersonInfo(name="John", title="Manager"),
+        recruiter_name="Sarah",
+        location_type=LocationType.TEAMS,
+        interview_type=InterviewType.HIRING_MANAGER,
+        duration=60,
+        booking_method=BookingMethod.JOBYLON,
+    )
+    fields.update(overrides)
+    return CalendarInviteInput(**fields)
+
+
+def _teams_jobylon_input():
+    """Build valid input for Teams interview with Jobylon booking."""
+    return _make_input(
+        position_name="Senior Software Engineer",
+        hiring_manager=PersonInfo(name="John Manager", title="Engineering Director"),
+        recruiter_name="Sarah Recruiter",
+    )
+
+
+@pytest.fixture(scope="module")
+def processor():
+    """Create one processor for the module; it holds no state."""
+    return CalendarInviteProcessor()
+
+
 class TestOfficeLocations:
     """Tests for office location lookup (Requirement 11.2)."""
     
-    def test_stockholm_office_exists(self):
-        """Stockholm office should have correct address."""
-        location = get_office_location(City.STOCKHOLM)
-        assert location.city == City.STOCKHOLM
-        assert "Solnavägen 3H" in location.address
-        assert "113 63 Stockholm" in location.address
-        assert location.maps_link.startswith("https://")
-    
-    def test_copenhagen_office_exists(self):
-        """Copenhagen office should have correct address."""
-        location = get_office_location(City.COPENHAGEN)
-        assert location.city == City.COPENHAGEN
-        assert "Havneholmen 6" in location.address
-        assert "København" in location.address
-        assert location.maps_link.startswith("https://")
-    
-    def test_oslo_office_exists(self):
-        """Oslo office should have correct address."""
-        location = get_office_location(City.OSLO)
-        assert location.city == City.OSLO
-        assert "Snarøyveien 36" in location.address
-        assert "Fornebu" in location.address
+    @pytest.mark.parametrize("city,needles", _OFFICES)
+    def test_office_exists(self, city, needles):
+        """Each office should have the correct address."""
+        location = get_office_location(city)
+        assert location.city == city
+        for needle in needles:
+            assert needle in location.address
         assert location.maps_link.startswith("https://")
     
     def test_all_offices_have_map_links(self):
@@ -156,37 +183,25 @@ class TestCalendarInvite:
 class TestHelperFunctions:
     """Tests for helper functions."""
     
-    def test_get_interview_type_display_hiring_manager(self):
-        """Should return correct display name for HM interview."""
-        assert get_interview_type_display(InterviewType.HIRING_MANAGER) == "Hiring Manager Interview"
-    
-    def test_get_interview_type_display_case(self):
-        """Should return correct display name for case interview."""
-        assert get_interview_type_display(InterviewType.CASE) == "Case Interview"
-    
-    def test_get_interview_type_display_team(self):
-        """Should return correct display name for team interview."""
-        assert get_interview_type_display(InterviewType.TEAM) == "Team Interview"
-    
-    def test_get_interview_type_display_ta_screening(self):
-        """Should return correct display name for TA screening."""
-        assert get_interview_type_display(InterviewType.TA_SCREENING) == "Screening Interview"
-    
-    def test_format_duration_60_minutes(self):
-        """Should format 60 minutes as 1 hour."""
-        assert format_duration(60) == "1 hour"
-    
-    def test_format_duration_90_minutes(self):
-        """Should format 90 minutes as 1.5 hours."""
-        assert format_duration(90) == "1.5 hours"
-    
-    def test_format_duration_30_minutes(self):
-        """Should format 30 minutes correctly."""
-        assert format_duration(30) == "30 minutes"
-    
-    def test_format_duration_120_minutes(self):
-        """Should format 120 minutes as 2 hours."""
-        assert format_duration(120) == "2 hours"
+    @pytest.mark.parametrize("interview_type,expected", [
+        (InterviewType.HIRING_MANAGER, "Hiring Manager Interview"),
+        (InterviewType.CASE, "Case Interview"),
+        (InterviewType.TEAM, "Team Interview"),
+        (InterviewType.TA_SCREENING, "Screening Interview"),
+    ])
+    def test_get_interview_type_display(self, interview_type, expected):
+        """Should return correct display name for each interview type."""
+        assert get_interview_type_display(interview_type) == expected
+    
+    @pytest.mark.parametrize("minutes,expected", [
+        (60, "1 hour"),
+        (90, "1.5 hours"),
+        (30, "30 minutes"),
+        (120, "2 hours"),
+    ])
+    def test_format_duration(self, minutes, expected):
+        """Should format durations in minutes or hours."""
+        assert format_duration(minutes) == expected
     
     def test_format_participants_empty(self):
         """Should return empty string for no participants."""
@@ -210,25 +225,21 @@ class TestHelperFunctions:
         assert "Jane Smith" in result
 
 
+@pytest.fixture(scope="module")
+def teams_input_template():
+    """Canonical valid Teams input; tests copy it before changing it."""
+    return _teams_jobylon_input()
+
+
 class TestCalendarInviteProcessor:
     """Tests for CalendarInviteProcessor."""
     
     @pytest.fixture
-    def processor(self):
-        """Create processor instance."""
-        return CalendarInviteProcessor()
-    
-    @pytest.fixture
-    def valid_teams_input(self):
-        """Create valid input for Teams interview."""
-        return CalendarInviteInput(
-            position_name="Senior Software Engineer",
-            hiring_manager=PersonInfo(name="John Manager", title="Engineering Director"),
-            recruiter_name="Sarah Recruiter",
-            location_type=LocationType.TEAMS,
-            interview_type=InterviewType.HIRING_MANAGER,
-            duration=60,
-            booking_method=BookingMethod.JOBYLON,
+    def valid_teams_input(self, teams_input_template):
+        """Create valid input for Teams interview that a test may modify."""
+        return replace(
+            teams_input_template,
+            hiring_manager=replace(teams_input_template.hiring_manager),
         )
     
     @pytest.fixture
@@ -324,122 +335,101 @@ class TestCalendarInviteProcessor:
         assert any("duration" in w.field for w in result.warnings)
 
 
+# Processing is deterministic and the invites are only read, so each is
+# built once for the module
+@pytest.fixture(scope="module")
+def processed_teams(processor):
+    """Invite for the Teams/Jobylon input."""
+    return processor.process(_teams_jobylon_input())
+
+
+@pytest.fixture(scope="module")
+def processed_onsite(processor):
+    """Invite for an on-site interview with manual booking."""
+    return processor.process(_make_input(
+        position_name="Product Manager",
+        hiring_manager=PersonInfo(name="Jane Director", title="VP Product"),
+        recruiter_name="Tom Recruiter",
+        location_type=LocationType.ONSITE,
+        interview_type=InterviewType.CASE,
+        duration=90,
+        booking_method=BookingMethod.MANUAL,
+        city=City.STOCKHOLM,
+        manual_date_time=ManualDateTime(date="Monday, 20 January", time="10:00"),
+    ))
+
+
 class TestCalendarInviteProcessorProcess:
     """Tests for CalendarInviteProcessor.process method."""
     
-    @pytest.fixture
-    def processor(self):
-        """Create processor instance."""
-        return CalendarInviteProcessor()
-    
     @pytest.fixture
     def valid_teams_jobylon_input(self):
         """Create valid input for Teams interview with Jobylon booking."""
-        return CalendarInviteInput(
-            position_name="Senior Software Engineer",
-            hiring_manager=PersonInfo(name="John Manager", title="Engineering Director"),
-            recruiter_name="Sarah Recruiter",
-            location_type=LocationType.TEAMS,
-            interview_type=InterviewType.HIRING_MANAGER,
-            duration=60,
-            booking_method=BookingMethod.JOBYLON,
-        )
+        return _teams_jobylon_input()
     
-    @pytest.fixture
-    def valid_onsite_manual_input(self):
-        """Create valid input for on-site interview with manual booking."""
-        return CalendarInviteInput(
-            position_name="Product Manager",
-            hiring_manager=PersonInfo(name="Jane Director", title="VP Product"),
-            recruiter_name="Tom Recruiter",
-            location_type=LocationType.ONSITE,
-            interview_type=InterviewType.CASE,
-            duration=90,
-            booking_method=BookingMethod.MANUAL,
-            city=City.STOCKHOLM,
-            manual_date_time=ManualDateTime(date="Monday, 20 January", time="10:00"),
-        )
-    
-    def test_process_returns_calendar_invite(self, processor, valid_teams_jobylon_input):
+    def test_process_returns_calendar_invite(self, processed_teams):
         """Should return CalendarInvite object."""
-        result = processor.process(valid_teams_jobylon_input)
-        assert isinstance(result, CalendarInvite)
+        assert isinstance(processed_teams, CalendarInvite)
     
-    def test_process_candidate_in_subject(self, processor, valid_teams_jobylon_input):
+    def test_process_candidate_in_subject(self, processed_teams):
         """Candidate placeholder should be in subject (Requirement 11.5)."""
-        result = processor.process(valid_teams_jobylon_input)
-        assert result.has_candidate_in_subject() is True
-        assert DEFAULT_CANDIDATE_PLACEHOLDER in result.subject
+        assert processed_teams.has_candidate_in_subject() is True
+        assert DEFAULT_CANDIDATE_PLACEHOLDER in processed_teams.subject
     
-    def test_process_candidate_in_greeting(self, processor, valid_teams_jobylon_input):
+    def test_process_candidate_in_greeting(self, processed_teams):
         """Candidate placeholder should be in greeting (Requirement 11.5)."""
-        result = processor.process(valid_teams_jobylon_input)
-        assert result.has_candidate_in_greeting() is True
-        assert f"Dear {DEFAULT_CANDIDATE_PLACEHOLDER}" in result.body
+        assert processed_teams.has_candidate_in_greeting() is True
+        assert f"Dear {DEFAULT_CANDIDATE_PLACEHOLDER}" in processed_teams.body
     
-    def test_process_subject_contains_interview_type(self, processor, valid_teams_jobylon_input):
+    def test_process_subject_contains_interview_type(self, processed_teams):
         """Subject should contain interview type."""
-        result = processor.process(valid_teams_jobylon_input)
-        assert "Hiring Manager Interview" in result.subject
+        assert "Hiring Manager Interview" in processed_teams.subject
     
-    def test_process_subject_contains_position(self, processor, valid_teams_jobylon_input):
+    def test_process_subject_contains_position(self, processed_teams):
         """Subject should contain position name."""
-        result = processor.process(valid_teams_jobylon_input)
-        assert "Senior Software Engineer" in result.subject
+        assert "Senior Software Engineer" in processed_teams.subject
     
-    def test_process_body_contains_position(self, processor, valid_teams_jobylon_input):
+    def test_process_body_contains_position(self, processed_teams):
         """Body should contain position name."""
-        result = processor.process(valid_teams_jobylon_input)
-        assert "Senior Software Engineer" in result.body
+        assert "Senior Software Engineer" in processed_teams.body
     
-    def test_process_body_contains_hiring_manager(self, processor, valid_teams_jobylon_input):
+    def test_process_body_contains_hiring_manager(self, processed_teams):
         """Body should contain hiring manager details."""
-        result = processor.process(valid_teams_jobylon_input)
-        assert "John Manager" in result.body
-        assert "Engineering Director" in result.body
+        assert "John Manager" in processed_teams.body
+        assert "Engineering Director" in processed_teams.body
     
-    def test_process_body_contains_recruiter(self, processor, valid_teams_jobylon_input):
+    def test_process_body_contains_recruiter(self, processed_teams):
         """Body should contain recruiter name."""
-        result = processor.process(valid_teams_jobylon_input)
-        assert "Sarah Recruiter" in result.body
+        assert "Sarah Recruiter" in processed_teams.body
     
-    def test_process_teams_location(self, processor, valid_teams_jobylon_input):
+    def test_process_teams_location(self, processed_teams):
         """Teams interview should mention Microsoft Teams."""
-        result = processor.process(valid_teams_jobylon_input)
-        assert "Microsoft Teams" in result.body
+        assert "Microsoft Teams" in processed_teams.body
     
-    def test_process_jobylon_booking_instruction(self, processor, valid_teams_jobylon_input):
+    def test_process_jobylon_booking_instruction(self, processed_teams):
         """Jobylon booking should include booking instruction (Requirement 11.3)."""
-        result = processor.process(valid_teams_jobylon_input)
-        assert "Jobylon" in result.body
-        assert "booking" in result.body.lower()
+        assert "Jobylon" in processed_teams.body
+        assert "booking" in processed_teams.body.lower()
     
-    def test_process_onsite_includes_address(self, processor, valid_onsite_manual_input):
+    def test_process_onsite_includes_address(self, processed_onsite):
         """On-site interview should include office address (Requirement 11.2)."""
-        result = processor.process(valid_onsite_manual_input)
-        stockholm_office = OFFICE_LOCATIONS[City.STOCKHOLM]
-        assert stockholm_office.address in result.body
+        assert _STOCKHOLM_OFFICE.address in processed_onsite.body
     
-    def test_process_onsite_includes_map_link(self, processor, valid_onsite_manual_input):
+    def test_process_onsite_includes_map_link(self, processed_onsite):
         """On-site interview should include map link (Requirement 11.2)."""
-        result = processor.process(valid_onsite_manual_input)
-        stockholm_office = OFFICE_LOCATIONS[City.STOCKHOLM]
-        assert stockholm_office.maps_link in result.body
+        assert _STOCKHOLM_OFFICE.maps_link in processed_onsite.body
     
-    def test_process_manual_booking_includes_date(self, processor, valid_onsite_manual_input):
+    def test_process_manual_booking_includes_date(self, processed_onsite):
         """Manual booking should include date (Requirement 11.4)."""
-        result = processor.process(valid_onsite_manual_input)
-        assert "Monday, 20 January" in result.body
+        assert "Monday, 20 January" in processed_onsite.body
     
-    def test_process_manual_booking_includes_time(self, processor, valid_onsite_manual_input):
+    def test_process_manual_booking_includes_time(self, processed_onsite):
         """Manual booking should include time (Requirement 11.4)."""
-        result = processor.process(valid_onsite_manual_input)
-        assert "10:00" in result.body
+        assert "10:00" in processed_onsite.body
     
-    def test_process_manual_booking_no_jobylon(self, processor, valid_onsite_manual_input):
+    def test_process_manual_booking_no_jobylon(self, processed_onsite):
         """Manual booking should not mention Jobylon."""
-        result = processor.process(valid_onsite_manual_input)
-        assert "Jobylon" not in result.body
+        assert "Jobylon" not in processed_onsite.body
     
     def test_process_with_additional_participants(self, processor, valid_teams_jobylon_input):
         """Should include additional participants."""
@@ -466,42 +456,20 @@ class TestCalendarInviteProcessorProcess:
     
     def test_process_raises_on_invalid_input(self, processor):
         """Should raise error on invalid input."""
-        invalid_input = CalendarInviteInput(
-            position_name="",  # Invalid: empty
-            hiring_manager=PersonInfo(name="John", title="Manager"),
-            recruiter_name="Sarah",
-            location_type=LocationType.TEAMS,
-            interview_type=InterviewType.HIRING_MANAGER,
-            duration=60,
-            booking_method=BookingMethod.JOBYLON,
-        )
-        with pytest.raises(MissingRequiredFieldError):
+        invalid_input = _make_input(position_name="")
+        with pytest.raises(MissingRequiredFieldError, match="Position name"):
             processor.process(invalid_input)
     
     def test_process_raises_on_missing_city_for_onsite(self, processor):
         """Should raise error when city missing for on-site."""
-        invalid_input = CalendarInviteInput(
-            position_name="Engineer",
-            hiring_manager=PersonInfo(name="John", title="Manager"),
-            recruiter_name="Sarah",
-            location_type=LocationType.ONSITE,
-            interview_type=InterviewType.HIRING_MANAGER,
-            duration=60,
-            booking_method=BookingMethod.JOBYLON,
-            city=None,  # Invalid: required for on-site
-        )
-        with pytest.raises(MissingRequiredFieldError):
+        invalid_input = _make_input(location_type=LocationType.ONSITE, city=None)
+        with pytest.raises(MissingRequiredFieldError, match="City"):
             processor.process(invalid_input)
 
 
 class TestCalendarInviteProcessorInputLists:
     """Tests for required/optional input lists."""
     
-    @pytest.fixture
-    def processor(self):
-        """Create processor instance."""
-        return CalendarInviteProcessor()
-    
     def test_get_required_inputs(self, processor):
         """Should return all required inputs (Requirement 11.1)."""
         required = processor.get_required_inputs()
@@ -526,59 +494,16 @@ class TestCalendarInviteProcessorInputLists:
 class TestAllCityOfficeAddresses:
     """Tests for office address correctness across all cities (Property 28)."""
     
-    def test_stockholm_address_in_invite(self):
-        """Stockholm address should appear correctly in invite."""
-        processor = CalendarInviteProcessor()
-        input_data = CalendarInviteInput(
-            position_name="Engineer",
-            hiring_manager=PersonInfo(name="John", title="Manager"),
-            recruiter_name="Sarah",
-            location_type=LocationType.ONSITE,
-            interview_type=InterviewType.HIRING_MANAGER,
-            duration=60,
-            booking_method=BookingMethod.MANUAL,
-            city=City.STOCKHOLM,
-            manual_date_time=ManualDateTime(date="Monday", time="10:00"),
-        )
-        result = processor.process(input_data)
-        office = OFFICE_LOCATIONS[City.STOCKHOLM]
-        assert office.address in result.body
-        assert office.maps_link in result.body
-    
-    def test_copenhagen_address_in_invite(self):
-        """Copenhagen address should appear correctly in invite."""
-        processor = CalendarInviteProcessor()
-        input_data = CalendarInviteInput(
-            position_name="Engineer",
-            hiring_manager=PersonInfo(name="John", title="Manager"),
-            recruiter_name="Sarah",
-            location_type=LocationType.ONSITE,
-            interview_type=InterviewType.HIRING_MANAGER,
-            duration=60,
-            booking_method=BookingMethod.MANUAL,
-            city=City.COPENHAGEN,
-            manual_date_time=ManualDateTime(date="Monday", time="10:00"),
-        )
-        result = processor.process(input_data)
-        office = OFFICE_LOCATIONS[City.COPENHAGEN]
-        assert office.address in result.body
-        assert office.maps_link in result.body
-    
-    def test_oslo_address_in_invite(self):
-        """Oslo address should appear correctly in invite."""
-        processor = CalendarInviteProcessor()
-        input_data = CalendarInviteInput(
-            position_name="Engineer",
-            hiring_manager=PersonInfo(name="John", title="Manager"),
-            recruiter_name="Sarah",
+    @pytest.mark.parametrize("city", list(City))
+    def test_address_in_invite(self, processor, city):
+        """Each city's address should appear correctly in invite."""
+        input_data = _make_input(
             location_type=LocationType.ONSITE,
-            interview_type=InterviewType.HIRING_MANAGER,
-            duration=60,
             booking_method=BookingMethod.MANUAL,
-            city=City.OSLO,
+            city=city,
             manual_date_time=ManualDateTime(date="Monday", time="10:00"),
         )
         result = processor.process(input_data)
-        office = OFFICE_LOCATIONS[City.OSLO]
+        office = OFFICE_LOCATIONS[city]
         assert office.address in result.body
         assert office.maps_link in result.body
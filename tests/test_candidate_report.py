@@ -11,6 +11,7 @@ Tests cover:
 
 import pytest
 import json
+from dataclasses import replace
 from datetime import datetime
 
 from src.tata.modules.report.candidate import (
@@ -46,7 +47,9 @@ from src.tata.modules.screening.screening import (
 from src.tata.memory.memory import ArtifactType
 
 
-@pytest.fixture
+# The sample fixtures are read-only value objects, so one instance of
+# each is shared by the whole module. Tests needing a variant build it.
+@pytest.fixture(scope="module")
 def sample_profile():
     """Create a sample requirement profile for testing."""
     return RequirementProfile(
@@ -69,7 +72,7 @@ def sample_profile():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_screening_template(sample_profile):
     """Create a sample screening template for testing."""
     return ScreeningTemplate(
@@ -96,7 +99,7 @@ def sample_screening_template(sample_profile):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_transcript():
     """Create a sample Microsoft Teams transcript for testing."""
     return """0:00:15 Interviewer
@@ -131,7 +134,7 @@ I'm expecting around 55000 SEK per month.
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_input(sample_profile, sample_screening_template, sample_transcript):
     """Create a sample CandidateReportInput for testing."""
     return CandidateReportInput(
@@ -143,16 +146,64 @@ def sample_input(sample_profile, sample_screening_template, sample_transcript):
     )
 
 
+@pytest.fixture(scope="module")
+def processor():
+    """Create a CandidateReportProcessor instance shared by the module."""
+    return CandidateReportProcessor()
+
+
+@pytest.fixture(scope="module")
+def processed_report(processor, sample_input):
+    """Report for sample_input, processed once for the read-only tests."""
+    return processor.process(sample_input)
+
+
+def _assessment(skill_name, rating):
+    """Build a SkillAssessment with placeholder text."""
+    return SkillAssessment(
+        skill_name=skill_name,
+        summary="Summary",
+        examples=[],
+        rating=rating,
+        rating_explanation="Explanation",
+    )
+
+
+@pytest.fixture
+def report():
+    """Create a recommended CandidateReport with no skill assessments."""
+    return CandidateReport(
+        candidate_initials="JS",
+        candidate_full_name="John Smith",
+        position_name="Engineer",
+        interview_date=datetime(2024, 1, 15),
+        recommendation=Recommendation.RECOMMENDED,
+        professional_background="Background",
+        motivation_assessment=_assessment("Motivation", Rating.GOOD),
+        skill_assessments=[],
+        practical_details=PracticalDetails(
+            notice_period="1 month",
+            salary_expectation="50000",
+            location="Stockholm",
+        ),
+        risks_and_considerations=[],
+        conclusion="Conclusion",
+    )
+
+
 class TestRating:
     """Tests for Rating enum."""
     
-    def test_all_ratings_defined(self):
+    @pytest.mark.parametrize("rating,value", [
+        (Rating.VERY_BAD, 1),
+        (Rating.UNSATISFACTORY, 2),
+        (Rating.OKAY, 3),
+        (Rating.GOOD, 4),
+        (Rating.EXCELLENT, 5),
+    ])
+    def test_all_ratings_defined(self, rating, value):
         """Test all ratings are defined with correct values."""
-        assert Rating.VERY_BAD.value == 1
-        assert Rating.UNSATISFACTORY.value == 2
-        assert Rating.OKAY.value == 3
-        assert Rating.GOOD.value == 4
-        assert Rating.EXCELLENT.value == 5
+        assert rating.value == value
     
     def test_all_ratings_have_descriptions(self):
         """Test all ratings have descriptions."""
@@ -164,11 +215,14 @@ class TestRating:
 class TestRecommendation:
     """Tests for Recommendation enum."""
     
-    def test_all_recommendations_defined(self):
+    @pytest.mark.parametrize("recommendation,value", [
+        (Recommendation.RECOMMENDED, "Recommended"),
+        (Recommendation.NOT_RECOMMENDED, "Not Recommended"),
+        (Recommendation.BORDERLINE, "Borderline"),
+    ])
+    def test_all_recommendations_defined(self, recommendation, value):
         """Test all recommendations are defined."""
-        assert Recommendation.RECOMMENDED.value == "Recommended"
-        assert Recommendation.NOT_RECOMMENDED.value == "Not Recommended"
-        assert Recommendation.BORDERLINE.value == "Borderline"
+        assert recommendation.value == value
 
 
 class TestSkillAssessment:
@@ -241,38 +295,24 @@ class TestPracticalDetails:
 class TestAnonymizeName:
     """Tests for anonymize_name function (Req 8.7)."""
     
-    def test_two_part_name(self):
-        """Test anonymizing a two-part name."""
-        assert anonymize_name("John Smith") == "JS"
-    
-    def test_three_part_name(self):
-        """Test anonymizing a three-part name."""
-        assert anonymize_name("John Michael Smith") == "JMS"
+    @pytest.mark.parametrize("name,expected", [
+        ("John Smith", "JS"),
+        ("John Michael Smith", "JMS"),
+        ("", "XX"),
+        ("   ", "XX"),
+        (None, "XX"),
+        ("John Michael David Smith", "JMD"),  # Only the first 3 parts
+        ("john smith", "JS"),
+    ])
+    def test_anonymize_name(self, name, expected):
+        """Test names map to uppercase initials, or XX when blank."""
+        assert anonymize_name(name) == expected
     
     def test_single_name(self):
         """Test anonymizing a single name."""
         result = anonymize_name("John")
         assert len(result) >= 2
         assert result[0] == "J"
-    
-    def test_empty_name(self):
-        """Test anonymizing empty name returns XX."""
-        assert anonymize_name("") == "XX"
-        assert anonymize_name("   ") == "XX"
-    
-    def test_none_name(self):
-        """Test anonymizing None returns XX."""
-        assert anonymize_name(None) == "XX"
-    
-    def test_four_part_name_truncates(self):
-        """Test four-part name only uses first 3 parts."""
-        result = anonymize_name("John Michael David Smith")
-        assert len(result) == 3
-        assert result == "JMD"
-    
-    def test_lowercase_converted_to_uppercase(self):
-        """Test lowercase names are converted to uppercase."""
-        assert anonymize_name("john smith") == "JS"
 
 
 class TestValidateRating:
@@ -331,70 +371,21 @@ class TestCandidateReportInput:
 class TestCandidateReport:
     """Tests for CandidateReport dataclass."""
     
-    def test_create_report(self):
+    def test_create_report(self, report):
         """Test creating a candidate report."""
-        report = CandidateReport(
-            candidate_initials="JS",
-            candidate_full_name="John Smith",
-            position_name="Software Engineer",
-            interview_date=datetime(2024, 1, 15),
-            recommendation=Recommendation.RECOMMENDED,
-            professional_background="5 years experience",
-            motivation_assessment=SkillAssessment(
-                skill_name="Motivation",
-                summary="Strong motivation",
-                examples=["Excited about role"],
-                rating=Rating.GOOD,
-                rating_explanation="Clear interest shown",
-            ),
-            skill_assessments=[
-                SkillAssessment(
-                    skill_name="Python",
-                    summary="Strong Python",
-                    examples=["Built APIs"],
-                    rating=Rating.EXCELLENT,
-                    rating_explanation="Excellent examples",
-                ),
-            ],
-            practical_details=PracticalDetails(
-                notice_period="3 months",
-                salary_expectation="55000 SEK",
-                location="Stockholm",
-            ),
-            risks_and_considerations=["Long notice period"],
-            conclusion="Recommend proceeding.",
+        report = replace(
+            report,
+            skill_assessments=[_assessment("Python", Rating.EXCELLENT)],
         )
         
         assert report.candidate_initials == "JS"
         assert report.recommendation == Recommendation.RECOMMENDED
         assert report.artifact_type == ArtifactType.CANDIDATE_REPORTS
+        assert [a.skill_name for a in report.skill_assessments] == ["Python"]
+        assert report.skill_assessments[0].rating == Rating.EXCELLENT
     
-    def test_to_json_serialization(self):
+    def test_to_json_serialization(self, report):
         """Test JSON serialization."""
-        report = CandidateReport(
-            candidate_initials="JS",
-            candidate_full_name="John Smith",
-            position_name="Software Engineer",
-            interview_date=datetime(2024, 1, 15),
-            recommendation=Recommendation.RECOMMENDED,
-            professional_background="Background",
-            motivation_assessment=SkillAssessment(
-                skill_name="Motivation",
-                summary="Summary",
-                examples=[],
-                rating=Rating.GOOD,
-                rating_explanation="Explanation",
-            ),
-            skill_assessments=[],
-            practical_details=PracticalDetails(
-                notice_period="1 month",
-                salary_expectation="50000",
-                location="Stockholm",
-            ),
-            risks_and_considerations=[],
-            conclusion="Conclusion",
-        )
-        
         json_str = report.to_json()
         data = json.loads(json_str)
         
@@ -402,45 +393,15 @@ class TestCandidateReport:
         assert data["recommendation"] == "Recommended"
         assert data["motivation_assessment"]["rating"] == 4
     
-    def test_get_average_rating(self):
+    def test_get_average_rating(self, report):
         """Test calculating average rating."""
-        report = CandidateReport(
-            candidate_initials="JS",
-            candidate_full_name="John Smith",
-            position_name="Engineer",
-            interview_date=datetime.now(),
-            recommendation=Recommendation.RECOMMENDED,
-            professional_background="Background",
-            motivation_assessment=SkillAssessment(
-                skill_name="Motivation",
-                summary="Summary",
-                examples=[],
-                rating=Rating.GOOD,  # 4
-                rating_explanation="Explanation",
-            ),
+        report = replace(
+            report,
+            motivation_assessment=_assessment("Motivation", Rating.GOOD),  # 4
             skill_assessments=[
-                SkillAssessment(
-                    skill_name="Skill1",
-                    summary="Summary",
-                    examples=[],
-                    rating=Rating.EXCELLENT,  # 5
-                    rating_explanation="Explanation",
-                ),
-                SkillAssessment(
-                    skill_name="Skill2",
-                    summary="Summary",
-                    examples=[],
-                    rating=Rating.OKAY,  # 3
-                    rating_explanation="Explanation",
-                ),
+                _assessment("Skill1", Rating.EXCELLENT),  # 5
+                _assessment("Skill2", Rating.OKAY),  # 3
             ],
-            practical_details=PracticalDetails(
-                notice_period="1 month",
-                salary_expectation="50000",
-                location="Stockholm",
-            ),
-            risks_and_considerations=[],
-            conclusion="Conclusion",
         )
         
         # Average: (4 + 5 + 3) / 3 = 4.0
@@ -450,11 +411,6 @@ class TestCandidateReport:
 class TestCandidateReportProcessor:
     """Tests for CandidateReportProcessor."""
     
-    @pytest.fixture
-    def processor(self):
-        """Create a processor instance."""
-        return CandidateReportProcessor()
-    
     def test_get_required_inputs(self, processor):
         """Test getting required inputs."""
         required = processor.get_required_inputs()
@@ -546,13 +502,11 @@ class TestCandidateReportProcessor:
         assert result.is_valid is True
         assert len(result.errors) == 0
     
-    def test_process_creates_report(self, processor, sample_input):
+    def test_process_creates_report(self, processed_report):
         """Test processing creates a valid report."""
-        report = processor.process(sample_input)
-        
-        assert report.candidate_initials == "JS"
-        assert report.position_name == "Senior Software Engineer"
-        assert report.artifact_type == ArtifactType.CANDIDATE_REPORTS
+        assert processed_report.candidate_initials == "JS"
+        assert processed_report.position_name == "Senior Software Engineer"
+        assert processed_report.artifact_type == ArtifactType.CANDIDATE_REPORTS
     
     def test_process_invalid_input_raises(self, processor, sample_profile, sample_screening_template):
         """Test processing raises for invalid input."""
@@ -571,10 +525,6 @@ class TestCandidateReportProcessor:
 class TestTranscriptProcessing:
     """Tests for transcript processing (Req 8.1, 8.2)."""
     
-    @pytest.fixture
-    def processor(self):
-        return CandidateReportProcessor()
-    
     def test_corrects_transcription_errors(self, processor):
         """Test transcription errors are corrected (Req 8.2)."""
         transcript = "I'm gonna work on this. I wanna learn more."
@@ -606,10 +556,6 @@ class TestTranscriptProcessing:
 class TestContentExtraction:
     """Tests for content extraction (Req 8.3)."""
     
-    @pytest.fixture
-    def processor(self):
-        return CandidateReportProcessor()
-    
     def test_extracts_motivation_content(self, processor, sample_transcript):
         """Test extracting motivation-related content."""
         sections = processor._parse_transcript(sample_transcript)
@@ -633,114 +579,61 @@ class TestContentExtraction:
 class TestReportStructure:
     """Tests for report structure (Req 8.5)."""
     
-    @pytest.fixture
-    def processor(self):
-        return CandidateReportProcessor()
-    
-    def test_report_has_all_sections(self, processor, sample_input):
+    def test_report_has_all_sections(self, processed_report):
         """Test report has all required sections."""
-        report = processor.process(sample_input)
-        
         # Candidate Summary (via initials and recommendation)
-        assert report.candidate_initials
-        assert report.recommendation
+        assert processed_report.candidate_initials
+        assert processed_report.recommendation
         
         # Professional Background
-        assert report.professional_background
+        assert processed_report.professional_background
         
         # Motivation Assessment
-        assert report.motivation_assessment
-        assert report.motivation_assessment.skill_name == "Motivation"
+        assert processed_report.motivation_assessment
+        assert processed_report.motivation_assessment.skill_name == "Motivation"
         
         # Skill Assessments
-        assert len(report.skill_assessments) > 0
+        assert len(processed_report.skill_assessments) > 0
         
         # Practical Details
-        assert report.practical_details
+        assert processed_report.practical_details
         
         # Risks/Considerations
-        assert isinstance(report.risks_and_considerations, list)
+        assert isinstance(processed_report.risks_and_considerations, list)
         
         # Conclusion
-        assert report.conclusion
+        assert processed_report.conclusion
     
-    def test_report_anonymizes_candidate(self, processor, sample_input):
+    def test_report_anonymizes_candidate(self, processed_report):
         """Test candidate is anonymized (Req 8.7)."""
-        report = processor.process(sample_input)
-        
         # Initials should be 2-3 characters
-        assert 2 <= len(report.candidate_initials) <= 3
+        assert 2 <= len(processed_report.candidate_initials) <= 3
         # Full name should still be stored internally
-        assert report.candidate_full_name == "John Smith"
+        assert processed_report.candidate_full_name == "John Smith"
 
 
 class TestComparisonTable:
     """Tests for comparison table creation (Req 8.7)."""
     
-    def test_creates_comparison_table(self):
+    def test_creates_comparison_table(self, report):
         """Test creating a comparison table."""
         reports = [
-            CandidateReport(
-                candidate_initials="JS",
-                candidate_full_name="John Smith",
-                position_name="Engineer",
-                interview_date=datetime.now(),
-                recommendation=Recommendation.RECOMMENDED,
-                professional_background="Background",
-                motivation_assessment=SkillAssessment(
-                    skill_name="Motivation",
-                    summary="Summary",
-                    examples=[],
-                    rating=Rating.GOOD,
-                    rating_explanation="Explanation",
-                ),
-                skill_assessments=[
-                    SkillAssessment(
-                        skill_name="Python",
-                        summary="Summary",
-                        examples=[],
-                        rating=Rating.EXCELLENT,
-                        rating_explanation="Explanation",
-                    ),
-                ],
-                practical_details=PracticalDetails(
-                    notice_period="1 month",
-                    salary_expectation="50000",
-                    location="Stockholm",
-                ),
-                risks_and_considerations=[],
-                conclusion="Conclusion",
+            replace(
+                report,
+                skill_assessments=[_assessment("Python", Rating.EXCELLENT)],
             ),
-            CandidateReport(
+            replace(
+                report,
                 candidate_initials="JD",
                 candidate_full_name="Jane Doe",
-                position_name="Engineer",
-                interview_date=datetime.now(),
                 recommendation=Recommendation.BORDERLINE,
-                professional_background="Background",
-                motivation_assessment=SkillAssessment(
-                    skill_name="Motivation",
-                    summary="Summary",
-                    examples=[],
-                    rating=Rating.OKAY,
-                    rating_explanation="Explanation",
-                ),
-                skill_assessments=[
-                    SkillAssessment(
-                        skill_name="Python",
-                        summary="Summary",
-                        examples=[],
-                        rating=Rating.GOOD,
-                        rating_explanation="Explanation",
-                    ),
-                ],
+                motivation_assessment=_assessment("Motivation", Rating.OKAY),
+                skill_assessments=[_assessment("Python", Rating.GOOD)],
                 practical_details=PracticalDetails(
                     notice_period="2 months",
                     salary_expectation="55000",
                     location="Copenhagen",
                 ),
-                risks_and_considerations=[],
-                conclusion="Conclusion",
             ),
         ]
         
@@ -766,30 +659,12 @@ class TestComparisonTable:
         assert table["headers"] == []
         assert table["rows"] == []
     
-    def test_uses_initials_not_full_names(self):
+    def test_uses_initials_not_full_names(self, report):
         """Test comparison table uses initials, not full names (Req 8.7)."""
-        report = CandidateReport(
+        report = replace(
+            report,
             candidate_initials="ABC",
             candidate_full_name="Alice Bob Charlie",
-            position_name="Engineer",
-            interview_date=datetime.now(),
-            recommendation=Recommendation.RECOMMENDED,
-            professional_background="Background",
-            motivation_assessment=SkillAssessment(
-                skill_name="Motivation",
-                summary="Summary",
-                examples=[],
-                rating=Rating.GOOD,
-                rating_explanation="Explanation",
-            ),
-            skill_assessments=[],
-            practical_details=PracticalDetails(
-                notice_period="1 month",
-                salary_expectation="50000",
-                location="Stockholm",
-            ),
-            risks_and_considerations=[],
-            conclusion="Conclusion",
         )
         
         table = create_comparison_table([report])
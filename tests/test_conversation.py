@@ -245,6 +245,32 @@ class TestTruncation:
         assert messages[0].role == MessageRole.SYSTEM
         assert "Tata" in messages[0].content
 
+    def test_conversation_window_bounded(self):
+        """History should never grow past the configured window."""
+        manager = InMemoryConversationManager(max_messages=4)
+        
+        for i in range(20):
+            manager.add_user_message(f"User {i}")
+            manager.add_assistant_message(f"Assistant {i}")
+            assert len(manager.get_messages()) <= 5
+
+    def test_truncation_drops_orphaned_tool_results(self):
+        """Tool results should not outlive their truncated tool call."""
+        manager = InMemoryConversationManager(max_messages=3)
+        manager.add_user_message("Create a profile")
+        manager.add_assistant_tool_calls([
+            ToolCall(id="call_1", name="create_requirement_profile", arguments="{}"),
+            ToolCall(id="call_2", name="create_job_ad", arguments="{}"),
+        ])
+        manager.add_tool_result("call_1", "create_requirement_profile", "{}")
+        manager.add_tool_result("call_2", "create_job_ad", "{}")
+        
+        manager.add_assistant_message("Done")
+        
+        messages = manager.get_messages()
+        assert messages[0].role == MessageRole.SYSTEM
+        assert [m.role for m in messages[1:]] == [MessageRole.ASSISTANT]
+
 
 class TestThreadSafety:
     """Tests for thread safety."""
@@ -294,3 +294,45 @@ class TestInMemoryDependencyManager:
         # Session-2 should not be able to execute Job Ad
         result2 = dep_manager.can_execute("session-2", ModuleType.JOB_AD)
         assert result2.can_proceed is False
+
+    def test_can_execute_batch_matches_can_execute(self):
+        """can_execute_batch should agree with can_execute for every module."""
+        memory_manager = InMemoryMemoryManager()
+        dep_manager = InMemoryDependencyManager(memory_manager)
+        profile = MockArtifact(
+            name="profile",
+            _artifact_type=ArtifactType.REQUIREMENT_PROFILE
+        )
+        memory_manager.store("session-1", profile)
+        
+        checks = dep_manager.can_execute_batch("session-1", ModuleType)
+        
+        assert list(checks) == list(ModuleType)
+        for module, check in checks.items():
+            assert check == dep_manager.can_execute("session-1", module)
+
+    def test_can_execute_batch_reads_artifacts_once(self):
+        """can_execute_batch should read the session's artifacts a single time."""
+        memory_manager = InMemoryMemoryManager()
+        dep_manager = InMemoryDependencyManager(memory_manager)
+        reads = []
+        get_all_artifacts = memory_manager.get_all_artifacts
+        memory_manager.get_all_artifacts = lambda session_id: (
+            reads.append(session_id) or get_all_artifacts(session_id)
+        )
+        
+        checks = dep_manager.can_execute_batch("session-1", ModuleType)
+        
+        assert reads == ["session-1"]
+        assert checks[ModuleType.CANDIDATE_REPORT].missing_dependencies == [
+            ModuleType.REQUIREMENT_PROFILE,
+            ModuleType.TA_SCREENING,
+        ]
+
+    def test_can_execute_batch_empty_session_id_raises(self):
+        """can_execute_batch should raise EmptySessionIDError for empty session ID."""
+        memory_manager = InMemoryMemoryManager()
+        dep_manager = InMemoryDependencyManager(memory_manager)
+        
+        with pytest.raises(EmptySessionIDError):
+            dep_manager.can_execute_batch("", ModuleType)
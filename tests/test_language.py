@@ -158,6 +158,10 @@ class TestEmojiDetection:
     def test_special_characters_not_emojis(self):
         """Special characters like © should not be detected as emojis."""
         assert has_emojis("Copyright © 2024") is False
+    
+    def test_ascii_emoticons_not_emojis(self):
+        """ASCII emoticons like :-) should not be detected as emojis."""
+        assert has_emojis("Great team :-) ;)") is False
 
 
 class TestDashBulletDetection:
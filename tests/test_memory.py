@@ -295,3 +295,44 @@ class TestInMemoryMemoryManager:
         
         assert manager.retrieve("session-1", ArtifactType.REQUIREMENT_PROFILE) is None
         assert manager.retrieve("session-2", ArtifactType.REQUIREMENT_PROFILE) is not None
+
+    def test_fingerprint_changes_on_store_and_clear(self):
+        """fingerprint should change whenever a session's artifacts change."""
+        manager = InMemoryMemoryManager()
+        artifact = MockArtifact(
+            name="profile",
+            data="data",
+            _artifact_type=ArtifactType.REQUIREMENT_PROFILE
+        )
+        
+        empty = manager.fingerprint("session-1")
+        manager.store("session-1", artifact)
+        stored = manager.fingerprint("session-1")
+        manager.clear_session("session-1")
+        manager.store("session-1", artifact)
+        
+        assert stored != empty
+        assert manager.fingerprint("session-1") not in (empty, stored)
+
+    def test_fingerprint_unchanged_by_reads_and_other_sessions(self):
+        """fingerprint should not change for reads or other sessions' writes."""
+        manager = InMemoryMemoryManager()
+        artifact = MockArtifact(
+            name="profile",
+            data="data",
+            _artifact_type=ArtifactType.REQUIREMENT_PROFILE
+        )
+        manager.store("session-1", artifact)
+        before = manager.fingerprint("session-1")
+        
+        manager.retrieve("session-1", ArtifactType.REQUIREMENT_PROFILE)
+        manager.store("session-2", artifact)
+        
+        assert manager.fingerprint("session-1") == before
+
+    def test_fingerprint_empty_session_id_raises(self):
+        """fingerprint should raise EmptySessionIDError for empty session ID."""
+        manager = InMemoryMemoryManager()
+        
+        with pytest.raises(EmptySessionIDError):
+            manager.fingerprint("")
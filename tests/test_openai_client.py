@@ -15,7 +15,10 @@ Requirements covered:
 
 import os
 import pytest
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 from unittest.mock import patch
 
 from src.tata.agent.client import (
@@ -122,6 +125,128 @@ class TestRealOpenAIClientInit:
         
         assert client._timeout == 60.0
 
+    def test_max_retries_passed_to_sdk(self):
+        """max_retries should configure the SDK's 429/5xx retry policy."""
+        client = RealOpenAIClient(api_key="test-key", max_retries=2)
+        
+        assert client._client.max_retries == 2
+
+    def test_concurrent_requests_are_bounded(self):
+        """No more than max_concurrent_requests calls should be in flight."""
+        client = RealOpenAIClient(api_key="test-key", max_concurrent_requests=2)
+        lock = threading.Lock()
+        in_flight = peak = 0
+        
+        def create(**kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            message = SimpleNamespace(content="ok", tool_calls=None)
+            return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")])
+        
+        with patch.object(client._client.chat.completions, "create", side_effect=create):
+            with ThreadPoolExecutor(max_workers=6) as pool:
+                list(pool.map(lambda _: client.chat_completion([]), range(6)))
+        
+        assert peak <= 2
+
+
+def _chunk(content=None, tool_calls=None, finish_reason=None):
+    """Build a streamed chat completion chunk."""
+    delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+    return SimpleNamespace(
+        choices=[SimpleNamespace(delta=delta, finish_reason=finish_reason)]
+    )
+
+
+def _tool_delta(index, id=None, name=None, arguments=None):
+    """Build a streamed tool call fragment."""
+    return SimpleNamespace(
+        index=index,
+        id=id,
+        function=SimpleNamespace(name=name, arguments=arguments),
+    )
+
+
+class _FakeStream:
+    """Iterable stand-in for the SDK stream that records being closed."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self.closed = False
+
+    def __iter__(self):
+        return iter(self._chunks)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.closed = True
+
+
+class TestRealOpenAIClientStream:
+    """Tests for RealOpenAIClient.chat_completion_stream."""
+
+    def test_yields_deltas_then_response(self):
+        """Text deltas should be yielded and joined in the final response."""
+        client = RealOpenAIClient(api_key="test-key")
+        chunks = [_chunk("Hel"), _chunk("lo"), _chunk(finish_reason="stop")]
+        
+        with patch.object(client._client.chat.completions, "create", return_value=_FakeStream(chunks)):
+            items = list(client.chat_completion_stream([Message(role=MessageRole.USER, content="Hi")]))
+        
+        assert items[:2] == ["Hel", "lo"]
+        assert items[-1].content == "Hello"
+        assert items[-1].tool_calls is None
+
+    def test_accumulates_tool_call_fragments(self):
+        """Tool call fragments should be merged by index."""
+        client = RealOpenAIClient(api_key="test-key")
+        chunks = [
+            _chunk(tool_calls=[_tool_delta(0, id="call-1", name="create_job_ad", arguments='{"a"')]),
+            _chunk(tool_calls=[_tool_delta(0, arguments=': 1}')]),
+            _chunk(tool_calls=[_tool_delta(1, id="call-2", name="create_funnel_report", arguments="{}")]),
+            _chunk(finish_reason="tool_calls"),
+        ]
+        
+        with patch.object(client._client.chat.completions, "create", return_value=_FakeStream(chunks)):
+            items = list(client.chat_completion_stream([Message(role=MessageRole.USER, content="Hi")]))
+        
+        assert len(items) == 1
+        response = items[0]
+        assert response.content is None
+        assert response.finish_reason == "tool_calls"
+        assert response.tool_calls == [
+            ToolCall(id="call-1", name="create_job_ad", arguments='{"a": 1}'),
+            ToolCall(id="call-2", name="create_funnel_report", arguments="{}"),
+        ]
+
+    def test_closing_early_releases_slot_and_stream(self):
+        """A reader that stops mid-stream should free its slot at once."""
+        client = RealOpenAIClient(api_key="test-key", max_concurrent_requests=1)
+        stream = _FakeStream([_chunk("Hel"), _chunk("lo"), _chunk(finish_reason="stop")])
+        
+        with patch.object(client._client.chat.completions, "create", return_value=stream):
+            items = client.chat_completion_stream([Message(role=MessageRole.USER, content="Hi")])
+            assert next(items) == "Hel"
+            items.close()
+        
+        assert stream.closed
+        assert client._request_slots.acquire(blocking=False)
+
+    def test_wraps_api_errors(self):
+        """SDK errors should surface as OpenAIAPIError."""
+        client = RealOpenAIClient(api_key="test-key")
+        
+        with patch.object(client._client.chat.completions, "create", side_effect=RuntimeError("boom")):
+            with pytest.raises(OpenAIAPIError):
+                list(client.chat_completion_stream([Message(role=MessageRole.USER, content="Hi")]))
+
 
 class TestMockOpenAIClientInit:
     """Tests for MockOpenAIClient initialization."""
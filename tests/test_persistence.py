@@ -4,6 +4,7 @@ Tests cover:
 - Session creation and retrieval with persistence
 - Session listing by recruiter
 - Artifact storage and retrieval with persistence
+- Conversation history persistence
 - Thread safety of SQLite implementations
 """
 
@@ -15,8 +16,11 @@ from pathlib import Path
 
 import pytest
 
+from src.tata.agent.conversation import InMemoryConversationManager
+from src.tata.agent.models import MessageRole, ToolCall
 from src.tata.memory.memory import ArtifactType
 from src.tata.persistence.sqlite import (
+    SQLiteConversationManager,
     SQLiteSessionManager,
     SQLiteMemoryManager,
     _StoredArtifact,
@@ -141,6 +145,19 @@ class TestSQLiteSessionManager:
         retrieved = manager.get_session(session.id)
         assert retrieved.position_name == "Senior Developer"
     
+    def test_setters_return_updated_session(self, manager):
+        """Setters return the session as stored after the update."""
+        session = manager.create_session("recruiter-1")
+        
+        named = manager.set_position_name(session.id, "Senior Developer")
+        translated = manager.set_language(session.id, SupportedLanguage.GERMAN)
+        
+        assert named.position_name == "Senior Developer"
+        assert translated.language == SupportedLanguage.GERMAN
+        assert translated.position_name == "Senior Developer"
+        assert translated.last_activity >= session.last_activity
+        assert manager.get_session(session.id) == translated
+    
     def test_set_position_name_not_found_raises(self, manager):
         """Setting position on non-existent session raises."""
         with pytest.raises(SessionNotFoundError):
@@ -172,6 +189,12 @@ class TestSQLiteSessionManager:
         
         assert module is None
     
+    def test_connection_uses_wal(self, manager):
+        """Connections open in WAL mode with relaxed sync."""
+        conn = manager._get_connection()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+    
     def test_persistence_across_manager_instances(self, db_path):
         """Data persists across manager instances."""
         manager1 = SQLiteSessionManager(db_path)
@@ -288,6 +311,20 @@ class TestSQLiteMemoryManager:
         assert retrieved.data["name"] == "second"
         assert retrieved.data["value"] == 2
     
+    def test_fingerprint_changes_when_artifacts_change(self, manager):
+        """fingerprint changes on store and clear but not on reads."""
+        empty = manager.fingerprint("session-1")
+        manager.store("session-1", MockArtifact(name="test", value=42))
+        stored = manager.fingerprint("session-1")
+        manager.retrieve("session-1", ArtifactType.REQUIREMENT_PROFILE)
+        
+        assert stored != empty
+        assert manager.fingerprint("session-1") == stored
+        
+        manager.clear_session("session-1")
+        
+        assert manager.fingerprint("session-1") != stored
+    
     def test_persistence_across_manager_instances(self, db_path):
         """Data persists across manager instances."""
         manager1 = SQLiteMemoryManager(db_path)
@@ -301,6 +338,105 @@ class TestSQLiteMemoryManager:
         assert retrieved.data["name"] == "test"
 
 
+class TestSQLiteConversationManager:
+    """Tests for SQLiteConversationManager."""
+    
+    @pytest.fixture
+    def db_path(self):
+        """Create temporary database file."""
+        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+            yield Path(f.name)
+    
+    @pytest.fixture(params=["memory", "sqlite"])
+    def manager(self, request, db_path):
+        """Create each ConversationManager implementation."""
+        if request.param == "memory":
+            return InMemoryConversationManager(max_messages=4)
+        return SQLiteConversationManager("session-1", db_path, max_messages=4)
+    
+    def test_messages_kept_in_order(self, manager):
+        """Both implementations should return the same message sequence."""
+        manager.add_user_message("Hello")
+        manager.add_assistant_message("Hi there")
+        
+        messages = manager.get_messages()
+        
+        assert [m.role for m in messages] == [
+            MessageRole.SYSTEM, MessageRole.USER, MessageRole.ASSISTANT
+        ]
+        assert messages[2].content == "Hi there"
+    
+    def test_window_is_bounded(self, manager):
+        """Both implementations should keep at most max_messages."""
+        for i in range(10):
+            manager.add_user_message(f"Message {i}")
+        
+        messages = manager.get_messages()
+        
+        assert len(messages) == 5
+        assert messages[-1].content == "Message 9"
+    
+    def test_sessions_share_a_connection(self, db_path):
+        """Managers on one thread should reuse a connection, not open their own."""
+        first = SQLiteConversationManager("session-1", db_path)
+        second = SQLiteConversationManager("session-2", db_path)
+        
+        assert first._get_connection() is second._get_connection()
+    
+    def test_history_persists_across_instances(self, db_path):
+        """A new manager for the session should restore its history."""
+        manager1 = SQLiteConversationManager("session-1", db_path)
+        manager1.add_user_message("Create a profile")
+        manager1.add_assistant_tool_calls([
+            ToolCall(id="call_1", name="create_requirement_profile", arguments="{}")
+        ])
+        manager1.add_tool_result("call_1", "create_requirement_profile", '{"ok": true}')
+        
+        manager2 = SQLiteConversationManager("session-1", db_path)
+        
+        assert manager2.get_messages() == manager1.get_messages()
+    
+    def test_restored_window_drops_orphaned_tool_results(self, db_path):
+        """Restoring past the window should not start with a tool result."""
+        manager1 = SQLiteConversationManager("session-1", db_path, max_messages=2)
+        manager1.add_user_message("Create a profile")
+        manager1.add_assistant_tool_calls([
+            ToolCall(id="call_1", name="create_requirement_profile", arguments="{}")
+        ])
+        manager1.add_tool_result("call_1", "create_requirement_profile", "{}")
+        manager1.add_assistant_message("Done")
+        
+        manager2 = SQLiteConversationManager("session-1", db_path, max_messages=2)
+        
+        assert [m.role for m in manager2.get_messages()] == [
+            MessageRole.SYSTEM, MessageRole.ASSISTANT
+        ]
+    
+    def test_sessions_are_isolated(self, db_path):
+        """Messages should only be restored for their own session."""
+        SQLiteConversationManager("session-1", db_path).add_user_message("Hello")
+        
+        messages = SQLiteConversationManager("session-2", db_path).get_messages()
+        
+        assert len(messages) == 1
+    
+    def test_clear_removes_stored_history(self, db_path):
+        """Cleared history should not come back on the next load."""
+        manager = SQLiteConversationManager("session-1", db_path)
+        manager.add_user_message("Hello")
+        manager.clear()
+        manager.add_user_message("Again")
+        
+        messages = SQLiteConversationManager("session-1", db_path).get_messages()
+        
+        assert [m.content for m in messages[1:]] == ["Again"]
+    
+    def test_empty_session_id_raises(self, db_path):
+        """Empty session ID should raise error."""
+        with pytest.raises(EmptySessionIDError):
+            SQLiteConversationManager("", db_path)
+
+
 class TestInMemorySessionManagerListSessions:
     """Tests for list_sessions in InMemorySessionManager."""
     
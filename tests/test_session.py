@@ -8,6 +8,7 @@ from src.tata.session import (
     SupportedLanguage,
     ModuleType,
     InMemorySessionManager,
+    CachedSessionManager,
     SessionNotFoundError,
     EmptyRecruiterIDError,
     EmptySessionIDError,
@@ -239,3 +240,144 @@ class TestInMemorySessionManager:
         
         with pytest.raises(SessionNotFoundError):
             manager.set_active_module("unknown-id", ModuleType.JOB_AD)
+
+
+class _CountingSessionManager(InMemorySessionManager):
+    """In-memory manager that counts reads reaching the store."""
+
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+
+    def get_session(self, session_id):
+        self.reads += 1
+        return super().get_session(session_id)
+
+    def list_sessions(self, recruiter_id):
+        self.reads += 1
+        return super().list_sessions(recruiter_id)
+
+
+class _FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCachedSessionManager:
+    """Tests for CachedSessionManager."""
+
+    def test_repeated_get_served_from_cache(self):
+        """A second get_session should not reach the backing store."""
+        inner = _CountingSessionManager()
+        manager = CachedSessionManager(inner)
+        session = inner.create_session("recruiter-1")
+        
+        assert manager.get_session(session.id) is session
+        assert manager.get_session(session.id) is session
+        assert inner.reads == 1
+
+    def test_repeated_list_served_from_cache(self):
+        """A second list_sessions should not reach the backing store."""
+        inner = _CountingSessionManager()
+        manager = CachedSessionManager(inner)
+        manager.create_session("recruiter-1")
+        
+        assert len(manager.list_sessions("recruiter-1")) == 1
+        assert len(manager.list_sessions("recruiter-1")) == 1
+        assert inner.reads == 1
+
+    def test_entries_expire_after_ttl(self):
+        """Entries older than the TTL should be reloaded."""
+        inner = _CountingSessionManager()
+        clock = _FakeClock()
+        manager = CachedSessionManager(inner, ttl=5.0, clock=clock)
+        session = inner.create_session("recruiter-1")
+        
+        manager.get_session(session.id)
+        clock.now = 5.0
+        manager.get_session(session.id)
+        assert inner.reads == 2
+
+    def test_create_writes_through_to_list(self):
+        """A created session should appear in the cached list without a reload."""
+        inner = _CountingSessionManager()
+        manager = CachedSessionManager(inner)
+        first = manager.create_session("recruiter-1")
+        assert len(manager.list_sessions("recruiter-1")) == 1
+        
+        second = manager.create_session("recruiter-1")
+        sessions = manager.list_sessions("recruiter-1")
+        assert {s.id for s in sessions} == {first.id, second.id}
+        assert manager.get_session(second.id) is second
+        assert inner.reads == 1
+
+    def test_setters_write_through(self):
+        """Writes should be visible to the next reads without extra loads."""
+        inner = _CountingSessionManager()
+        manager = CachedSessionManager(inner)
+        session = manager.create_session("recruiter-1")
+        manager.list_sessions("recruiter-1")
+        
+        manager.set_language(session.id, SupportedLanguage.GERMAN)
+        reads_after_write = inner.reads
+        
+        assert manager.get_session(session.id).language == SupportedLanguage.GERMAN
+        assert manager.list_sessions("recruiter-1")[0].language == SupportedLanguage.GERMAN
+        assert inner.reads == reads_after_write
+
+    def test_setters_return_session_without_reload(self):
+        """Setters should return the updated session without reading it back."""
+        inner = _CountingSessionManager()
+        manager = CachedSessionManager(inner)
+        session = manager.create_session("recruiter-1")
+        
+        updated = manager.set_position_name(session.id, "Engineer")
+        
+        assert updated.position_name == "Engineer"
+        assert inner.reads == 0
+
+    def test_list_stays_ordered_after_write(self):
+        """The most recently updated session should lead the cached list."""
+        manager = CachedSessionManager(InMemorySessionManager())
+        first = manager.create_session("recruiter-1")
+        manager.create_session("recruiter-1")
+        manager.list_sessions("recruiter-1")
+        
+        manager.set_position_name(first.id, "Engineer")
+        
+        assert manager.list_sessions("recruiter-1")[0].id == first.id
+
+    def test_missing_session_not_cached(self):
+        """A miss should not hide a session created later in the store."""
+        inner = _CountingSessionManager()
+        manager = CachedSessionManager(inner)
+        
+        assert manager.get_session("unknown-id") is None
+        session = inner.create_session("recruiter-1")
+        assert manager.get_session(session.id) is session
+
+    def test_least_recently_used_evicted(self):
+        """Entries beyond maxsize should be evicted oldest first."""
+        inner = _CountingSessionManager()
+        manager = CachedSessionManager(inner, maxsize=1)
+        first = inner.create_session("recruiter-1")
+        second = inner.create_session("recruiter-1")
+        
+        manager.get_session(first.id)
+        manager.get_session(second.id)
+        manager.get_session(first.id)
+        assert inner.reads == 3
+
+    def test_errors_propagate(self):
+        """Validation errors from the backing store should pass through."""
+        manager = CachedSessionManager(InMemorySessionManager())
+        
+        with pytest.raises(EmptyRecruiterIDError):
+            manager.list_sessions("")
+        with pytest.raises(SessionNotFoundError):
+            manager.set_position_name("unknown-id", "Engineer")
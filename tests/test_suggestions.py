@@ -0,0 +1,116 @@
+"""Unit tests for the web SuggestionService."""
+
+from dataclasses import dataclass
+import json
+
+from src.tata.dependency import InMemoryDependencyManager
+from src.tata.memory import ArtifactType, InMemoryMemoryManager
+from src.tata.web.suggestions import MODULE_SUGGESTION_TEXT, SuggestionService
+from src.tata.session import ModuleType
+
+
+@dataclass
+class MockArtifact:
+    """Mock artifact for testing purposes."""
+    name: str
+    _artifact_type: ArtifactType
+
+    @property
+    def artifact_type(self) -> ArtifactType:
+        return self._artifact_type
+
+    def to_json(self) -> str:
+        return json.dumps({"name": self.name})
+
+
+class _CountingDependencyManager(InMemoryDependencyManager):
+    """Dependency manager that counts can_execute_batch calls."""
+
+    def __init__(self, memory_manager):
+        super().__init__(memory_manager)
+        self.calls = 0
+        self.checked = []
+
+    def can_execute_batch(self, session_id, modules):
+        self.calls += 1
+        self.checked = list(modules)
+        return super().can_execute_batch(session_id, modules)
+
+
+def _service(**kwargs):
+    """Create a suggestion service over fresh in-memory managers."""
+    memory = InMemoryMemoryManager()
+    deps = _CountingDependencyManager(memory)
+    return SuggestionService(deps, memory, **kwargs), deps, memory
+
+
+class TestSuggestionService:
+    """Tests for SuggestionService."""
+
+    def test_empty_session_id_returns_no_suggestions(self):
+        """get_suggestions should return an empty list for an empty session ID."""
+        service, _, _ = _service()
+
+        assert service.get_suggestions("") == []
+
+    def test_new_session_suggests_only_standalone_modules(self):
+        """Dependent modules should not be suggested before their prerequisites."""
+        service, _, _ = _service()
+
+        suggestions = service.get_suggestions("session-1")
+
+        assert MODULE_SUGGESTION_TEXT[ModuleType.REQUIREMENT_PROFILE] in suggestions
+        assert MODULE_SUGGESTION_TEXT[ModuleType.JOB_AD] not in suggestions
+
+    def test_only_modules_with_suggestion_text_are_checked(self):
+        """Modules that are never suggested should skip the dependency check."""
+        service, deps, _ = _service()
+
+        service.get_suggestions("session-1")
+
+        assert deps.checked == [m for m in ModuleType if m in MODULE_SUGGESTION_TEXT]
+
+    def test_repeat_call_is_served_from_cache(self):
+        """A second call with unchanged artifacts should not re-check dependencies."""
+        service, deps, _ = _service()
+
+        first = service.get_suggestions("session-1")
+        calls = deps.calls
+        second = service.get_suggestions("session-1")
+
+        assert second == first
+        assert deps.calls == calls
+
+    def test_cache_refreshes_when_artifacts_change(self):
+        """Storing an artifact should make newly unlocked modules appear."""
+        service, _, memory = _service()
+        service.get_suggestions("session-1")
+
+        memory.store(
+            "session-1",
+            MockArtifact(name="profile", _artifact_type=ArtifactType.REQUIREMENT_PROFILE),
+        )
+
+        assert MODULE_SUGGESTION_TEXT[ModuleType.JOB_AD] in service.get_suggestions("session-1")
+
+    def test_returned_list_does_not_alter_cache(self):
+        """Mutating a returned list should not affect later results."""
+        service, _, _ = _service()
+
+        service.get_suggestions("session-1").clear()
+
+        assert service.get_suggestions("session-1") != []
+
+    def test_cache_evicts_least_recently_used_session(self):
+        """The cache should hold at most maxsize sessions, dropping the oldest."""
+        service, deps, _ = _service(maxsize=2)
+        service.get_suggestions("session-1")
+        service.get_suggestions("session-2")
+        service.get_suggestions("session-1")
+        service.get_suggestions("session-3")
+        calls = deps.calls
+
+        service.get_suggestions("session-1")
+        assert deps.calls == calls
+        service.get_suggestions("session-2")
+        assert deps.calls == calls + 1
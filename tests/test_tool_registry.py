@@ -68,6 +68,12 @@ class TestInMemoryToolRegistry:
             assert tool.parameters is not None, "Tool must have parameters"
             assert tool.module_type is not None, "Tool must have module_type"
     
+    def test_get_openai_tools_built_once(self):
+        """get_openai_tools should return the same precomputed payload."""
+        registry = InMemoryToolRegistry()
+        
+        assert registry.get_openai_tools() is registry.get_openai_tools()
+    
     def test_get_openai_tools_format(self):
         """get_openai_tools should return valid OpenAI format."""
         registry = InMemoryToolRegistry()
@@ -8,6 +8,7 @@ Tests cover:
 - Requirements 13.1, 13.3, 13.4, 13.5
 """
 
+import json
 import pytest
 from datetime import datetime
 
@@ -20,6 +21,8 @@ from src.tata.validator.validator import (
     validate_must_have_visibility,
     validate_no_banned_words,
     validate_artifact_comprehensive,
+    validate_artifacts_batched,
+    _WordScanner,
 )
 from src.tata.modules.profile.profile import (
     RequirementProfile,
@@ -121,6 +124,20 @@ class TestValidationResult:
         assert not merged.is_valid
         assert len(merged.errors) == 1
         assert len(merged.warnings) == 1
+    
+    def test_extend_merges_in_place(self):
+        """Test that _extend accumulates into the same result."""
+        result = ValidationResult(is_valid=True)
+        other = ValidationResult(
+            is_valid=False,
+            errors=[ValidationError(field="b", message="Error 1")],
+            warnings=[ValidationWarning(field="a", message="Warning 1")],
+        )
+        assert result._extend(other) is result
+        assert not result.is_valid
+        assert len(result.errors) == 1
+        assert len(result.warnings) == 1
+        assert len(other.errors) == 1
 
 
 class TestValidateAgainstProfile:
@@ -157,6 +174,22 @@ class TestValidateAgainstProfile:
         result = validate_against_profile(job_ad, sample_profile)
         assert not result.is_valid
         assert any("Git version control" in e.message for e in result.errors)
+    
+    def test_responsibilities_match_whole_words(self, sample_profile, sample_job_ad):
+        """Test that profile words must appear as whole words, not inside longer ones."""
+        sample_job_ad.responsibilities = ["Developing featured products"]
+        
+        result = validate_against_profile(sample_job_ad, sample_profile)
+        
+        assert any(w.field == "responsibilities" for w in result.warnings)
+    
+    def test_responsibilities_match_ignores_punctuation(self, sample_profile, sample_job_ad):
+        """Test that punctuation around a word does not prevent a match."""
+        sample_job_ad.responsibilities = ["Develop (features), tests and more."]
+        
+        result = validate_against_profile(sample_job_ad, sample_profile)
+        
+        assert not any(w.field == "responsibilities" for w in result.warnings)
 
 
 class TestValidateLanguageCompliance:
@@ -200,6 +233,31 @@ class TestValidateLanguageCompliance:
         """Test that empty text passes validation."""
         result = validate_language_compliance("", SupportedLanguage.ENGLISH)
         assert result.is_valid
+    
+    def test_miscased_globalconnect_warns(self):
+        """Test that GlobalConnect in the wrong case generates a warning."""
+        result = validate_language_compliance(
+            "Join the team at Globalconnect.",
+            SupportedLanguage.ENGLISH,
+        )
+        assert any("GlobalConnect" in w.message for w in result.warnings)
+    
+    def test_correct_globalconnect_passes(self):
+        """Test that correctly written GlobalConnect generates no warning."""
+        result = validate_language_compliance(
+            "Join the team at GlobalConnect.",
+            SupportedLanguage.ENGLISH,
+        )
+        assert not any("GlobalConnect" in w.message for w in result.warnings)
+    
+    def test_repeated_calls_return_independent_results(self):
+        """Test that memoized results are not shared between callers."""
+        text = "Great opportunity! 🚀"
+        first = validate_language_compliance(text, SupportedLanguage.ENGLISH)
+        first.errors.clear()
+        second = validate_language_compliance(text, SupportedLanguage.ENGLISH)
+        assert not second.is_valid
+        assert len(second.errors) == 1
 
 
 class TestValidateMustHaveVisibility:
@@ -243,6 +301,19 @@ class TestValidateMustHaveVisibility:
         assert not result.is_valid
 
 
+class TestWordScanner:
+    """Tests for the single-pass word scanner used by visibility checks."""
+    
+    def test_finds_words_sharing_a_start_position(self):
+        """Test that a shorter word is found inside a longer overlapping word."""
+        scanner = _WordScanner(["data", "database", "python"])
+        assert scanner.find("we tune database servers") == {"data", "database"}
+    
+    def test_empty_scanner_finds_nothing(self):
+        """Test that a scanner without words finds nothing."""
+        assert _WordScanner([]).find("anything") == set()
+
+
 class TestValidateNoBannedWords:
     """Tests for validate_no_banned_words function."""
     
@@ -258,6 +329,26 @@ class TestValidateNoBannedWords:
         """Test that empty text passes."""
         result = validate_no_banned_words("", SupportedLanguage.ENGLISH)
         assert result.is_valid
+    
+    def test_banned_words_reported_in_text_order(self):
+        """Test that every banned word is reported, ordered by position."""
+        result = validate_no_banned_words(
+            "Join our Rockstar team for an exciting opportunity.",
+            SupportedLanguage.ENGLISH,
+        )
+        assert not result.is_valid
+        assert len(result.errors) == 2
+        assert "'rockstar'" in result.errors[0].message
+        assert "'exciting opportunity'" in result.errors[1].message
+    
+    def test_banned_word_inside_longer_word_is_flagged(self):
+        """Test that banned words are still matched as substrings."""
+        result = validate_no_banned_words(
+            "Our rockstars ship every week.",
+            SupportedLanguage.ENGLISH,
+        )
+        assert not result.is_valid
+        assert "'rockstar'" in result.errors[0].message
 
 
 class TestValidateArtifactComprehensive:
@@ -307,3 +398,97 @@ class TestValidateArtifactComprehensive:
         )
         assert not result.is_valid
         assert any("emoji" in e.message.lower() for e in result.errors)
+    
+    def test_repeated_validation_returns_independent_results(
+        self, sample_profile, sample_job_ad
+    ):
+        """Test that cached comprehensive results are not shared between callers."""
+        first = validate_artifact_comprehensive(
+            sample_job_ad,
+            profile=sample_profile,
+            language=SupportedLanguage.ENGLISH,
+        )
+        first.warnings.append(ValidationWarning(field="x", message="Added"))
+        second = validate_artifact_comprehensive(
+            sample_job_ad,
+            profile=sample_profile,
+            language=SupportedLanguage.ENGLISH,
+        )
+        assert second.is_valid == first.is_valid
+        assert len(second.warnings) == len(first.warnings) - 1
+
+
+class TestValidateArtifactsBatched:
+    """Tests for validate_artifacts_batched function."""
+    
+    def test_results_in_input_order(self, sample_profile, sample_job_ad):
+        """Test that results are returned in the order of the artifacts."""
+        emoji_ad = JobAd(
+            headline="Software Engineer 🚀",
+            intro="Join us!",
+            role_description="Develop.",
+            the_why="Important.",
+            responsibilities=["Develop"],
+            requirements=RequirementsSection(
+                must_haves=sample_profile.must_have_skills,
+                soft_skills="",
+                good_to_haves="",
+            ),
+            soft_skills_paragraph="",
+            team_and_why_gc="",
+            process="",
+            ending="",
+        )
+        results = validate_artifacts_batched(
+            [sample_job_ad, emoji_ad, sample_job_ad],
+            profile=sample_profile,
+            batch_size=2,
+            workers=2,
+        )
+        assert [r.is_valid for r in results] == [True, False, True]
+    
+    def test_results_streamed_to_jsonl(self, sample_job_ad, tmp_path):
+        """Test that each result is appended as a JSON line."""
+        path = tmp_path / "results.jsonl"
+        validate_artifacts_batched([sample_job_ad, sample_job_ad], results_path=path)
+        
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert sorted(r["index"] for r in records) == [0, 1]
+        assert all(r["artifact_type"] == "job_ad" for r in records)
+    
+    def test_transient_failure_retried(self, sample_job_ad):
+        """Test that an artifact failing once is retried and validated."""
+        class FlakyArtifact:
+            def __init__(self, artifact):
+                self._artifact = artifact
+                self.calls = 0
+            
+            @property
+            def artifact_type(self):
+                return self._artifact.artifact_type
+            
+            def to_json(self):
+                self.calls += 1
+                if self.calls == 1:
+                    raise OSError("temporarily unavailable")
+                return self._artifact.to_json()
+            
+            def to_text(self):
+                return self._artifact.to_text()
+        
+        flaky = FlakyArtifact(sample_job_ad)
+        results = validate_artifacts_batched([flaky])
+        assert results[0] is not None
+        assert flaky.calls == 2
+    
+    def test_persistent_failure_returns_none(self, sample_job_ad):
+        """Test that an artifact failing every attempt yields None."""
+        class BrokenArtifact:
+            artifact_type = sample_job_ad.artifact_type
+            
+            def to_json(self):
+                raise OSError("unavailable")
+        
+        results = validate_artifacts_batched([BrokenArtifact(), sample_job_ad])
+        assert results[0] is None
+        assert results[1] is not None
@@ -0,0 +1,548 @@
+"""Tests for the Tata web server.
+
+Tests cover:
+- Serving the chat page with compression and conditional requests
+- Long-lived caching of content-hashed static assets
+- Session API endpoints
+- Chat endpoint and agent setup
+"""
+
+import asyncio
+import json
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.tata.agent.client import MockOpenAIClient
+from src.tata.agent.models import ChatCompletionResponse
+from src.tata.memory.memory import InMemoryMemoryManager
+from src.tata.session.session import InMemorySessionManager
+from src.tata.web.server import (
+    ChatServer,
+    PortInUseError,
+    IMMUTABLE_CACHE_CONTROL,
+    INDEX_HTML_PATH,
+    _ASSET_FILES,
+    _built_asset,
+    _close_when_done,
+    _versioned_html,
+    bind_server_socket,
+    check_port_available,
+)
+
+
+@pytest.fixture
+def index_html():
+    """Render the chat page markup with versioned asset links."""
+    return _versioned_html(INDEX_HTML_PATH.read_text(encoding="utf-8"))
+
+
+@pytest.fixture
+def mock_client():
+    """Create a mock OpenAI client shared by the server's agents."""
+    return MockOpenAIClient()
+
+
+@pytest.fixture
+def server(mock_client):
+    """Create a chat server backed by in-memory managers."""
+    return ChatServer(
+        session_manager=InMemorySessionManager(),
+        memory_manager=InMemoryMemoryManager(),
+        openai_client=mock_client,
+    )
+
+
+@pytest.fixture
+def client(server):
+    """Create a test client for the server's app."""
+    return TestClient(server.app)
+
+
+class TestChatPage:
+    """Tests for serving the chat page."""
+    
+    def test_serves_gzip_when_accepted(self, client, index_html):
+        """Test that the page is sent pre-compressed to gzip clients."""
+        response = client.get("/", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["content-type"].startswith("text/html")
+        assert response.text == index_html
+    
+    def test_serves_identity_without_gzip(self, client, index_html):
+        """Test that the page is sent uncompressed to other clients."""
+        response = client.get("/", headers={"Accept-Encoding": "identity"})
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert response.text == index_html
+    
+    def test_matching_etag_returns_not_modified(self, client):
+        """Test that a revalidation with the current ETag returns 304."""
+        etag = client.get("/").headers["etag"]
+        response = client.get("/", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+    
+    def test_stale_etag_returns_page(self, client):
+        """Test that a revalidation with an old ETag returns the page."""
+        response = client.get("/", headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+    
+    def test_page_available_under_static(self, client):
+        """Test that the static directory is mounted."""
+        response = client.get("/static/index.html")
+        assert response.status_code == 200
+        assert response.text == INDEX_HTML_PATH.read_text(encoding="utf-8")
+    
+    def test_page_links_versioned_assets(self, index_html):
+        """Test that asset links carry a content hash."""
+        assert f'"/static/{_ASSET_FILES["styles.css"]}?v=' in index_html
+        assert f'"/static/{_ASSET_FILES["app.js"]}?v=' in index_html
+
+
+class TestStaticAssets:
+    """Tests for caching of static assets."""
+    
+    @pytest.mark.parametrize("name", ["styles.css", "app.js"])
+    def test_versioned_asset_is_immutable(self, client, index_html, name):
+        """Test that the URL linked from the page is cached for a year."""
+        start = index_html.index(f"/static/{_ASSET_FILES[name]}?v=")
+        url = index_html[start:index_html.index('"', start)]
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    
+    def test_unversioned_asset_not_immutable(self, client):
+        """Test that plain asset URLs keep default caching."""
+        response = client.get("/static/app.js")
+        assert response.status_code == 200
+        assert "cache-control" not in response.headers
+    
+    def test_stale_version_not_immutable(self, client):
+        """Test that an outdated hash is not cached forever."""
+        response = client.get("/static/app.js?v=stale")
+        assert response.status_code == 200
+        assert "cache-control" not in response.headers
+    
+    def test_assets_compressed_for_gzip_clients(self, client):
+        """Test that scripts are sent gzip-compressed when accepted."""
+        response = client.get("/static/app.js", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+    
+    def test_minified_build_preferred(self, tmp_path):
+        """Test that a minified build is served when present."""
+        (tmp_path / "app.js").write_text("// source")
+        assert _built_asset(tmp_path, "app.js") == "app.js"
+        
+        (tmp_path / "app.min.js").write_text("")
+        assert _built_asset(tmp_path, "app.js") == "app.min.js"
+
+
+class TestSessionApi:
+    """Tests for the session endpoints."""
+    
+    def test_create_and_get_session(self, client):
+        """Test that a created session can be fetched by ID."""
+        created = client.post(
+            "/api/sessions",
+            json={"recruiter_id": "r1", "position_name": "Engineer", "language": "sv"},
+        )
+        assert created.status_code == 201
+        body = created.json()
+        assert body["position_name"] == "Engineer"
+        assert body["language"] == "sv"
+        
+        fetched = client.get(f"/api/sessions/{body['id']}")
+        assert fetched.status_code == 200
+        assert fetched.json() == body
+    
+    def test_create_session_unknown_language_defaults_to_english(self, client):
+        """Test that an unsupported language code leaves the session in English."""
+        created = client.post(
+            "/api/sessions",
+            json={"recruiter_id": "r1", "position_name": "Engineer", "language": "fr"},
+        )
+        assert created.status_code == 201
+        assert created.json()["language"] == "en"
+    
+    def test_list_sessions_for_recruiter(self, client):
+        """Test that sessions are listed per recruiter."""
+        client.post("/api/sessions", json={"recruiter_id": "r1", "position_name": "A"})
+        client.post("/api/sessions", json={"recruiter_id": "r2", "position_name": "B"})
+        response = client.get("/api/sessions", params={"recruiter_id": "r1"})
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+    
+    def test_unchanged_session_list_returns_304(self, client):
+        """Test that revalidating an unchanged list returns 304."""
+        _create_session(client)
+        first = client.get("/api/sessions", params={"recruiter_id": "r1"})
+        etag = first.headers["etag"]
+        
+        second = client.get(
+            "/api/sessions",
+            params={"recruiter_id": "r1"},
+            headers={"If-None-Match": etag},
+        )
+        
+        assert first.headers["cache-control"] == "no-cache"
+        assert second.status_code == 304
+        assert second.content == b""
+    
+    def test_session_list_etag_changes_with_sessions(self, client):
+        """Test that a new session invalidates the list's ETag."""
+        _create_session(client)
+        etag = client.get("/api/sessions", params={"recruiter_id": "r1"}).headers["etag"]
+        _create_session(client)
+        
+        response = client.get(
+            "/api/sessions",
+            params={"recruiter_id": "r1"},
+            headers={"If-None-Match": etag},
+        )
+        
+        assert response.status_code == 200
+        assert len(response.json()) == 2
+    
+    def test_last_activity_is_iso_timestamp(self, server, client):
+        """Test that last_activity is sent in the session's ISO format."""
+        session_id = _create_session(client)
+        session = server.session_manager.get_session(session_id)
+        
+        response = client.get(f"/api/sessions/{session_id}")
+        
+        assert response.json()["last_activity"] == session.last_activity.isoformat()
+    
+    def test_empty_recruiter_rejected(self, client):
+        """Test that an empty recruiter ID returns 400."""
+        response = client.post(
+            "/api/sessions", json={"recruiter_id": "", "position_name": "A"}
+        )
+        assert response.status_code == 400
+    
+    def test_unknown_session_not_found(self, client):
+        """Test that unknown sessions return 404."""
+        assert client.get("/api/sessions/missing").status_code == 404
+        assert client.get("/api/suggestions/missing").status_code == 404
+
+
+def _create_session(client, recruiter_id="r1"):
+    """Create a session through the API and return its ID."""
+    response = client.post(
+        "/api/sessions", json={"recruiter_id": recruiter_id, "position_name": "Engineer"}
+    )
+    return response.json()["id"]
+
+
+class TestChat:
+    """Tests for the chat endpoint."""
+    
+    def test_chat_returns_agent_response(self, client, mock_client):
+        """Test that the agent's reply is returned with suggestions."""
+        mock_client.add_response(
+            ChatCompletionResponse(content="Hello!", tool_calls=None, finish_reason="stop")
+        )
+        session_id = _create_session(client)
+        
+        response = client.post("/api/chat", json={"session_id": session_id, "message": "Hi"})
+        
+        assert response.status_code == 200
+        assert response.json()["response"] == "Hello!"
+        assert response.json()["suggestions"]
+    
+    def test_chat_runs_agent_off_event_loop(self, client, mock_client):
+        """Test that the blocking agent call does not run on the event loop."""
+        on_loop = []
+        chat_completion = mock_client.chat_completion
+        
+        def recording_chat_completion(*args, **kwargs):
+            try:
+                asyncio.get_running_loop()
+                on_loop.append(True)
+            except RuntimeError:
+                on_loop.append(False)
+            return chat_completion(*args, **kwargs)
+        
+        mock_client.chat_completion = recording_chat_completion
+        mock_client.add_response(
+            ChatCompletionResponse(content="Hello!", tool_calls=None, finish_reason="stop")
+        )
+        session_id = _create_session(client)
+        
+        response = client.post("/api/chat", json={"session_id": session_id, "message": "Hi"})
+        
+        assert response.json()["response"] == "Hello!"
+        assert on_loop == [False]
+    
+    def test_chat_turns_for_a_session_do_not_overlap(self, client, mock_client):
+        """Test that concurrent messages to one session run one at a time."""
+        lock = threading.Lock()
+        in_flight = peak = 0
+        chat_completion = mock_client.chat_completion
+        
+        def slow_chat_completion(*args, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return chat_completion(*args, **kwargs)
+        
+        mock_client.chat_completion = slow_chat_completion
+        session_id = _create_session(client)
+        
+        def send(message):
+            return client.post("/api/chat", json={"session_id": session_id, "message": message})
+        
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            responses = list(pool.map(send, ["a", "b", "c"]))
+        
+        assert all(r.json()["response"] == "Mock response" for r in responses)
+        assert peak == 1
+        messages, _ = mock_client.get_call_history()[-1]
+        assert [m.role.value for m in messages[1:]] == ["user", "assistant"] * 2 + ["user"]
+    
+    def test_chat_unknown_session_not_found(self, client):
+        """Test that chatting in an unknown session returns 404."""
+        response = client.post("/api/chat", json={"session_id": "missing", "message": "Hi"})
+        assert response.status_code == 404
+    
+    def test_chat_stream_sends_deltas_then_done(self, client, mock_client):
+        """Test that the stream carries the reply and then suggestions."""
+        mock_client.add_response(
+            ChatCompletionResponse(content="Hello!", tool_calls=None, finish_reason="stop")
+        )
+        session_id = _create_session(client)
+        
+        response = client.post(
+            "/api/chat/stream", json={"session_id": session_id, "message": "Hi"}
+        )
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [
+            json.loads(line.removeprefix("data: "))
+            for line in response.text.split("\n\n") if line
+        ]
+        assert "".join(e["delta"] for e in events if "delta" in e) == "Hello!"
+        assert events[-1]["done"] is True
+        assert events[-1]["suggestions"]
+    
+    def test_chat_stream_turns_for_a_session_do_not_overlap(self, client, mock_client):
+        """Test that concurrent streams for one session run one at a time."""
+        lock = threading.Lock()
+        in_flight = peak = 0
+        chat_completion_stream = mock_client.chat_completion_stream
+        
+        def slow_chat_completion_stream(*args, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            yield from chat_completion_stream(*args, **kwargs)
+            with lock:
+                in_flight -= 1
+        
+        mock_client.chat_completion_stream = slow_chat_completion_stream
+        session_id = _create_session(client)
+        
+        def send(message):
+            return client.post(
+                "/api/chat/stream", json={"session_id": session_id, "message": message}
+            )
+        
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            responses = list(pool.map(send, ["a", "b", "c"]))
+        
+        assert all('"done": true' in r.text for r in responses)
+        assert peak == 1
+    
+    def test_abandoned_stream_is_closed(self):
+        """Test that the event generator is closed when reading stops early."""
+        closed = []
+        
+        def events():
+            try:
+                yield "first"
+                yield "second"
+            finally:
+                closed.append(True)
+        
+        async def read_first():
+            stream = _close_when_done(events())
+            first = await stream.__anext__()
+            await stream.aclose()
+            return first
+        
+        assert asyncio.run(read_first()) == "first"
+        assert closed == [True]
+    
+    def test_chat_stream_unknown_session_not_found(self, client):
+        """Test that streaming in an unknown session returns 404."""
+        response = client.post(
+            "/api/chat/stream", json={"session_id": "missing", "message": "Hi"}
+        )
+        assert response.status_code == 404
+    
+    def test_agents_share_openai_client(self, server, client, mock_client):
+        """Test that agents for different sessions reuse one client."""
+        first = server.get_or_create_agent(_create_session(client, "r1"))
+        second = server.get_or_create_agent(_create_session(client, "r2"))
+        
+        assert first is not second
+        assert first._client is mock_client
+        assert second._client is mock_client
+    
+    def test_agents_share_tool_registry(self, server, client):
+        """Test that agents reuse the server's tool registry."""
+        first = server.get_or_create_agent(_create_session(client, "r1"))
+        second = server.get_or_create_agent(_create_session(client, "r2"))
+        
+        assert first._registry is server.tool_registry
+        assert second._registry is server.tool_registry
+        assert first._executor is not second._executor
+    
+    def test_agent_is_reused_for_session(self, server, client):
+        """Test that repeat lookups for a session return the cached agent."""
+        session_id = _create_session(client)
+        
+        assert server.get_or_create_agent(session_id) is server.get_or_create_agent(session_id)
+    
+    def test_least_recently_used_agent_is_evicted(self, mock_client):
+        """Test that the agent cache drops the least recently used session."""
+        server = ChatServer(
+            session_manager=InMemorySessionManager(),
+            memory_manager=InMemoryMemoryManager(),
+            openai_client=mock_client,
+            max_agents=2,
+        )
+        client = TestClient(server.app)
+        first, second, third = (_create_session(client, f"r{i}") for i in range(3))
+        
+        server.get_or_create_agent(first)
+        server.get_or_create_agent(second)
+        server.get_or_create_agent(first)
+        server.get_or_create_agent(third)
+        
+        assert list(server.agents) == [first, third]
+
+
+class TestServerSetup:
+    """Tests for ChatServer construction options."""
+    
+    def test_no_cors_headers_by_default(self, client):
+        """Test that cross-origin requests are not granted by default."""
+        response = client.get("/api/sessions/missing", headers={"Origin": "http://evil.example"})
+        assert "access-control-allow-origin" not in response.headers
+    
+    def test_configured_cors_origin_allowed(self):
+        """Test that listed origins receive CORS headers."""
+        server = ChatServer(
+            session_manager=InMemorySessionManager(),
+            memory_manager=InMemoryMemoryManager(),
+            cors_origins=["http://localhost:3000"],
+        )
+        response = TestClient(server.app).get(
+            "/api/sessions/missing", headers={"Origin": "http://localhost:3000"}
+        )
+        assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+    
+    def test_ephemeral_memory_uses_in_memory_manager(self, tmp_path, monkeypatch):
+        """Test that ephemeral memory keeps artifacts out of SQLite."""
+        monkeypatch.chdir(tmp_path)
+        server = ChatServer(
+            session_manager=InMemorySessionManager(),
+            ephemeral_memory=True,
+        )
+        assert isinstance(server.memory_manager, InMemoryMemoryManager)
+        assert not (tmp_path / "tata.db").exists()
+    
+    def test_default_persistence_restores_evicted_conversation(
+        self, tmp_path, monkeypatch, mock_client
+    ):
+        """Test that an evicted session's agent comes back with its history."""
+        monkeypatch.chdir(tmp_path)
+        server = ChatServer(
+            session_manager=InMemorySessionManager(),
+            openai_client=mock_client,
+        )
+        client = TestClient(server.app)
+        session_id = _create_session(client)
+        client.post("/api/chat", json={"session_id": session_id, "message": "Hello"})
+        
+        server.agents.clear()
+        client.post("/api/chat", json={"session_id": session_id, "message": "Again"})
+        
+        messages, _ = mock_client.get_call_history()[-1]
+        assert [m.content for m in messages[1:]] == ["Hello", "Mock response", "Again"]
+
+
+    def test_conversations_stored_in_configured_database(
+        self, tmp_path, monkeypatch, mock_client
+    ):
+        """Test that conversations go to the server's database path."""
+        monkeypatch.chdir(tmp_path)
+        db_path = tmp_path / "custom.db"
+        server = ChatServer(
+            session_manager=InMemorySessionManager(),
+            openai_client=mock_client,
+            db_path=db_path,
+        )
+        client = TestClient(server.app)
+        session_id = _create_session(client)
+        client.post("/api/chat", json={"session_id": session_id, "message": "Hello"})
+        
+        agent = server.get_or_create_agent(session_id)
+        assert agent._conversation._db_path == db_path
+        assert not (tmp_path / "tata.db").exists()
+
+
+class TestPortCheck:
+    """Tests for the start-up port check."""
+    
+    def test_port_in_use_raises(self):
+        """Test that a bound port is reported as in use."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(("127.0.0.1", 0))
+            sock.listen()
+            port = sock.getsockname()[1]
+            
+            with pytest.raises(PortInUseError):
+                check_port_available(port)
+    
+    def test_free_port_passes(self):
+        """Test that a free port passes the check."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        
+        check_port_available(port)
+    
+    def test_bind_server_socket_listens(self):
+        """Test that the server socket is bound and accepting connections."""
+        sock = bind_server_socket(0)
+        try:
+            port = sock.getsockname()[1]
+            with socket.create_connection(("127.0.0.1", port), timeout=1):
+                pass
+        finally:
+            sock.close()
+    
+    def test_bind_server_socket_port_in_use_raises(self):
+        """Test that binding a port another socket listens on is reported."""
+        sock = bind_server_socket(0)
+        try:
+            with pytest.raises(PortInUseError) as excinfo:
+                bind_server_socket(sock.getsockname()[1])
+            assert isinstance(excinfo.value.__cause__, OSError)
+        finally:
+            sock.close()